@@ -10,48 +10,65 @@ from silverfund.records import Alpha, Score
 class AlphaConstructor(Protocol):
     """Protocol for functions that construct Alpha values from Score objects."""
 
-    def __call__(self, score: Score) -> Alpha: ...
+    def __call__(self, score: Score | pl.LazyFrame) -> Alpha | pl.LazyFrame: ...
 
 
-def grindold_kahn(scores: Score, interval: Interval, ic: float = 0.05) -> Alpha:
+def grindold_kahn(scores: Score | pl.LazyFrame, interval: Interval, ic: float = 0.05) -> Alpha | pl.LazyFrame:
     """Computes alpha values using the Grindold-Kahn methodology.
 
     This method adjusts scores using the total risk data from Barra and
     an information coefficient (IC) to compute alpha estimates.
 
     Args:
-        scores (Score): A Polars DataFrame containing score data with 'date' and 'barrid' columns.
+        scores (Score | pl.LazyFrame): A Polars DataFrame containing score data with 'date' and 'barrid' columns.
         interval (Interval): The time interval for loading total risk data.
         ic (float, optional): The information coefficient (default is 0.05).
 
     Returns:
-        Alpha: A Polars DataFrame with computed alpha values, containing 'date', 'barrid', and 'alpha' columns.
+        Alpha | pl.LazyFrame: A Polars DataFrame with computed alpha values, containing 'date', 'barrid', and 'alpha'
+            columns, or an uncollected query plan if `scores` is lazy.
     """
 
-    start_date = scores["date"].min()
-    end_date = scores["date"].max()
+    # Only the date column is selected, so a lazy upstream plan skips computing the scores here
+    date_range = scores.lazy().select(pl.col("date").min().alias("start_date"), pl.col("date").max().alias("end_date"))
+    start_date, end_date = date_range.collect().row(0)
 
-    vols = dal.load_total_risk(interval, start_date, end_date)
+    vols = dal.load_total_risk(interval, start_date, end_date).lazy().select(["date", "barrid", "spec_risk"])
 
-    return Alpha(
-        scores.join(other=vols, on=["date", "barrid"], how="left")
+    # Match the barrid type of the scores (integer ids when the scores are encoded)
+    barrid_dtype = scores.lazy().collect_schema()["barrid"]
+    vols = vols.with_columns(pl.col("barrid").cast(barrid_dtype, strict=False)).drop_nulls("barrid")
+
+    alphas = (
+        scores.lazy()
+        .join(other=vols, on=["date", "barrid"], how="left")
         .with_columns(((ic * pl.col("spec_risk") * pl.col("score")).alias("alpha")))
         .fill_null(0)
         .select(["date", "barrid", "alpha"])
-        .sort(["barrid", "date"])
     )
 
+    if isinstance(scores, pl.LazyFrame):
+        return Alpha.validate_lazy(alphas)
+
+    return Alpha(alphas)
+
 
-def static_alpha(scores: Score, value: float) -> Alpha:
+def static_alpha(scores: Score | pl.LazyFrame, value: float) -> Alpha | pl.LazyFrame:
     """Assigns a constant alpha value to all records in the score data.
 
     This method replaces the 'score' column with a fixed alpha value.
 
     Args:
-        scores (Score): A Polars DataFrame containing score data.
+        scores (Score | pl.LazyFrame): A Polars DataFrame containing score data.
         value (float): The fixed alpha value to be assigned.
 
     Returns:
-        Alpha: A Polars DataFrame with 'date', 'barrid', and a constant 'alpha' column.
+        Alpha | pl.LazyFrame: A Polars DataFrame with 'date', 'barrid', and a constant 'alpha' column,
+            or an uncollected query plan if `scores` is lazy.
     """
-    return Alpha(scores.with_columns(pl.lit(value).cast(pl.Float64).alias("alpha")).drop("score"))
+    alphas = scores.lazy().with_columns(pl.lit(value).cast(pl.Float64).alias("alpha")).drop("score")
+
+    if isinstance(scores, pl.LazyFrame):
+        return Alpha.validate_lazy(alphas)
+
+    return Alpha(alphas)
@@ -0,0 +1,90 @@
+import numpy as np
+import polars as pl
+
+
+class AssetIndex:
+    """
+    Maps the barrids of one period to positions in the arrays of an optimization problem.
+
+    Position `i` of every alpha vector, covariance matrix, and constraint coefficient vector built
+    from the index belongs to `barrids[i]`. Data keyed by barrid is placed by position with NumPy
+    fancy indexing, so inputs can arrive in any order and with missing or extra assets.
+
+    Attributes:
+        _barrids (pl.Series): The barrid at each position.
+    """
+
+    def __init__(self, barrids: list[str] | pl.Series) -> None:
+        """
+        Initializes an AssetIndex instance.
+
+        Args:
+            barrids (list[str] | pl.Series): The barrid at each position. Must be unique.
+
+        Raises:
+            ValueError: If a barrid appears more than once.
+        """
+        self._barrids = pl.Series("barrid", barrids).cast(pl.String)
+
+        if self._barrids.n_unique() != len(self._barrids):
+            raise ValueError("Barrids in an AssetIndex must be unique")
+
+    def __len__(self) -> int:
+        return len(self._barrids)
+
+    @property
+    def barrids(self) -> list[str]:
+        """The barrid at each position."""
+        return self._barrids.to_list()
+
+    def positions(self, barrids: list[str] | pl.Series) -> np.ndarray:
+        """
+        Looks up the position of each barrid.
+
+        Args:
+            barrids (list[str] | pl.Series): The barrids to look up.
+
+        Returns:
+            np.ndarray: The position of each barrid, or -1 for barrids not in the index.
+        """
+        return (
+            pl.Series("barrid", barrids)
+            .cast(pl.String)
+            .replace_strict(self._barrids, np.arange(len(self._barrids)), default=-1, return_dtype=pl.Int64)
+            .to_numpy()
+        )
+
+    def gather(self, barrids: list[str] | pl.Series, values: np.ndarray, fill_value: float = 0.0) -> np.ndarray:
+        """
+        Places values keyed by barrid into a vector aligned with the index.
+
+        Args:
+            barrids (list[str] | pl.Series): The barrid of each value.
+            values (np.ndarray): The values, along the first axis.
+            fill_value (float, optional): The value for positions without data. Defaults to 0.
+
+        Returns:
+            np.ndarray: An array whose first axis has one entry per position in the index.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        positions = self.positions(barrids)
+        found = positions >= 0
+
+        aligned = np.full((len(self),) + values.shape[1:], fill_value)
+        aligned[positions[found]] = values[found]
+
+        return aligned
+
+    def gather_column(self, df: pl.DataFrame, column: str, fill_value: float = 0.0) -> np.ndarray:
+        """
+        Places a column of a DataFrame with a 'barrid' column into a vector aligned with the index.
+
+        Args:
+            df (pl.DataFrame): The data, with one row per barrid.
+            column (str): The column to gather.
+            fill_value (float, optional): The value for positions without data. Defaults to 0.
+
+        Returns:
+            np.ndarray: The column values, one per position in the index.
+        """
+        return self.gather(df["barrid"], df[column].to_numpy(), fill_value)
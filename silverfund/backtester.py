@@ -1,5 +1,8 @@
 import os
+import tempfile
 from datetime import date
+from itertools import zip_longest
+from typing import Callable
 
 import polars as pl
 import ray
@@ -7,10 +10,15 @@ from ray.experimental import tqdm_ray
 from tqdm import tqdm
 
 import silverfund.data_access_layer as dal
+from silverfund.checkpoints import CheckpointStore, period_keys
 from silverfund.enums import Interval
 from silverfund.logging.slack import SlackLogConfig, send_message_to_slack
+from silverfund.portfolios import is_panel_constructor
 from silverfund.records import Alpha, AssetReturns, Portfolio
+from silverfund.signals import is_lazy_constructor
+from silverfund.stage_cache import StageCache, stage_keys
 from silverfund.strategies import Strategy
+from silverfund.streaming import ParquetSink, collect_streaming, stream_to_sink
 
 
 class Backtester:
@@ -23,6 +31,8 @@ class Backtester:
         _start_date (date): The start date of the backtest.
         _end_date (date): The end date of the backtest.
         _data (pl.DataFrame): The data to be used for the backtest, in the form of a Polars DataFrame.
+        _data_version (str | None): An identifier of the input data version, used in checkpoint and cache keys.
+        _stage_cache (StageCache | None): The cache of signal, score, and alpha outputs, if enabled.
     """
 
     def __init__(
@@ -32,6 +42,8 @@ class Backtester:
         end_date: date,
         data: pl.DataFrame,
         slack_log_config: SlackLogConfig | None = None,
+        data_version: str | None = None,
+        stage_cache_dir: str | None = None,
     ):
         """
         Initializes a Backtester instance.
@@ -41,63 +53,167 @@ class Backtester:
             start_date (date): The start date of the backtest.
             end_date (date): The end date of the backtest.
             data (pl.DataFrame): The data for the backtest.
+            slack_log_config (SlackLogConfig, optional): Configuration for Slack job notifications.
+            data_version (str, optional): An identifier of the input data version (e.g. the Barra
+                delivery date). Checkpoints and cached stages written under a different version are not reused.
+            stage_cache_dir (str, optional): A directory in which signal, score, and alpha outputs are cached.
+                Stages whose constructor, arguments, and input data are unchanged are loaded instead of recomputed.
         """
         self._interval = interval
         self._start_date = start_date
         self._end_date = end_date
         self._data = data
         self._slack_log_config = slack_log_config
+        self._data_version = data_version
+        self._stage_cache = StageCache(stage_cache_dir) if stage_cache_dir is not None else None
 
-    def _compute_alphas(self, strategy: Strategy) -> Alpha:
+    def _compute_alphas(self, strategy: Strategy, data: pl.DataFrame | None = None) -> Alpha:
         """
         Computes the alphas for a given strategy based on signals and scores.
 
+        Signal constructors marked with `lazy_constructor` are given the data as a LazyFrame. Stages that
+        support lazy inputs then extend a single query plan, which is collected once with the streaming
+        engine; stages that do not simply collect their own output. Other signal constructors are given
+        the DataFrame. When a stage cache is configured, each stage is loaded from the cache instead, and
+        only the missing stages are computed.
+
         Args:
             strategy (Strategy): The strategy object used to generate signals, scores, and alphas.
+            data (pl.DataFrame, optional): The data to compute alphas from. Defaults to the backtest data.
 
         Returns:
             Alpha: A record containing the computed alpha values.
         """
+        data = self._data if data is None else data
+
+        # Load cached stages
+        if self._stage_cache is not None:
+            return self._load_alphas(strategy, data)
+
         # Calculate signals, scores, and alphas
-        signals = strategy.signal_constructor(self._data)
+        signals = strategy.signal_constructor(self._signal_input(strategy, data))
         scores = strategy.score_constructor(signals)
         alphas = strategy.alpha_constructor(scores)
 
-        return Alpha(alphas)
+        # Execute the fused plan
+        if isinstance(alphas, pl.LazyFrame):
+            alphas = collect_streaming(alphas)
+
+        return Alpha(dal.decode_barrids(alphas))
+
+    @staticmethod
+    def _signal_input(strategy: Strategy, data: pl.DataFrame) -> pl.DataFrame | pl.LazyFrame:
+        """The data as passed to the strategy's signal constructor: lazy only if the constructor accepts it."""
+        return data.lazy() if is_lazy_constructor(strategy.signal_constructor) else data
+
+    @staticmethod
+    def _cached_input(cached: pl.LazyFrame, constructor: Callable) -> pl.DataFrame | pl.LazyFrame:
+        """A cached stage output as passed to the next stage's constructor: lazy only if the constructor accepts it."""
+        return cached if is_lazy_constructor(constructor) else collect_streaming(cached)
 
-    def _compute_forward_returns(self, portfolios: list[Portfolio]) -> AssetReturns:
+    def _load_alphas(self, strategy: Strategy, data: pl.DataFrame) -> Alpha:
+        """
+        Loads the alphas for a given strategy from the stage cache, computing any missing stages.
+
+        Earlier stages are only loaded (or computed) when a later stage is missing. A cached stage is
+        passed on as a scan only to constructors marked with `lazy_constructor`; all others are given
+        the collected DataFrame, whether the stage was just computed or read from an earlier run.
+
+        Args:
+            strategy (Strategy): The strategy object used to generate signals, scores, and alphas.
+            data (pl.DataFrame): The data to compute alphas from.
+
+        Returns:
+            Alpha: A record containing the computed alpha values.
+        """
+        cache = self._stage_cache
+        keys = stage_keys(strategy, data, self._data_version)
+
+        def signals() -> pl.DataFrame | pl.LazyFrame:
+            signals_ = cache.get_or_compute("signal", keys["signal"], lambda: strategy.signal_constructor(self._signal_input(strategy, data)))
+            return self._cached_input(signals_, strategy.score_constructor)
+
+        def scores() -> pl.DataFrame | pl.LazyFrame:
+            scores_ = cache.get_or_compute("score", keys["score"], lambda: strategy.score_constructor(signals()))
+            return self._cached_input(scores_, strategy.alpha_constructor)
+
+        alphas = cache.get_or_compute("alpha", keys["alpha"], lambda: strategy.alpha_constructor(scores()))
+
+        return Alpha(dal.decode_barrids(alphas))
+
+    def _compute_forward_returns(self, portfolios: list[Portfolio], data: pl.DataFrame | None = None) -> AssetReturns:
         """
         Computes forward returns for a list of portfolios.
 
         Args:
             portfolios (list[Portfolio]): A list of portfolios to compute forward returns for.
+            data (pl.DataFrame, optional): The data to take returns from. Defaults to the backtest data.
 
         Returns:
             AssetReturns: A record containing the computed asset returns.
         """
+        data = self._data if data is None else data
+
         # Getting forward returns
-        testing_data = (
-            self._data.with_columns(pl.col("ret").shift(-1).over("barrid").alias("fwd_ret"))
-            .select(["date", "barrid", "fwd_ret"])
-            .sort(["barrid", "date"])
-        )
+        testing_data = data.with_columns(pl.col("ret").shift(-1).over("barrid").alias("fwd_ret")).select(["date", "barrid", "fwd_ret"])
 
-        # Concatenate portfolios
-        portfolios = pl.concat(portfolios)
+        # Concatenate portfolios (on the data's barrid type, so encoded data joins on integer ids)
+        portfolios = pl.concat(portfolios).with_columns(pl.col("barrid").cast(data.schema["barrid"]))
 
         # Join forward returns on portfolios
         asset_returns = portfolios.join(testing_data, on=["barrid", "date"], how="left")
-        asset_returns = asset_returns.sort(["barrid", "date"])
 
-        return AssetReturns(asset_returns)
+        return AssetReturns(dal.decode_barrids(asset_returns))
 
-    def run_sequential(self, strategy: Strategy) -> AssetReturns:
+    def _resume(
+        self,
+        strategy: Strategy,
+        universe: pl.DataFrame,
+        alphas: Alpha,
+        periods: list[date],
+        checkpoint_dir: str | None,
+    ) -> tuple[list[Portfolio], list[date], Callable[[date, pl.DataFrame], None] | None]:
+        """
+        Splits the periods into checkpointed portfolios and periods that still need to run.
+
+        Args:
+            strategy (Strategy): The strategy being backtested.
+            universe (pl.DataFrame): The universe of assets for all periods.
+            alphas (Alpha): The alphas for all periods.
+            periods (list[date]): All periods of the backtest.
+            checkpoint_dir (str | None): The run directory holding checkpoints, or None to disable checkpointing.
+
+        Returns:
+            tuple: The checkpointed portfolios, the remaining periods, and a callback that
+                checkpoints a newly constructed portfolio (None when checkpointing is disabled).
+        """
+        if checkpoint_dir is None:
+            return [], periods, None
+
+        checkpoints = CheckpointStore(checkpoint_dir)
+        keys = period_keys(strategy, universe, alphas, periods, self._data_version)
+
+        completed, remaining = [], []
+        for period in periods:
+            if checkpoints.contains(period, keys[period]):
+                completed.append(checkpoints.load(period, keys[period]))
+            else:
+                remaining.append(period)
+
+        def save(period: date, portfolio: pl.DataFrame) -> None:
+            checkpoints.save(period, keys[period], portfolio)
+
+        return completed, remaining, save
+
+    def run_sequential(self, strategy: Strategy, checkpoint_dir: str | None = None) -> AssetReturns:
         """
         Runs the backtest sequentially by computing alphas, constructing portfolios,
         and calculating forward returns.
 
         Args:
             strategy (Strategy): The strategy object used for portfolio construction and signal generation.
+            checkpoint_dir (str, optional): A run directory in which each period's portfolio is
+                checkpointed. Periods already checkpointed with the same inputs are skipped.
 
         Returns:
             AssetReturns: A record containing the computed asset returns.
@@ -112,20 +228,46 @@ class Backtester:
         # Compute alphas
         alphas = self._compute_alphas(strategy)
 
+        # Construct all periods at once for panel constructors
+        if is_panel_constructor(strategy.portfolio_constructor):
+            return self._compute_forward_returns([self._construct_panel(universe, alphas, strategy)])
+
         # Get periods
         periods = universe["date"].unique().sort().to_list()
 
+        # Resume from checkpoints
+        portfolios, periods, save = self._resume(strategy, universe, alphas, periods, checkpoint_dir)
+
         # Construct portfolios
-        portfolios = [
-            self.construct_portfolio(period, universe, alphas, strategy)
-            for period in tqdm(periods, desc="Computing portfolios")
-        ]
+        for period in tqdm(periods, desc="Computing portfolios"):
+            portfolio = self._construct_portfolio(period, universe, alphas, strategy)
+
+            if save is not None:
+                save(period, portfolio)
+
+            portfolios.append(portfolio)
 
         return self._compute_forward_returns(portfolios)
 
     @staticmethod
-    @ray.remote
-    def construct_portfolio(
+    def _construct_panel(universe: pl.DataFrame, alphas: Alpha, strategy: Strategy) -> Portfolio:
+        """
+        Constructs the portfolios of every period at once with a panel portfolio constructor.
+
+        Args:
+            universe (pl.DataFrame): The universe of available assets for all periods.
+            alphas (Alpha): The computed alphas for all periods.
+            strategy (Strategy): The strategy whose portfolio constructor is a panel constructor.
+
+        Returns:
+            Portfolio: The portfolios of all periods.
+        """
+        universe_alphas = alphas.join(universe.select(["date", "barrid"]), on=["date", "barrid"], how="semi")
+
+        return strategy.portfolio_constructor(alphas=Alpha(universe_alphas))
+
+    @staticmethod
+    def _construct_portfolio(
         period, universe, alphas, strategy, progress_bar: tqdm_ray.tqdm | None = None
     ):
         """
@@ -143,7 +285,7 @@ class Backtester:
         """
         # Get portfolio constructor parameters
         period_barrids = universe.filter(pl.col("date") == period)["barrid"].sort().to_list()
-        period_alphas = Alpha(alphas.filter(pl.col("date") == period).sort(["barrid"]))
+        period_alphas = Alpha(alphas.filter(pl.col("date") == period))
 
         # Construct period portfolio
         portfolio = strategy.portfolio_constructor(
@@ -159,14 +301,109 @@ class Backtester:
 
         return portfolio
 
-    def run_parallel(self, strategy: Strategy, n_cpus: int | None = None) -> AssetReturns:
+    @staticmethod
+    @ray.remote
+    def construct_portfolio(
+        period, universe, alphas, strategy, progress_bar: tqdm_ray.tqdm | None = None
+    ):
+        """
+        Ray task wrapper around `_construct_portfolio`.
+
+        Returns:
+            Portfolio: A constructed portfolio for the given period.
+        """
+        return Backtester._construct_portfolio(period, universe, alphas, strategy, progress_bar)
+
+    def _run_remote(
+        self,
+        submit: Callable[[date, ray.actor.ActorHandle], ray.ObjectRef],
+        periods: list[date],
+        progress_desc: str,
+        max_in_flight: int,
+        sink_path: str | None,
+        on_result: Callable[[date, pl.DataFrame], None] | None = None,
+        actors: list[ray.actor.ActorHandle] | None = None,
+    ) -> pl.DataFrame:
+        """
+        Streams period portfolios from Ray tasks into a parquet sink as they complete.
+
+        Args:
+            submit (Callable[[date, ray.actor.ActorHandle], ray.ObjectRef]): Submits the portfolio task for a
+                period, given the handle of the remote progress bar the task should update.
+            periods (list[date]): The periods to construct portfolios for.
+            progress_desc (str): The description shown on the progress bar.
+            max_in_flight (int): The maximum number of tasks dispatched but not yet collected.
+            sink_path (str | None): The parquet file to stream portfolios into. Defaults to a
+                temporary file that is removed once the portfolios are read back.
+            on_result (Callable[[date, pl.DataFrame], None], optional): Called with each period and its portfolio as it completes.
+            actors (list[ray.actor.ActorHandle], optional): The `RiskModelActor` pool the tasks run on. Their
+                resident data is released once every period is collected.
+
+        Returns:
+            pl.DataFrame: The concatenated portfolios for all periods.
+        """
+        # Set up ray progress bar
+        remote_tqdm = ray.remote(tqdm_ray.tqdm)
+        progress_bar = remote_tqdm.remote(total=len(periods), desc=progress_desc)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sink_path = sink_path or os.path.join(temp_dir, "portfolios.parquet")
+
+            try:
+                # Dispatch tasks and write results as they complete
+                with ParquetSink(sink_path) as sink:
+                    stream_to_sink(
+                        submit=lambda period: submit(period, progress_bar),
+                        items=periods,
+                        sink=sink,
+                        max_in_flight=max_in_flight,
+                        on_result=on_result,
+                    )
+
+                # Release the actors' resident risk model data
+                ray.get([actor.clear_resident_data.remote() for actor in actors or []])
+
+            except Exception as error:
+                # Send failure slack message
+                if self._slack_log_config is not None:
+                    send_message_to_slack(self._slack_log_config.to_failure_message(error))
+                raise
+
+            finally:
+                # Shutdown ray and progress bar
+                progress_bar.close.remote()
+                ray.shutdown()
+
+            portfolios = pl.read_parquet(sink_path)
+
+        # Send terminal slack message
+        if self._slack_log_config is not None:
+            send_message_to_slack(self._slack_log_config.to_terminal_message())
+
+        return portfolios
+
+    def run_parallel(
+        self,
+        strategy: Strategy,
+        n_cpus: int | None = None,
+        max_in_flight: int | None = None,
+        sink_path: str | None = None,
+        checkpoint_dir: str | None = None,
+    ) -> AssetReturns:
         """
         Runs the backtest in parallel by computing alphas, constructing portfolios,
         and calculating forward returns using multiple CPU cores.
 
+        Portfolios are collected as they complete and appended to an on-disk parquet sink, with
+        at most `max_in_flight` tasks dispatched at a time. A failing period raises immediately.
+
         Args:
             strategy (Strategy): The strategy object used for portfolio construction and signal generation.
             n_cpus (int, optional): The number of CPU cores to use for parallel execution.
+            max_in_flight (int, optional): The maximum number of tasks in flight. Defaults to twice `n_cpus`.
+            sink_path (str, optional): The parquet file to stream portfolios into. Defaults to a temporary file.
+            checkpoint_dir (str, optional): A run directory in which each period's portfolio is
+                checkpointed as it completes. Periods already checkpointed with the same inputs are skipped.
 
         Returns:
             AssetReturns: A record containing the computed asset returns.
@@ -181,9 +418,19 @@ class Backtester:
         # Compute alphas
         alphas = self._compute_alphas(strategy)
 
+        # Construct all periods at once for panel constructors
+        if is_panel_constructor(strategy.portfolio_constructor):
+            return self._compute_forward_returns([self._construct_panel(universe, alphas, strategy)])
+
         # Get periods
         periods = universe["date"].unique().sort().to_list()
 
+        # Resume from checkpoints
+        completed, periods, save = self._resume(strategy, universe, alphas, periods, checkpoint_dir)
+
+        if len(periods) == 0:
+            return self._compute_forward_returns(completed)
+
         # Set up ray
         n_cpus = n_cpus or os.cpu_count()
         n_cpus = min(len(periods), n_cpus)
@@ -194,27 +441,367 @@ class Backtester:
             self._slack_log_config.ray_url = context.dashboard_url
             send_message_to_slack(self._slack_log_config.to_initial_message())
 
-        # Set up ray progress bar
-        remote_tqdm = ray.remote(tqdm_ray.tqdm)
-        progress_bar = remote_tqdm.remote(
-            total=len(periods), desc=f"Computing portfolios with {n_cpus} cpus"
-        )
+        # Put shared inputs in the object store once
+        universe_ref = ray.put(universe)
+        alphas_ref = ray.put(alphas)
+        strategy_ref = ray.put(strategy)
 
         # Dispatch parallel tasks
-        portfolio_futures = [
-            self.construct_portfolio.remote(period, universe, alphas, strategy, progress_bar)
-            for period in periods
-        ]
+        portfolios = self._run_remote(
+            submit=lambda period, progress_bar: self.construct_portfolio.remote(period, universe_ref, alphas_ref, strategy_ref, progress_bar),
+            periods=periods,
+            progress_desc=f"Computing portfolios with {n_cpus} cpus",
+            max_in_flight=max_in_flight or 2 * n_cpus,
+            sink_path=sink_path,
+            on_result=save,
+        )
 
-        # Retrieve results
-        portfolios = ray.get(portfolio_futures)
+        return self._compute_forward_returns(completed + [portfolios])
 
-        # Shutdown ray and progress bar
-        progress_bar.close.remote()
-        ray.shutdown()
+    def run_actor_pool(
+        self,
+        strategy: Strategy,
+        n_actors: int | None = None,
+        max_in_flight: int | None = None,
+        sink_path: str | None = None,
+        checkpoint_dir: str | None = None,
+    ) -> AssetReturns:
+        """
+        Runs the backtest in parallel on a pool of data-resident Ray actors.
 
-        # Send terminal slack message
+        The periods are split into contiguous date ranges, one per actor. Each actor loads the
+        Barra risk model data for its date range into memory once, and every period is routed to
+        the actor holding its data, so covariance matrices and constraints are built from
+        in-memory lookups instead of repeated parquet reads. Results are streamed to a parquet
+        sink as in `run_parallel`.
+
+        Args:
+            strategy (Strategy): The strategy object used for portfolio construction and signal generation.
+            n_actors (int, optional): The number of actors (one CPU each). Defaults to all CPU cores.
+            max_in_flight (int, optional): The maximum number of tasks in flight. Defaults to twice `n_actors`.
+            sink_path (str, optional): The parquet file to stream portfolios into. Defaults to a temporary file.
+            checkpoint_dir (str, optional): A run directory in which each period's portfolio is
+                checkpointed as it completes. Periods already checkpointed with the same inputs are skipped.
+
+        Returns:
+            AssetReturns: A record containing the computed asset returns.
+        """
+        # Get universe
+        universe = dal.load_universe(
+            interval=self._interval,
+            start_date=self._start_date,
+            end_date=self._end_date,
+        )
+
+        # Compute alphas
+        alphas = self._compute_alphas(strategy)
+
+        # Construct all periods at once for panel constructors
+        if is_panel_constructor(strategy.portfolio_constructor):
+            return self._compute_forward_returns([self._construct_panel(universe, alphas, strategy)])
+
+        # Get periods
+        periods = universe["date"].unique().sort().to_list()
+
+        # Resume from checkpoints
+        completed, periods, save = self._resume(strategy, universe, alphas, periods, checkpoint_dir)
+
+        if len(periods) == 0:
+            return self._compute_forward_returns(completed)
+
+        # Set up ray
+        n_actors = n_actors or os.cpu_count()
+        n_actors = min(len(periods), n_actors)
+        context = ray.init(ignore_reinit_error=True, num_cpus=n_actors)
+
+        # Send initial slack message
         if self._slack_log_config is not None:
-            send_message_to_slack(self._slack_log_config.to_terminal_message())
+            self._slack_log_config.ray_url = context.dashboard_url
+            send_message_to_slack(self._slack_log_config.to_initial_message())
 
-        return self._compute_forward_returns(portfolios)
+        # Put shared inputs in the object store once
+        universe_ref = ray.put(universe)
+        alphas_ref = ray.put(alphas)
+        strategy_ref = ray.put(strategy)
+
+        # Assign contiguous date ranges to actors
+        chunk_size = -(-len(periods) // n_actors)
+        period_chunks = [periods[i : i + chunk_size] for i in range(0, len(periods), chunk_size)]
+        actors = [RiskModelActor.remote(period_chunk) for period_chunk in period_chunks]
+
+        # Route each period to the actor holding its data
+        period_actors = {period: actor for actor, period_chunk in zip(actors, period_chunks) for period in period_chunk}
+
+        # Interleave periods across actors so every actor has work in flight
+        interleaved_periods = [period for period_group in zip_longest(*period_chunks) for period in period_group if period is not None]
+
+        # Dispatch actor tasks
+        portfolios = self._run_remote(
+            submit=lambda period, progress_bar: period_actors[period].construct_portfolio.remote(
+                period, universe_ref, alphas_ref, strategy_ref, progress_bar
+            ),
+            periods=interleaved_periods,
+            progress_desc=f"Computing portfolios with {n_actors} actors",
+            max_in_flight=max_in_flight or 2 * n_actors,
+            sink_path=sink_path,
+            on_result=save,
+            actors=actors,
+        )
+
+        return self._compute_forward_returns(completed + [portfolios])
+
+    @staticmethod
+    def _construct_portfolios(
+        period,
+        universe,
+        alphas: dict[str, Alpha],
+        strategies: dict[str, Strategy],
+        progress_bar: tqdm_ray.tqdm | None = None,
+    ) -> pl.DataFrame:
+        """
+        Constructs the portfolios of several strategies for one period.
+
+        The covariance matrix is built once and reused by every strategy's portfolio constructor
+        and constraints (see `covariance_matrix_constructor`).
+
+        Args:
+            period (date): The date period for which the portfolios are being constructed.
+            universe (pl.DataFrame): The universe of available assets for portfolio construction.
+            alphas (dict[str, Alpha]): The computed alphas of each strategy.
+            strategies (dict[str, Strategy]): The strategies to construct portfolios for, by name.
+            progress_bar (tqdm_ray.tqdm, optional): A Ray-based progress bar for tracking progress.
+
+        Returns:
+            pl.DataFrame: The portfolios of all strategies, with a 'strategy' column.
+        """
+        portfolios = [
+            Backtester._construct_portfolio(period, universe, alphas[name], strategy).select(pl.lit(name).alias("strategy"), pl.all())
+            for name, strategy in strategies.items()
+        ]
+
+        # Update progress bar
+        if progress_bar is not None:
+            progress_bar.update.remote(1)
+
+        return pl.concat(portfolios)
+
+    def run_batch(
+        self,
+        strategies: dict[str, Strategy],
+        n_cpus: int | None = None,
+        max_in_flight: int | None = None,
+        sink_path: str | None = None,
+    ) -> pl.DataFrame:
+        """
+        Runs several strategies over the same backtest in parallel, sharing data and risk models.
+
+        The universe and forward returns are loaded once for all strategies. The periods are split
+        into contiguous date ranges over a pool of data-resident actors (as in `run_actor_pool`), so
+        each actor loads the risk model data of its range once. Each actor task solves every strategy's
+        portfolio for one period, so the covariance matrix is built once per period instead of once
+        per strategy.
+
+        Args:
+            strategies (dict[str, Strategy]): The strategies to backtest, keyed by name.
+            n_cpus (int, optional): The number of actors (one CPU each). Defaults to all CPU cores.
+            max_in_flight (int, optional): The maximum number of tasks in flight. Defaults to twice `n_cpus`.
+            sink_path (str, optional): The parquet file to stream portfolios into. Defaults to a temporary file.
+
+        Returns:
+            pl.DataFrame: The asset returns of all strategies with columns 'strategy', 'date',
+                'barrid', 'weight', and 'fwd_ret'.
+        """
+        # Get universe
+        universe = dal.load_universe(
+            interval=self._interval,
+            start_date=self._start_date,
+            end_date=self._end_date,
+        )
+
+        # Compute alphas
+        alphas = {name: self._compute_alphas(strategy) for name, strategy in strategies.items()}
+
+        # Construct all periods at once for panel constructors
+        portfolios = [
+            self._construct_panel(universe, alphas[name], strategy).select(pl.lit(name).alias("strategy"), pl.all())
+            for name, strategy in strategies.items()
+            if is_panel_constructor(strategy.portfolio_constructor)
+        ]
+
+        period_strategies = {name: strategy for name, strategy in strategies.items() if not is_panel_constructor(strategy.portfolio_constructor)}
+
+        if len(period_strategies) > 0:
+            # Get periods
+            periods = universe["date"].unique().sort().to_list()
+
+            # Set up ray
+            n_cpus = n_cpus or os.cpu_count()
+            n_cpus = min(len(periods), n_cpus)
+            context = ray.init(ignore_reinit_error=True, num_cpus=n_cpus)
+
+            # Send initial slack message
+            if self._slack_log_config is not None:
+                self._slack_log_config.ray_url = context.dashboard_url
+                send_message_to_slack(self._slack_log_config.to_initial_message())
+
+            # Put shared inputs in the object store once
+            universe_ref = ray.put(universe)
+            alphas_ref = ray.put({name: alphas[name] for name in period_strategies})
+            strategies_ref = ray.put(period_strategies)
+
+            # Assign contiguous date ranges to actors, which load their risk model data once
+            chunk_size = -(-len(periods) // n_cpus)
+            period_chunks = [periods[i : i + chunk_size] for i in range(0, len(periods), chunk_size)]
+            actors = [RiskModelActor.remote(period_chunk) for period_chunk in period_chunks]
+
+            # Route each period to the actor holding its data
+            period_actors = {period: actor for actor, period_chunk in zip(actors, period_chunks) for period in period_chunk}
+
+            # Interleave periods across actors so every actor has work in flight
+            interleaved_periods = [period for period_group in zip_longest(*period_chunks) for period in period_group if period is not None]
+
+            # Dispatch actor tasks
+            portfolios.append(
+                self._run_remote(
+                    submit=lambda period, progress_bar: period_actors[period].construct_portfolios.remote(
+                        period, universe_ref, alphas_ref, strategies_ref, progress_bar
+                    ),
+                    periods=interleaved_periods,
+                    progress_desc=f"Computing {len(period_strategies)} strategies with {n_cpus} actors",
+                    max_in_flight=max_in_flight or 2 * n_cpus,
+                    sink_path=sink_path,
+                    actors=actors,
+                )
+            )
+
+        portfolios = pl.concat(portfolios)
+
+        # Join forward returns once for all strategies
+        testing_data = self._data.with_columns(pl.col("ret").shift(-1).over("barrid").alias("fwd_ret")).select(["date", "barrid", "fwd_ret"])
+
+        return portfolios.join(testing_data, on=["date", "barrid"], how="left").sort(["strategy", "barrid", "date"])
+
+    def extend(
+        self,
+        run: AssetReturns,
+        strategy: Strategy,
+        new_end_date: date,
+        data: pl.DataFrame | None = None,
+    ) -> AssetReturns:
+        """
+        Extends a finished backtest to new dates without recomputing its history.
+
+        Only the last `strategy.lookback` rows of history of the barrids held on the last date of `run`
+        or in the new periods, the rows the signal depends on, are loaded. Signals, scores, and alphas are computed on that history, portfolios are solved
+        for the periods after the last date of `run` only, and the forward returns of the last period
+        of `run` (unknown when it was computed) are filled in.
+
+        Args:
+            run (AssetReturns): The asset returns of the backtest being extended.
+            strategy (Strategy): The strategy the backtest was run with. Its `lookback` must be set.
+            new_end_date (date): The new end date of the backtest.
+            data (pl.DataFrame, optional): Data holding the lookback history of each barrid through `new_end_date`.
+                Defaults to the universe joined with Barra returns over that history.
+
+        Returns:
+            AssetReturns: The asset returns of the full, extended backtest.
+
+        Raises:
+            ValueError: If `strategy.lookback` is not set.
+        """
+        if strategy.lookback is None or strategy.lookback < 0:
+            raise ValueError("Backtester.extend requires strategy.lookback, the number of prior rows per barrid the signal needs")
+
+        last_date = run["date"].max()
+
+        # Get new periods
+        universe = dal.load_universe(interval=self._interval, start_date=self._start_date, end_date=new_end_date)
+        new_universe = universe.filter(pl.col("date") > last_date)
+        periods = new_universe["date"].unique().sort().to_list()
+
+        # Load data for the lookback history and new periods
+        if data is None:
+            # Only barrids held on the last date (for its forward returns) or in the new periods need history
+            barrids = universe.filter(pl.col("date") >= last_date)["barrid"].unique()
+
+            # Keep the last rows of each of those barrids through the last date (at least that date)
+            history = universe.filter(pl.col("date") <= last_date, pl.col("barrid").is_in(barrids.implode())).filter(
+                pl.int_range(pl.len(), 0, -1).over("barrid") <= max(strategy.lookback, 1)
+            )
+            window_start = history["date"].min()
+
+            data = (
+                pl.concat([history, new_universe])
+                .join(
+                    dal.load_barra_returns(interval=self._interval, start_date=window_start, end_date=new_end_date),
+                    on=["date", "barrid"],
+                    how="left",
+                )
+                .sort(["barrid", "date"])
+            )
+
+        # Compute alphas for new periods only
+        alphas = self._compute_alphas(strategy, data)
+        alphas = Alpha(alphas.filter(pl.col("date") > last_date))
+
+        # Construct portfolios for new periods
+        if is_panel_constructor(strategy.portfolio_constructor):
+            portfolios = [self._construct_panel(new_universe, alphas, strategy)]
+
+        else:
+            portfolios = [self._construct_portfolio(period, new_universe, alphas, strategy) for period in tqdm(periods, desc="Computing portfolios")]
+
+        # Recompute forward returns of the last period and add new periods
+        last_portfolio = run.filter(pl.col("date") == last_date).drop("fwd_ret")
+        new_returns = self._compute_forward_returns([last_portfolio] + portfolios, data)
+
+        return AssetReturns(pl.concat([run.filter(pl.col("date") < last_date), new_returns]))
+
+
+@ray.remote
+class RiskModelActor:
+    """
+    A Ray actor that holds the Barra risk model data for a range of periods in memory.
+
+    Attributes:
+        _periods (list[date]): The periods whose risk model data is resident in this actor.
+    """
+
+    def __init__(self, periods: list[date]) -> None:
+        """
+        Initializes the actor and loads the risk model data for its periods.
+
+        Args:
+            periods (list[date]): The periods assigned to this actor.
+        """
+        self._periods = periods
+        dal.make_risk_model_resident(periods)
+
+    def construct_portfolio(self, period, universe, alphas, strategy, progress_bar: tqdm_ray.tqdm | None = None):
+        """
+        Constructs a portfolio for a period held by this actor.
+
+        Returns:
+            Portfolio: A constructed portfolio for the given period.
+        """
+        return Backtester._construct_portfolio(period, universe, alphas, strategy, progress_bar)
+
+    def construct_portfolios(
+        self,
+        period,
+        universe,
+        alphas: dict[str, Alpha],
+        strategies: dict[str, Strategy],
+        progress_bar: tqdm_ray.tqdm | None = None,
+    ) -> pl.DataFrame:
+        """
+        Constructs the portfolios of several strategies for a period held by this actor.
+
+        Returns:
+            pl.DataFrame: The portfolios of all strategies, with a 'strategy' column.
+        """
+        return Backtester._construct_portfolios(period, universe, alphas, strategies, progress_bar)
+
+    def clear_resident_data(self) -> None:
+        """Releases the risk model data held by this actor."""
+        dal.clear_resident_data()
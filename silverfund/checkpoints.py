@@ -0,0 +1,123 @@
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+
+from silverfund.fingerprints import fingerprint_frame, hash_key
+from silverfund.records import Alpha, Portfolio
+from silverfund.strategies import Strategy
+
+
+class CheckpointStore:
+    """
+    Persists per-period portfolios under a run directory so interrupted backtests can resume.
+
+    Each portfolio is stored as `<period>_<key>.parquet`, where the key hashes everything the
+    period's portfolio depends on. A rerun reuses a period only when its key is unchanged, so
+    editing one input only recomputes the periods whose key it changes.
+
+    Attributes:
+        _run_dir (Path): The directory holding the checkpoint files.
+    """
+
+    def __init__(self, run_dir: str | Path) -> None:
+        """
+        Initializes a CheckpointStore instance.
+
+        Args:
+            run_dir (str | Path): The directory holding the checkpoint files. Created if missing.
+        """
+        self._run_dir = Path(run_dir)
+        self._run_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, period: date, key: str) -> Path:
+        return self._run_dir / f"{period.isoformat()}_{key}.parquet"
+
+    def contains(self, period: date, key: str) -> bool:
+        """
+        Checks whether a period has been checkpointed under the given key.
+
+        Args:
+            period (date): The period of the portfolio.
+            key (str): The period key from `period_keys`.
+
+        Returns:
+            bool: True if the portfolio can be loaded from disk.
+        """
+        return self._path(period, key).exists()
+
+    def load(self, period: date, key: str) -> Portfolio:
+        """
+        Loads a checkpointed portfolio.
+
+        Args:
+            period (date): The period of the portfolio.
+            key (str): The period key from `period_keys`.
+
+        Returns:
+            Portfolio: The checkpointed portfolio.
+        """
+        return Portfolio(pl.read_parquet(self._path(period, key)))
+
+    def save(self, period: date, key: str, portfolio: pl.DataFrame) -> None:
+        """
+        Checkpoints a portfolio.
+
+        The file is written under a temporary name and renamed, so a run killed mid-write never
+        leaves a partial checkpoint behind.
+
+        Args:
+            period (date): The period of the portfolio.
+            key (str): The period key from `period_keys`.
+            portfolio (pl.DataFrame): The portfolio to persist.
+        """
+        path = self._path(period, key)
+        temp_path = path.with_suffix(".tmp")
+        portfolio.write_parquet(temp_path)
+        temp_path.replace(path)
+
+
+def period_keys(
+    strategy: Strategy,
+    universe: pl.DataFrame,
+    alphas: Alpha,
+    periods: list[date],
+    data_version: str | None = None,
+) -> dict[date, str]:
+    """
+    Computes the checkpoint key of every period.
+
+    A period's key hashes the portfolio constructor (including bound arguments such as gamma),
+    the constraints, the input data version, and the period's own universe and alphas. Changes
+    to the signal, score, or alpha constructors therefore only invalidate the periods whose
+    alphas actually change.
+
+    Args:
+        strategy (Strategy): The strategy being backtested.
+        universe (pl.DataFrame): The universe of assets for all periods.
+        alphas (Alpha): The alphas for all periods.
+        periods (list[date]): The periods to compute keys for.
+        data_version (str | None, optional): An identifier of the input data (e.g. the Barra delivery date).
+
+    Returns:
+        dict[date, str]: The checkpoint key of each period.
+    """
+    strategy_key = hash_key(strategy.portfolio_constructor, strategy.constraints, data_version)
+
+    universe_by_period = universe.partition_by("date", as_dict=True)
+    alphas_by_period = alphas.partition_by("date", as_dict=True)
+    empty_alphas = alphas.clear()
+
+    keys = {}
+    for period in periods:
+        period_universe = universe_by_period[(period,)].select("barrid").sort("barrid")
+        period_alphas = alphas_by_period.get((period,), empty_alphas).sort("barrid")
+
+        keys[period] = hash_key(
+            strategy_key,
+            period,
+            fingerprint_frame(period_universe),
+            fingerprint_frame(period_alphas),
+        )
+
+    return keys
@@ -2,9 +2,10 @@ from datetime import date
 from typing import Protocol
 
 import cvxpy as cp
-import polars as pl
+import numpy as np
 
 import silverfund.data_access_layer as dal
+from silverfund.asset_index import AssetIndex
 from silverfund.enums import Interval
 
 
@@ -82,19 +83,13 @@ def unit_beta(
     Returns:
         cp.Constraint: The unit beta constraint that ensures the weighted sum of betas equals 1.
     """
-    # Cast to polars dataframe
-    barrids_df = pl.DataFrame({"barrid": barrids})
-
     # Create betas dataframe
     betas_df = dal.load_total_risk(interval=interval, start_date=date_, end_date=date_).select(
         ["barrid", "predbeta"]
     )
 
-    # Filter on universe, fill null with mean, and cast to np vector
-    betas = (
-        barrids_df.join(betas_df, how="left", on="barrid")
-        .fill_null(strategy="mean")["predbeta"]
-        .to_list()
-    )
+    # Align with the universe by position and fill missing with the mean
+    betas = AssetIndex(barrids).gather_column(betas_df, "predbeta", fill_value=np.nan)
+    betas = np.where(np.isnan(betas), np.nanmean(betas), betas)
 
     return cp.sum(cp.multiply(weights, betas)) == 1
@@ -1,9 +1,11 @@
 from datetime import date
+from functools import lru_cache
 
 import numpy as np
 import polars as pl
 
 import silverfund.data_access_layer as dal
+from silverfund.asset_index import AssetIndex
 from silverfund.records import CovarianceMatrix
 
 
@@ -11,6 +13,10 @@ def covariance_matrix_constructor(date_: date, barrids: list[str]) -> Covariance
     """
     Constructs the covariance matrix based on exposures, factor covariances, and specific risks.
 
+    The most recent matrix is memoized, so several strategies solved for the same date and
+    universe in one worker share a single construction. Row and column `i` of the matrix belong
+    to `barrids[i]`, whatever order the barrids are given in.
+
     Args:
         date_ (date): The date for which the covariance matrix is computed.
         barrids (List[str]): List of Barrid identifiers for the assets.
@@ -18,26 +24,28 @@ def covariance_matrix_constructor(date_: date, barrids: list[str]) -> Covariance
     Returns:
         CovarianceMatrix: The computed covariance matrix wrapped in a CovarianceMatrix object.
     """
+    return _covariance_matrix(date_, tuple(barrids))
+
+
+@lru_cache(maxsize=1)
+def _covariance_matrix(date_: date, barrids: tuple[str, ...]) -> CovarianceMatrix:
+    index = AssetIndex(list(barrids))
+
     # Load
-    exposures_matrix = factor_exposure_matrix_constructor(date_, barrids).drop("barrid").to_numpy()
-    covariance_matrix = factor_covariance_matrix_constructor(date_).drop("factor_1").to_numpy()
-    idio_risk_matrix = specific_risk_matrix(date_, barrids).drop("barrid").to_numpy()
+    factor_covariance = factor_covariance_matrix_constructor(date_)
+    factors = factor_covariance["factor_1"].to_list()
+    covariance_matrix = factor_covariance.drop("factor_1").to_numpy()
+    exposures_matrix = factor_exposure_array(date_, index, factors)
+    specific_risk = index.gather_column(dal.load_specific_risk(date_), "specific_risk")
 
     # Compute covariance matrix
-    covariance_matrix = exposures_matrix @ covariance_matrix @ exposures_matrix.T + idio_risk_matrix
+    covariance_matrix = exposures_matrix @ covariance_matrix @ exposures_matrix.T
+    covariance_matrix[np.diag_indices_from(covariance_matrix)] += specific_risk**2
 
     # Put in decimal space
-    covariance_matrix = covariance_matrix / (100**2)
-
-    # Package
-    covariance_matrix = pl.DataFrame(
-        {
-            "barrid": barrids,
-            **{id: covariance_matrix[:, i] for i, id in enumerate(barrids)},
-        }
-    )
+    covariance_matrix /= 100**2
 
-    return CovarianceMatrix(covariance_matrix, barrids=barrids)
+    return CovarianceMatrix(covariance_matrix, barrids=index.barrids)
 
 
 def factor_exposure_matrix_constructor(date_: date, barrids: list[str]) -> pl.DataFrame:
@@ -78,6 +86,36 @@ def factor_exposure_matrix_constructor(date_: date, barrids: list[str]) -> pl.Da
     return exp_mat
 
 
+def factor_exposure_array(date_: date, index: AssetIndex, factors: list[str]) -> np.ndarray:
+    """
+    Constructs the factor exposure matrix for the given date as an array aligned with an asset index.
+
+    Exposures are scattered into place by position, so no pivot or sort is needed. Missing
+    exposures are 0.
+
+    Args:
+        date_ (date): The date for which the factor exposure matrix is computed.
+        index (AssetIndex): The assets, in row order.
+        factors (list[str]): The factors, in column order.
+
+    Returns:
+        np.ndarray: The N x K factor exposure matrix.
+    """
+    # Load
+    bfe = dal.load_factor_exposures(date_)
+
+    # Positions
+    rows = index.positions(bfe["barrid"])
+    cols = bfe["factor"].replace_strict(factors, np.arange(len(factors)), default=-1, return_dtype=pl.Int64).to_numpy()
+    found = (rows >= 0) & (cols >= 0)
+
+    # Scatter
+    exposures = np.zeros((len(index), len(factors)))
+    exposures[rows[found], cols[found]] = bfe["exposure"].to_numpy()[found]
+
+    return exposures
+
+
 def factor_covariance_matrix_constructor(date_: date) -> pl.DataFrame:
     """
     Constructs the factor covariance matrix for the given date.
@@ -119,30 +157,37 @@ def factor_covariance_matrix_constructor(date_: date) -> pl.DataFrame:
     return cov_mat
 
 
-def specific_risk_matrix(date_: date, barrids: list[str]) -> pl.DataFrame:
+def specific_risk_vector(date_: date, barrids: list[str]) -> np.ndarray:
     """
-    Constructs the specific risk matrix for the given date and Barrids.
+    Constructs the specific risk of each of the given Barrids on the given date.
 
     Args:
-        date_ (date): The date for which the specific risk matrix is computed.
+        date_ (date): The date for which the specific risks are loaded.
         barrids (List[str]): List of Barrid identifiers for the assets.
 
     Returns:
-        pl.DataFrame: The specific risk matrix.
+        np.ndarray: The specific risk of each Barrid, in the order given (0 if missing).
     """
-    # Barrids
-    barrids_df = pl.DataFrame({"barrid": barrids})
-
     # Load
     sr_df = dal.load_specific_risk(date_)
 
-    # Filter
-    sr_df = barrids_df.join(sr_df, on=["barrid"], how="left").fill_null(
-        0
-    )  # ask Brandon about this.
+    # Align (missing set to 0, ask Brandon about this)
+    return AssetIndex(barrids).gather_column(sr_df, "specific_risk")
+
 
+def specific_risk_matrix(date_: date, barrids: list[str]) -> pl.DataFrame:
+    """
+    Constructs the specific risk matrix for the given date and Barrids.
+
+    Args:
+        date_ (date): The date for which the specific risk matrix is computed.
+        barrids (List[str]): List of Barrid identifiers for the assets.
+
+    Returns:
+        pl.DataFrame: The specific risk matrix.
+    """
     # Convert vector to diagonal matrix
-    diagonal = np.power(np.diag(sr_df["specific_risk"]), 2)
+    diagonal = np.power(np.diag(specific_risk_vector(date_, barrids)), 2)
 
     # Package
     risk_matrix = pl.DataFrame(
@@ -8,6 +8,7 @@ import silverfund.data_access_layer as dal
 from silverfund.alphas import grindold_kahn
 from silverfund.constraints import full_investment, long_only, no_buying_on_margin, unit_beta
 from silverfund.enums import Interval
+from silverfund.incremental_signals import IncrementalSignal
 from silverfund.portfolios import mean_variance_efficient
 from silverfund.records import Alpha
 from silverfund.scores import z_score
@@ -48,6 +49,7 @@ def get_current_portfolio(
     look_back: int,
     current_date: date | None = None,
     barrids: list[str] | None = None,
+    signal_state: IncrementalSignal | None = None,
 ) -> pl.DataFrame:
     """
     Construct the current portfolio based on a given strategy.
@@ -61,14 +63,26 @@ def get_current_portfolio(
         interval (Interval): The data frequency (e.g., daily, weekly).
         look_back (int): The number of days to look back when retrieving market data.
         current_date (date | None, optional): The reference date for portfolio construction. Defaults to today's date.
+        barrids (list[str] | None, optional): The barrids to construct the portfolio from.
+        signal_state (IncrementalSignal | None, optional): The persisted rolling state of the strategy's signal
+            (e.g. a `MomentumState` updated through the day before). If given, only the previous market date
+            is loaded and applied to the state instead of recomputing the signal over `look_back` days; the
+            caller is responsible for saving the updated state.
 
     Returns:
         pl.DataFrame: A DataFrame representing the constructed portfolio.
     """
+    # Get previous market date
+    current_date = current_date or date.today()
+    prev_date = get_last_market_date(current_date)
+
     # Data parameters
     end_date = date.today()
     start_date = end_date - timedelta(days=look_back)
 
+    if signal_state is not None:
+        start_date = end_date = prev_date
+
     # Get universe
     universe = dal.load_universe(interval=interval, start_date=start_date, end_date=end_date)
 
@@ -88,14 +102,14 @@ def get_current_portfolio(
     data = data.filter(pl.col("price").gt(5)).sort(["barrid", "date"])
 
     # Construct signals, scores, and alphas
-    signals = strategy.signal_constructor(data)
+    if signal_state is not None:
+        signals = signal_state.update(data)
+    else:
+        signals = strategy.signal_constructor(data)
+
     scores = strategy.score_constructor(signals)
     alphas = strategy.alpha_constructor(scores, interval)
 
-    # Get previous market date
-    current_date = current_date or date.today()
-    prev_date = get_last_market_date(current_date)
-
     # Filter to current alphas
     current_alphas_df = alphas.filter(pl.col("date") == prev_date).sort(["barrid", "date"])
 
@@ -15,10 +15,25 @@ Available functions:
 - load_factor_exposures: Loads factor exposure data.
 - load_specific_risk: Retrieves specific risk estimates from Barra.
 - load_benchmark: Loads benchmark return data.
+- make_risk_model_resident: Holds Barra risk model data for given dates in memory.
+- clear_resident_data: Releases resident risk model data.
+- load_asset_ids: Loads the persisted barrid to integer id dictionary.
+- build_asset_ids: Registers every known barrid in the dictionary (an administrative step).
+- encode_barrids / decode_barrids: Converts barrids to and from the integer-backed barrid Enum.
+- load_permno_ids: Loads the mapping between encoded barrids and CRSP permnos.
 
 These functions help streamline access to structured market and risk model data.
 """
 
+from .asset_ids import (
+    barrid_enum,
+    build_asset_ids,
+    decode_barrids,
+    encode_barrids,
+    load_asset_ids,
+    load_permno_ids,
+    register_barrids,
+)
 from .barra_factor_covariances import load_factor_covariances
 from .barra_factor_exposures import load_factor_exposures
 from .barra_returns import load_barra_returns
@@ -27,6 +42,7 @@ from .barra_specific_risk import load_specific_risk
 from .barra_total_risk import load_total_risk
 from .benchmark import load_benchmark
 from .crsp import load_crsp
+from .resident_cache import clear_resident_data, make_risk_model_resident
 from .trading_days import load_trading_days
 from .universe import load_universe
 
@@ -41,4 +57,13 @@ __all__ = [
     "load_factor_exposures",
     "load_specific_risk",
     "load_benchmark",
+    "make_risk_model_resident",
+    "clear_resident_data",
+    "load_asset_ids",
+    "build_asset_ids",
+    "register_barrids",
+    "barrid_enum",
+    "encode_barrids",
+    "decode_barrids",
+    "load_permno_ids",
 ]
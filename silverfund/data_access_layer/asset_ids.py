@@ -0,0 +1,227 @@
+import fcntl
+import os
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Iterator, TypeVar
+
+import polars as pl
+from dotenv import load_dotenv
+
+from silverfund.data_access_layer.mega_merge import load_mega_merge
+
+Frame = TypeVar("Frame", pl.DataFrame, pl.LazyFrame)
+
+# In-memory copy of the persisted dictionary
+_asset_ids: pl.DataFrame | None = None
+
+
+def _data_dir() -> Path:
+    load_dotenv()
+    parts = os.getenv("ROOT").split("/")
+    home = parts[1]
+    user = parts[2]
+    root_dir = Path(f"/{home}/{user}")
+    return root_dir / "groups" / "grp_quant" / "data"
+
+
+def _dictionary_path() -> Path:
+    return _data_dir() / "asset_ids" / "barrid_ids.parquet"
+
+
+@contextmanager
+def _dictionary_lock() -> Iterator[None]:
+    """Holds an exclusive lock on the dictionary while it is updated."""
+    path = _dictionary_path().with_suffix(".lock")
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def load_asset_ids(reload: bool = False) -> pl.DataFrame:
+    """Loads the persisted barrid to integer id dictionary.
+
+    Ids are assigned densely in the order barrids are first registered and are never reused or
+    reassigned, so an id means the same asset in every dataset and every process. Loading never
+    writes: the dictionary is built and extended by an administrator with `build_asset_ids`.
+
+    Args:
+        reload (bool, optional): Whether to re-read the file instead of using the in-memory copy. Defaults to False.
+
+    Returns:
+        pl.DataFrame: A DataFrame with 'barrid' (String) and 'id' (Int32) columns, ordered by id.
+
+    Raises:
+        FileNotFoundError: If the dictionary has not been built.
+    """
+    global _asset_ids
+
+    if _asset_ids is None or reload:
+        path = _dictionary_path()
+
+        if not path.exists():
+            raise FileNotFoundError(f"The barrid id dictionary {path} has not been built (see build_asset_ids)")
+
+        _asset_ids = pl.read_parquet(path)
+
+    return _asset_ids
+
+
+def build_asset_ids() -> pl.DataFrame:
+    """Registers every barrid in the Russell history and the Barra returns files.
+
+    This is an administrative step run once per data delivery by a user with write access to the
+    shared data directory. Registering the full set of assets up front keeps the barrid Enum the
+    same for every frame loaded afterwards; the dictionary then only grows when a new delivery
+    adds assets.
+
+    Returns:
+        pl.DataFrame: The updated dictionary.
+    """
+    data_dir = _data_dir()
+
+    # Russell constituents
+    barrids = [pl.read_parquet(data_dir / "russell_history.parquet", columns=["barrid"])["barrid"]]
+
+    # Barra returns
+    for file in sorted((data_dir / "barra_usslow_ret").glob("ret_*.parquet")):
+        barrids.append(pl.read_parquet(file, columns=["Barrid"])["Barrid"])
+
+    return register_barrids(pl.concat(barrids).unique())
+
+
+def register_barrids(barrids: Iterable[str]) -> pl.DataFrame:
+    """Adds barrids that are not in the dictionary yet and persists the dictionary.
+
+    The dictionary is re-read and rewritten under an exclusive file lock, so concurrent
+    registrations never assign the same id twice or overwrite each other's ids.
+
+    Args:
+        barrids (Iterable[str]): The barrids to register. Known barrids keep their id.
+
+    Returns:
+        pl.DataFrame: The updated dictionary.
+    """
+    global _asset_ids
+
+    barrids = pl.DataFrame({"barrid": pl.Series(list(barrids), dtype=pl.String)}).drop_nulls().unique()
+
+    with _dictionary_lock():
+        path = _dictionary_path()
+        asset_ids = pl.read_parquet(path) if path.exists() else pl.DataFrame(schema={"barrid": pl.String, "id": pl.Int32})
+
+        # Find unseen barrids
+        new_barrids = barrids.join(asset_ids, on="barrid", how="anti").sort("barrid")
+
+        if new_barrids.height > 0:
+            # Assign the next ids
+            new_ids = new_barrids.with_columns((pl.int_range(pl.len(), dtype=pl.Int32) + asset_ids.height).alias("id"))
+            asset_ids = pl.concat([asset_ids, new_ids])
+
+            # Persist (renamed into place so readers never see a partial file)
+            temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            asset_ids.write_parquet(temp_path)
+            temp_path.replace(path)
+
+    _asset_ids = asset_ids
+
+    return asset_ids
+
+
+def barrid_enum() -> pl.Enum:
+    """Returns the Enum type of encoded barrids.
+
+    The categories are the dictionary's barrids in id order, so the physical value of an encoded
+    barrid is its id and joins and group-bys on it compare integers.
+
+    Returns:
+        pl.Enum: The barrid Enum type.
+    """
+    return pl.Enum(load_asset_ids()["barrid"])
+
+
+def encode_barrids(df: Frame, column: str = "barrid") -> Frame:
+    """Encodes a String barrid column as the barrid Enum.
+
+    Columns encoded with an older dictionary are upgraded to the current one; ids never change,
+    so this is always possible. Encoding never registers barrids.
+
+    Args:
+        df (pl.DataFrame | pl.LazyFrame): The data to encode.
+        column (str, optional): The barrid column. Defaults to "barrid".
+
+    Returns:
+        pl.DataFrame | pl.LazyFrame: The data with the barrid column encoded.
+
+    Raises:
+        ValueError: If a DataFrame holds barrids that are not in the dictionary. LazyFrames raise
+            when they are collected instead.
+    """
+    if isinstance(df, pl.DataFrame) and df.schema[column] == pl.String:
+        barrids = df[column].drop_nulls().unique()
+
+        # Pick up barrids registered by another process since the dictionary was loaded
+        if not barrids.is_in(load_asset_ids()["barrid"].implode()).all():
+            unknown = barrids.filter(~barrids.is_in(load_asset_ids(reload=True)["barrid"].implode()))
+
+            if len(unknown) > 0:
+                raise ValueError(f"{len(unknown)} barrids are not in the barrid id dictionary (see build_asset_ids): {unknown.head(5).to_list()}")
+
+    return df.with_columns(pl.col(column).cast(barrid_enum()))
+
+
+def decode_barrids(df: Frame, column: str = "barrid") -> Frame:
+    """Decodes a barrid Enum column back to strings.
+
+    Columns that are already strings are returned unchanged.
+
+    Args:
+        df (pl.DataFrame | pl.LazyFrame): The data to decode.
+        column (str, optional): The barrid column. Defaults to "barrid".
+
+    Returns:
+        pl.DataFrame | pl.LazyFrame: The data with a String barrid column.
+    """
+    schema = df.collect_schema() if isinstance(df, pl.LazyFrame) else df.schema
+
+    if schema[column] == pl.String:
+        return df
+
+    return df.with_columns(pl.col(column).cast(pl.String))
+
+
+def load_permno_ids(start_date: date | None = None, end_date: date | None = None) -> pl.DataFrame:
+    """Loads the mapping between encoded barrids and CRSP permnos from Mega Merge.
+
+    A barrid can map to different permnos over time, so each pair carries the first and last
+    date on which Mega Merge links them.
+
+    Args:
+        start_date (date, optional): The start date of the Mega Merge data to read.
+        end_date (date, optional): The end date of the Mega Merge data to read.
+
+    Returns:
+        pl.DataFrame: A DataFrame with 'barrid' (barrid Enum), 'permno' (Int32), 'start_date', and 'end_date' columns.
+    """
+    # Load
+    mega_merge = load_mega_merge(start_date, end_date).select(["date", "barrid", "permno"]).drop_nulls()
+
+    # Link ranges
+    links = mega_merge.group_by(["barrid", "permno"]).agg(
+        pl.col("date").min().alias("start_date"),
+        pl.col("date").max().alias("end_date"),
+    )
+
+    # Encode
+    links = encode_barrids(links).with_columns(pl.col("permno").cast(pl.Int32))
+
+    # Sort
+    links = links.sort(["barrid", "start_date"])
+
+    return links
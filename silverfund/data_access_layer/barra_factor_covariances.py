@@ -5,6 +5,8 @@ from pathlib import Path
 import polars as pl
 from dotenv import load_dotenv
 
+from silverfund.data_access_layer.resident_cache import read_parquet
+
 
 def load_factor_covariances(date_: date) -> pl.DataFrame:
     """Loads factor covariance data for a given date.
@@ -35,7 +37,7 @@ def load_factor_covariances(date_: date) -> pl.DataFrame:
     file = f"factor_covariance_{date_.year}.parquet"
     date_column = date_.strftime("%Y-%m-%d 00:00:00") if date else None
     columns = ["Combined", date_column]
-    df = pl.read_parquet(folder / file, columns=columns)
+    df = read_parquet(folder / file, columns=columns)
 
     # Rename date column
     df = df.rename({date_column: "covariance"})
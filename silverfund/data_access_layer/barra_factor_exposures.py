@@ -5,6 +5,8 @@ from pathlib import Path
 import polars as pl
 from dotenv import load_dotenv
 
+from silverfund.data_access_layer.resident_cache import read_parquet
+
 
 def load_factor_exposures(
     date_: date,
@@ -37,7 +39,7 @@ def load_factor_exposures(
     file = f"exposures_{date_.year}.parquet"
     date_column = date_.strftime("%Y-%m-%d 00:00:00") if date else None
     columns = ["Combined", date_column]
-    df = pl.read_parquet(folder / file, columns=columns)
+    df = read_parquet(folder / file, columns=columns)
 
     # Rename date column
     df = df.rename({date_column: "exposure"})
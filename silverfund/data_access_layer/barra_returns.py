@@ -6,6 +6,7 @@ import polars as pl
 from dotenv import load_dotenv
 from tqdm import tqdm
 
+from silverfund.data_access_layer.asset_ids import encode_barrids
 from silverfund.data_access_layer.trading_days import load_trading_days
 from silverfund.enums import Interval
 
@@ -14,6 +15,7 @@ def load_barra_returns(
     interval: Interval,
     start_date: date | None = None,
     end_date: date | None = None,
+    asset_ids: bool = False,
 ) -> pl.DataFrame:
     """Loads Barra returns data for a specified time interval.
 
@@ -28,6 +30,7 @@ def load_barra_returns(
             to July 31, 1995, if not provided.
         end_date (date, optional): The end date for filtering the data. Defaults to
             the current date if not provided.
+        asset_ids (bool, optional): If True, encodes 'barrid' as the integer-backed barrid Enum.
 
     Returns:
         pl.DataFrame: A Polars DataFrame containing the filtered and processed
@@ -78,6 +81,10 @@ def load_barra_returns(
     # Filter
     df = df.filter(pl.col("date").is_between(start_date, end_date))
 
+    # Encode barrids
+    if asset_ids:
+        df = encode_barrids(df)
+
     # Sort
     df = df.sort(by=["barrid", "date"])
 
@@ -5,6 +5,8 @@ from pathlib import Path
 import polars as pl
 from dotenv import load_dotenv
 
+from silverfund.data_access_layer.resident_cache import read_parquet
+
 
 def load_specific_risk(date_: date) -> pl.DataFrame:
     """Loads specific risk data for a given date.
@@ -35,7 +37,7 @@ def load_specific_risk(date_: date) -> pl.DataFrame:
     file = f"spec_risk_{date_.year}.parquet"
     date_column = date_.strftime("%Y-%m-%d 00:00:00") if date else None
     columns = ["Barrid", date_column]
-    df = pl.read_parquet(folder / file, columns=columns)
+    df = read_parquet(folder / file, columns=columns)
 
     # Rename columns
     df = df.rename({date_column: "specific_risk", "Barrid": "barrid"})
@@ -6,6 +6,8 @@ import polars as pl
 from dotenv import load_dotenv
 from tqdm import tqdm
 
+from silverfund.data_access_layer.asset_ids import encode_barrids
+from silverfund.data_access_layer.resident_cache import read_parquet
 from silverfund.data_access_layer.trading_days import load_trading_days
 from silverfund.enums import Interval
 
@@ -15,6 +17,7 @@ def load_total_risk(
     start_date: date | None = None,
     end_date: date | None = None,
     quiet: bool = True,
+    asset_ids: bool = False,
 ) -> pl.DataFrame:
     """Loads Barra total risk data for a specified time interval.
 
@@ -28,6 +31,7 @@ def load_total_risk(
         start_date (date | None, optional): The start date for filtering the data. Defaults to July 31, 1995.
         end_date (date | None, optional): The end date for filtering the data. Defaults to today.
         quiet (bool, optional): If `True`, disables the progress bar during data loading. Defaults to `True`.
+        asset_ids (bool, optional): If `True`, encodes 'barrid' as the integer-backed barrid Enum. Defaults to `False`.
 
     Returns:
         pl.DataFrame: A Polars DataFrame containing the filtered and processed
@@ -60,7 +64,7 @@ def load_total_risk(
         file = f"asset_{year}.parquet"
 
         # Load
-        df = pl.read_parquet(folder / file)
+        df = read_parquet(folder / file)
 
         # Clean
         df = clean(df)
@@ -83,6 +87,10 @@ def load_total_risk(
     # Filter
     df = df.filter(pl.col("date").is_between(start_date, end_date))
 
+    # Encode barrids
+    if asset_ids:
+        df = encode_barrids(df)
+
     # Sort
     df = df.sort(by=["date", "barrid"])
 
@@ -2,6 +2,7 @@ from datetime import date
 
 import polars as pl
 
+from silverfund.data_access_layer.asset_ids import encode_barrids
 from silverfund.data_access_layer.barra_returns import load_barra_returns
 from silverfund.data_access_layer.universe import load_universe
 from silverfund.enums import Interval
@@ -11,6 +12,7 @@ def load_benchmark(
     interval: Interval,
     start_date: date | None = None,
     end_date: date | None = None,
+    asset_ids: bool = False,
 ) -> pl.DataFrame:
     """Loads benchmark weights based on market capitalization.
 
@@ -23,6 +25,7 @@ def load_benchmark(
         interval (Interval): The time interval for the data (e.g., daily, monthly).
         start_date (date | None, optional): The start date for filtering the data. Defaults to `None`, meaning earliest available data is used.
         end_date (date | None, optional): The end date for filtering the data. Defaults to `None`, meaning the latest available data is used.
+        asset_ids (bool, optional): If `True`, returns 'barrid' as the integer-backed barrid Enum. Defaults to `False`.
 
     Returns:
         pl.DataFrame: A Polars DataFrame containing the benchmark weights for each asset.
@@ -41,9 +44,7 @@ def load_benchmark(
     barra = load_barra_returns(interval=interval, start_date=start_date, end_date=end_date)
 
     # Merge universe and returns
-    benchmark = barra.filter(
-        pl.struct(["date", "barrid"]).is_in(universe.select(["date", "barrid"]).to_struct())
-    )
+    benchmark = barra.join(universe.select(["date", "barrid"]), on=["date", "barrid"], how="semi")
 
     # Get total market cap by day
     total_market_cap = (
@@ -59,4 +60,8 @@ def load_benchmark(
         .select(["date", "barrid", "weight"])
     )
 
+    # Encode barrids
+    if asset_ids:
+        benchmark = encode_barrids(benchmark)
+
     return benchmark
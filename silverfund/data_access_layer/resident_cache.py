@@ -0,0 +1,78 @@
+import os
+from collections import defaultdict
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+from dotenv import load_dotenv
+
+# In-memory copies of Barra year files, keyed by file path
+_resident: dict[Path, pl.DataFrame] = {}
+
+
+def read_parquet(path: Path, columns: list[str] | None = None) -> pl.DataFrame:
+    """Reads a parquet file, serving it from memory when it has been made resident.
+
+    Falls back to reading from disk when the file (or any requested column) is not resident.
+
+    Args:
+        path (Path): The parquet file to read.
+        columns (list[str] | None, optional): The columns to read. Defaults to all columns.
+
+    Returns:
+        pl.DataFrame: The requested columns of the file.
+    """
+    df = _resident.get(path)
+
+    if df is None or (columns is not None and not set(columns).issubset(df.columns)):
+        return pl.read_parquet(path, columns=columns)
+
+    if columns is None:
+        return df
+
+    return df.select(columns)
+
+
+def make_risk_model_resident(dates: list[date]) -> None:
+    """Loads the Barra risk model data for the given dates into memory.
+
+    Exposures, factor covariances, and specific risk are stored one column per date, so only the
+    requested date columns are kept. Asset (total risk) files are kept for the full year so that
+    monthly aggregation sees every trading day.
+
+    Args:
+        dates (list[date]): The dates whose risk model data should be held in memory.
+    """
+    # Paths
+    load_dotenv()
+    parts = os.getenv("ROOT").split("/")
+    home = parts[1]
+    user = parts[2]
+    root_dir = Path(f"/{home}/{user}")
+    folder = root_dir / "groups" / "grp_quant" / "data" / "barra_usslow"
+    asset_folder = root_dir / "groups" / "grp_quant" / "data" / "barra_usslow_asset"
+
+    # Group date columns by year
+    date_columns = defaultdict(list)
+    for date_ in dates:
+        date_columns[date_.year].append(date_.strftime("%Y-%m-%d 00:00:00"))
+
+    for year, columns in date_columns.items():
+        # Wide files (one column per date)
+        for file, key in [
+            (f"exposures_{year}.parquet", "Combined"),
+            (f"factor_covariance_{year}.parquet", "Combined"),
+            (f"spec_risk_{year}.parquet", "Barrid"),
+        ]:
+            path = folder / file
+            available = pl.read_parquet_schema(path).keys()
+            _resident[path] = pl.read_parquet(path, columns=[key] + [col for col in columns if col in available])
+
+        # Long files (one row per date)
+        path = asset_folder / f"asset_{year}.parquet"
+        _resident[path] = pl.read_parquet(path)
+
+
+def clear_resident_data() -> None:
+    """Releases all resident risk model data."""
+    _resident.clear()
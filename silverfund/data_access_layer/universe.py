@@ -2,6 +2,7 @@ from datetime import date
 
 import polars as pl
 
+from silverfund.data_access_layer.asset_ids import encode_barrids
 from silverfund.data_access_layer.russell_consituents import load_russell_constituents
 from silverfund.data_access_layer.trading_days import load_trading_days
 from silverfund.enums import Interval
@@ -12,6 +13,7 @@ def load_universe(
     start_date: date | None = None,
     end_date: date | None = None,
     quiet: bool = True,
+    asset_ids: bool = False,
 ):
     """Loads the universe of Russell index constituents for a given interval and date range.
 
@@ -24,6 +26,7 @@ def load_universe(
         start_date (date, optional): The start date for filtering (default: 1995-07-31).
         end_date (date, optional): The end date for filtering (default: today).
         quiet (bool, optional): If True, disables the tqdm loading bar for trading days.
+        asset_ids (bool, optional): If True, encodes 'barrid' as the integer-backed barrid Enum.
 
     Returns:
         pl.DataFrame: A DataFrame containing the universe of constituents for each trading day.
@@ -68,6 +71,10 @@ def load_universe(
     # Filter
     merged = merged.filter(pl.col("date").is_between(start_date, end_date))
 
+    # Encode barrids
+    if asset_ids:
+        merged = encode_barrids(merged)
+
     # Sort
     merged = merged.sort(["barrid", "date"])
 
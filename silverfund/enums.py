@@ -20,3 +20,10 @@ class FactorGroup(Enum):
     RISK = "risk"
     INDUSTRY = "industry"
     ALL = "all"
+
+
+class MomentumFlavor(Enum):
+    VANILLA = "vanilla"
+    IDIOSYNCRATIC = "idiosyncratic"
+    VOLATILITY_ADJUSTED = "volatility_adjusted"
+    FROG_IN_THE_PAN = "frog_in_the_pan"
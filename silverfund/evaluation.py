@@ -0,0 +1,193 @@
+from dataclasses import dataclass
+
+import numpy as np
+import polars as pl
+
+from silverfund.enums import Interval
+
+
+@dataclass
+class SignalEvaluation:
+    """The results of `evaluate_signals`, as tidy DataFrames ready for plotting.
+
+    Attributes:
+        ic (pl.DataFrame): The rank IC of each signal and horizon on each date ('date', 'signal', 'horizon', 'ic').
+        ic_decay (pl.DataFrame): The IC summary of each signal by horizon ('signal', 'horizon', 'mean_ic',
+            'std_ic', 'ic_ir', 't_stat', 'n_periods').
+        bin_returns (pl.DataFrame): The equal-weighted forward return of each quantile bin ('date', 'signal',
+            'horizon', 'bin', 'return'), with bin 0 holding the lowest signals.
+        spreads (pl.DataFrame): The top minus bottom bin return ('date', 'signal', 'horizon', 'spread').
+        spread_summary (pl.DataFrame): The mean, volatility, and annualized Sharpe ratio of each spread
+            ('signal', 'horizon', 'mean', 'std', 'sharpe', 'n_periods').
+        turnover (pl.DataFrame): The turnover of the bottom and top bins ('date', 'signal', 'side', 'turnover').
+    """
+
+    ic: pl.DataFrame
+    ic_decay: pl.DataFrame
+    bin_returns: pl.DataFrame
+    spreads: pl.DataFrame
+    spread_summary: pl.DataFrame
+    turnover: pl.DataFrame
+
+
+def forward_returns(data: pl.DataFrame, horizons: list[int], return_col: str = "ret", percent: bool = False) -> pl.DataFrame:
+    """Adds the compounded forward return of each horizon.
+
+    All horizons are differences of one cumulative log return per barrid, so the returns are
+    scanned once however many horizons are requested. The forward return of horizon `h` on a row
+    compounds the returns of that row and the next `h - 1` rows of the barrid, so a lagged signal
+    is paired with the return of its own row (horizon 1 is the row's return). Windows with a
+    missing return, or running past the last row of the barrid, are null.
+
+    Args:
+        data (pl.DataFrame): A panel sorted by 'barrid' and 'date' with a return column.
+        horizons (list[int]): The horizons, in periods.
+        return_col (str, optional): The return column. Defaults to "ret".
+        percent (bool, optional): Whether the returns are in percent space. The forward returns are
+            returned in the same space. Defaults to False.
+
+    Returns:
+        pl.DataFrame: The data with a 'fwd_ret_<h>' column per horizon.
+    """
+    scale = 100 if percent else 1
+    cumulative, missing = pl.col("_cumulative_logret"), pl.col("_cumulative_missing")
+    logret = pl.col(return_col).truediv(scale).log1p()
+
+    return (
+        data.with_columns(
+            logret.fill_null(0).cum_sum().over("barrid").alias("_cumulative_logret"),
+            logret.is_null().cum_sum().over("barrid").alias("_cumulative_missing"),
+        )
+        .with_columns(
+            pl.when(_window_sum(missing, h) == 0).then((_window_sum(cumulative, h).exp() - 1).mul(scale)).alias(f"fwd_ret_{h}") for h in horizons
+        )
+        .drop("_cumulative_logret", "_cumulative_missing")
+    )
+
+
+def evaluate_signals(
+    data: pl.DataFrame,
+    signal_cols: list[str],
+    horizons: list[int],
+    return_col: str = "ret",
+    n_bins: int = 10,
+    interval: Interval = Interval.DAILY,
+    percent: bool = False,
+) -> SignalEvaluation:
+    """Evaluates many signals over many horizons.
+
+    Forward returns are computed once for all signals (see `forward_returns`). Signals are
+    unpivoted to long form and binned in one window pass over ('date', 'signal'); the rank ICs of
+    all signals and horizons then come from one `group_by("date")` and the bin returns of all
+    signals and horizons from one `group_by(["date", "signal", "bin"])`.
+
+    Signals should be known at the start of each period (e.g. lagged like `momentum`), so that
+    the forward return of horizon `h` starts on the signal's row. The horizon 1 spread then
+    matches the decile spread of the research scripts' `create_portfolios`.
+
+    Args:
+        data (pl.DataFrame): A panel sorted by 'barrid' and 'date' with the return and signal columns.
+        signal_cols (list[str]): The signals to evaluate.
+        horizons (list[int]): The forward return horizons, in periods (the IC decay is measured across them).
+        return_col (str, optional): The return column. Defaults to "ret".
+        n_bins (int, optional): The number of quantile bins, e.g. 10 for deciles. Defaults to 10.
+        interval (Interval, optional): The frequency of the data, used to annualize Sharpe ratios. Defaults to Interval.DAILY.
+        percent (bool, optional): Whether the returns are in percent space. Defaults to False.
+
+    Returns:
+        SignalEvaluation: The evaluation results.
+    """
+    annual_scale = {Interval.DAILY: 252, Interval.MONTHLY: 12}[interval]
+    fwd_cols = [f"fwd_ret_{h}" for h in horizons]
+
+    # Forward returns
+    data = forward_returns(data.select("date", "barrid", return_col, *signal_cols), horizons, return_col, percent)
+
+    # Rank ICs
+    ic = (
+        data.group_by("date")
+        .agg(pl.corr(signal, fwd, method="spearman").alias(f"{signal}:{h}") for signal in signal_cols for h, fwd in zip(horizons, fwd_cols))
+        .unpivot(index="date", value_name="ic")
+        .with_columns(
+            pl.col("variable").str.split(":").list.first().alias("signal"),
+            pl.col("variable").str.split(":").list.last().cast(pl.Int64).alias("horizon"),
+        )
+        .select("date", "signal", "horizon", pl.col("ic").fill_nan(None))
+        .sort(["signal", "horizon", "date"])
+    )
+
+    ic_decay = (
+        ic.group_by(["signal", "horizon"])
+        .agg(
+            pl.col("ic").mean().alias("mean_ic"),
+            pl.col("ic").std().alias("std_ic"),
+            pl.col("ic").count().alias("n_periods"),
+        )
+        .with_columns((pl.col("mean_ic") / pl.col("std_ic")).alias("ic_ir"))
+        .with_columns((pl.col("ic_ir") * pl.col("n_periods").sqrt()).alias("t_stat"))
+        .select("signal", "horizon", "mean_ic", "std_ic", "ic_ir", "t_stat", "n_periods")
+        .sort(["signal", "horizon"])
+    )
+
+    # Quantile bins of every signal
+    long = (
+        data.unpivot(index=["date", "barrid", *fwd_cols], on=signal_cols, variable_name="signal", value_name="value")
+        .drop_nulls("value")
+        .with_columns(((pl.col("value").rank() - 1) * n_bins / pl.len()).floor().cast(pl.Int32).over(["date", "signal"]).alias("bin"))
+    )
+
+    # Bin returns
+    bin_returns = (
+        long.group_by(["date", "signal", "bin"])
+        .agg(pl.col(fwd_cols).mean())
+        .unpivot(index=["date", "signal", "bin"], variable_name="horizon", value_name="return")
+        .with_columns(pl.col("horizon").str.strip_prefix("fwd_ret_").cast(pl.Int64))
+        .select("date", "signal", "horizon", "bin", "return")
+        .sort(["signal", "horizon", "date", "bin"])
+    )
+
+    # Spreads
+    spreads = (
+        bin_returns.filter(pl.col("bin").is_in([0, n_bins - 1]))
+        .group_by(["date", "signal", "horizon"])
+        .agg((pl.col("return").filter(pl.col("bin") == n_bins - 1).first() - pl.col("return").filter(pl.col("bin") == 0).first()).alias("spread"))
+        .sort(["signal", "horizon", "date"])
+    )
+
+    spread_summary = (
+        spreads.group_by(["signal", "horizon"])
+        .agg(
+            pl.col("spread").mean().alias("mean"),
+            pl.col("spread").std().alias("std"),
+            pl.col("spread").count().alias("n_periods"),
+        )
+        .with_columns((pl.col("mean") / pl.col("std") * (annual_scale / pl.col("horizon")).sqrt()).alias("sharpe"))
+        .select("signal", "horizon", "mean", "std", "sharpe", "n_periods")
+        .sort(["signal", "horizon"])
+    )
+
+    # Turnover of the extreme bins
+    turnover = (
+        long.filter(pl.col("bin").is_in([0, n_bins - 1]))
+        .select("date", "barrid", "signal", "bin")
+        .sort(["signal", "barrid", "date"])
+        .with_columns((pl.col("date").shift(1).over(["signal", "barrid", "bin"]) == _previous_date(data)).alias("_held"))
+        .group_by(["date", "signal", "bin"])
+        .agg((1 - pl.col("_held").fill_null(False).mean()).alias("turnover"))
+        .with_columns(pl.when(pl.col("bin") == 0).then(pl.lit("bottom")).otherwise(pl.lit("top")).alias("side"))
+        .filter(pl.col("date") != data["date"].min())
+        .select("date", "signal", "side", "turnover")
+        .sort(["signal", "side", "date"])
+    )
+
+    return SignalEvaluation(ic, ic_decay, bin_returns, spreads, spread_summary, turnover)
+
+
+def _previous_date(data: pl.DataFrame) -> pl.Expr:
+    dates = data["date"].unique().sort()
+    return pl.col("date").replace_strict(dates, dates.shift(1), default=None)
+
+
+def _window_sum(cumulative: pl.Expr, h: int) -> pl.Expr:
+    # Sum over rows t..t+h-1 of the barrid, null past its last row
+    return (cumulative.shift(-(h - 1)) - cumulative.shift(1, fill_value=0)).over("barrid")
@@ -0,0 +1,211 @@
+import os
+
+import numpy as np
+import polars as pl
+import ray
+
+
+def _regress_chunk(chunk: pl.DataFrame, y_col: str, x_cols: list[str]) -> pl.DataFrame:
+    """
+    Runs the cross-sectional regression of every date in a chunk.
+
+    The Gram matrix X'X and moment vector X'y of each date are computed with one matrix product
+    per date, and all dates are then solved together as a stack of K x K systems.
+
+    Args:
+        chunk (pl.DataFrame): Complete rows sorted by date.
+        y_col (str): The dependent variable.
+        x_cols (list[str]): The regressors, including 'intercept' if used.
+
+    Returns:
+        pl.DataFrame: The per-date results in long form (see `cross_sectional_regressions`).
+    """
+    X = chunk.select(x_cols).to_numpy().astype(np.float64)
+    y = chunk[y_col].to_numpy().astype(np.float64)
+
+    # Date blocks
+    dates = chunk["date"].unique(maintain_order=True)
+    counts = chunk["date"].unique_counts().to_numpy().astype(np.int64)
+    bounds = np.concatenate([[0], np.cumsum(counts)])
+
+    # Stacked normal equations
+    gram = np.stack([X[a:b].T @ X[a:b] for a, b in zip(bounds[:-1], bounds[1:])])
+    moments = np.stack([X[a:b].T @ y[a:b] for a, b in zip(bounds[:-1], bounds[1:])])
+    squares = np.add.reduceat(y**2, bounds[:-1])
+    sums = np.add.reduceat(y, bounds[:-1])
+
+    # Solve (the pseudo-inverse tolerates collinear regressors such as a full set of industries)
+    gram_inv = np.linalg.pinv(gram, hermitian=True)
+    slopes = np.einsum("dij,dj->di", gram_inv, moments)
+    rank = np.linalg.matrix_rank(gram, hermitian=True)
+
+    # Residual variance and standard errors
+    residual_ss = np.maximum(squares - np.einsum("di,di->d", slopes, moments), 0)
+    total_ss = squares - sums**2 / counts
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sigma2 = residual_ss / (counts - rank)
+        std_errors = np.sqrt(sigma2[:, None] * np.diagonal(gram_inv, axis1=1, axis2=2))
+        r_squared = 1 - residual_ss / total_ss
+
+    dof_ok = (counts > rank)[:, None]
+    std_errors = np.where(dof_ok, std_errors, np.nan)
+
+    n_dates, n_vars = slopes.shape
+
+    return pl.DataFrame(
+        {
+            "date": dates.gather(np.repeat(np.arange(n_dates), n_vars)),
+            "variable": np.tile(x_cols, n_dates),
+            "slope": slopes.ravel(),
+            "std_error": std_errors.ravel(),
+            "n_obs": np.repeat(counts, n_vars),
+            "r_squared": np.repeat(r_squared, n_vars),
+        }
+    ).with_columns(
+        (pl.col("slope") / pl.col("std_error")).alias("t_stat"),
+        pl.col("std_error", "r_squared").fill_nan(None),
+    )
+
+
+@ray.remote
+def _regress_chunk_remote(chunk: pl.DataFrame, y_col: str, x_cols: list[str]) -> pl.DataFrame:
+    return _regress_chunk(chunk, y_col, x_cols)
+
+
+def cross_sectional_regressions(
+    data: pl.DataFrame,
+    y_col: str,
+    x_cols: list[str],
+    exposures: pl.DataFrame | None = None,
+    intercept: bool = True,
+    n_cpus: int | None = 1,
+) -> pl.DataFrame:
+    """
+    Runs an OLS regression of `y_col` on the regressors across assets on every date.
+
+    The data is split into calendar-year chunks. Each chunk solves all of its dates as a stack of
+    normal equations, and with more than one CPU the chunks are solved in parallel Ray tasks.
+
+    Rows with a missing value in the dependent variable or any regressor of `data` are dropped.
+    Missing exposures are filled with 0, as Barra stores an asset's industries outside its own as
+    nulls, and so are the exposures of assets without an exposures row on a date.
+
+    Args:
+        data (pl.DataFrame): A panel with 'date', 'barrid', `y_col`, and `x_cols` (e.g. forward returns and signals).
+        y_col (str): The dependent variable.
+        x_cols (list[str]): The regressors in `data`.
+        exposures (pl.DataFrame, optional): Wide factor exposures with 'date', 'barrid', and one column per
+            factor (as stored by `data_access_layer_v2.exposures`). Joined to `data` and used as additional regressors.
+        intercept (bool, optional): Whether to add an intercept. Defaults to True. Leave it out when the
+            exposures include a full set of industries, which already span a constant.
+        n_cpus (int, optional): The number of CPU cores to use. Defaults to 1 (no Ray); None uses all cores.
+
+    Returns:
+        pl.DataFrame: One row per date and regressor with 'date', 'variable', 'slope', 'std_error', 'n_obs',
+            'r_squared', and 't_stat' columns, sorted by date. Empty if no row is complete.
+    """
+    x_cols = list(x_cols)
+    data_cols = [y_col, *x_cols]
+
+    # Exposures
+    if exposures is not None:
+        factors = [col for col in exposures.columns if col not in ("date", "barrid") and col not in x_cols]
+        exposures = exposures.select("date", pl.col("barrid").cast(data.schema["barrid"], strict=False), *factors).drop_nulls("barrid")
+        data = data.join(exposures, on=["date", "barrid"], how="left").with_columns(pl.col(factors).fill_null(0))
+        x_cols += factors
+
+    if intercept:
+        data = data.with_columns(pl.lit(1.0).alias("intercept"))
+        x_cols = ["intercept"] + x_cols
+
+    # Complete rows sorted by date
+    data = data.select("date", y_col, *x_cols).drop_nulls(data_cols).sort("date")
+
+    # Year chunks
+    chunks = data.with_columns(pl.col("date").dt.year().alias("_year")).partition_by("_year", maintain_order=True, include_key=False)
+
+    # No complete rows
+    if len(chunks) == 0:
+        return pl.DataFrame(
+            schema={
+                "date": data.schema["date"],
+                "variable": pl.String,
+                "slope": pl.Float64,
+                "std_error": pl.Float64,
+                "n_obs": pl.Int64,
+                "r_squared": pl.Float64,
+                "t_stat": pl.Float64,
+            }
+        )
+
+    n_cpus = n_cpus or os.cpu_count()
+    n_cpus = min(len(chunks), n_cpus)
+
+    if n_cpus <= 1:
+        results = [_regress_chunk(chunk, y_col, x_cols) for chunk in chunks]
+    else:
+        ray.init(ignore_reinit_error=True, num_cpus=n_cpus)
+
+        try:
+            results = ray.get([_regress_chunk_remote.remote(chunk, y_col, x_cols) for chunk in chunks])
+        finally:
+            ray.shutdown()
+
+    return pl.concat(results).sort("date", maintain_order=True)
+
+
+def fama_macbeth(regressions: pl.DataFrame, lags: int = 0) -> pl.DataFrame:
+    """
+    Aggregates per-date slopes into Fama-MacBeth estimates.
+
+    The estimate of each regressor is the time-series mean of its per-date slopes. Its standard
+    error is the standard deviation of the slopes over the square root of the number of dates,
+    with a Newey-West correction for `lags` lags of autocorrelation (e.g. for overlapping
+    multi-day forward returns).
+
+    Args:
+        regressions (pl.DataFrame): The output of `cross_sectional_regressions`.
+        lags (int, optional): The number of Newey-West lags. Defaults to 0.
+
+    Returns:
+        pl.DataFrame: One row per regressor with 'variable', 'slope', 'std_error', 't_stat', 'n_periods',
+            and 'mean_r_squared' columns.
+    """
+    slopes = regressions.pivot(on="variable", index="date", values="slope").sort("date")
+    variables = [col for col in slopes.columns if col != "date"]
+    values = slopes.select(variables).to_numpy().astype(np.float64)
+
+    rows = []
+    for i, variable in enumerate(variables):
+        series = values[:, i]
+        series = series[~np.isnan(series)]
+        n_periods = len(series)
+
+        deviations = series - series.mean()
+        variance = deviations @ deviations / n_periods
+
+        for lag in range(1, min(lags, n_periods - 1) + 1):
+            weight = 1 - lag / (lags + 1)
+            variance += 2 * weight * (deviations[lag:] @ deviations[:-lag]) / n_periods
+
+        # Small-sample correction so that lags=0 uses the sample standard deviation
+        variance *= n_periods / (n_periods - 1) if n_periods > 1 else np.nan
+
+        rows.append(
+            {
+                "variable": variable,
+                "slope": series.mean(),
+                "std_error": np.sqrt(variance / n_periods),
+                "n_periods": n_periods,
+            }
+        )
+
+    mean_r_squared = regressions.group_by("variable").agg(pl.col("r_squared").mean().alias("mean_r_squared"))
+
+    return (
+        pl.DataFrame(rows)
+        .with_columns((pl.col("slope") / pl.col("std_error")).alias("t_stat"))
+        .join(mean_r_squared, on="variable", how="left")
+        .select("variable", "slope", "std_error", "t_stat", "n_periods", "mean_r_squared")
+    )
@@ -0,0 +1,105 @@
+import hashlib
+import inspect
+from datetime import date
+from enum import Enum
+from functools import partial
+from typing import Any
+
+import numpy as np
+import polars as pl
+
+
+def fingerprint_callable(func: Any) -> str:
+    """Creates a stable description of a callable and its bound arguments.
+
+    `functools.partial` objects are unwrapped so that their bound positional and keyword arguments
+    become part of the fingerprint. The source code of the underlying function is included, so
+    editing a function changes its fingerprint.
+
+    Args:
+        func (Any): The callable to fingerprint.
+
+    Returns:
+        str: A string that changes whenever the callable or its bound arguments change.
+    """
+    if isinstance(func, partial):
+        args = [fingerprint_value(arg) for arg in func.args]
+        keywords = [f"{key}={fingerprint_value(func.keywords[key])}" for key in sorted(func.keywords)]
+        return f"partial({fingerprint_callable(func.func)}, {', '.join(args + keywords)})"
+
+    name = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = ""
+
+    return f"{name}:{hashlib.sha256(source.encode()).hexdigest()}"
+
+
+def fingerprint_value(value: Any) -> str:
+    """Creates a stable description of an argument value.
+
+    Args:
+        value (Any): The value to fingerprint.
+
+    Returns:
+        str: A string that changes whenever the value changes.
+    """
+    if callable(value) and not isinstance(value, type):
+        return fingerprint_callable(value)
+
+    if isinstance(value, Enum):
+        return f"{type(value).__name__}.{value.name}"
+
+    if isinstance(value, date):
+        return value.isoformat()
+
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(fingerprint_value(item) for item in value)}]"
+
+    if isinstance(value, pl.DataFrame):
+        return fingerprint_frame(value)
+
+    return repr(value)
+
+
+def fingerprint_frame(df: pl.DataFrame) -> str:
+    """Creates a content hash of a Polars DataFrame.
+
+    Args:
+        df (pl.DataFrame): The DataFrame to fingerprint.
+
+    Returns:
+        str: A hex digest that changes whenever the schema or any row of the DataFrame changes.
+    """
+    digest = hashlib.sha256(str(df.schema).encode())
+
+    # Hash the column values themselves (`hash_rows` is not stable across Polars versions)
+    for series in df.get_columns():
+        if series.dtype in (pl.Categorical, pl.Enum):
+            series = series.cast(pl.String)
+
+        digest.update(series.is_null().to_numpy().tobytes())
+
+        if series.dtype == pl.String:
+            series = series.fill_null("")
+            digest.update(series.str.len_bytes().to_numpy().tobytes())
+            digest.update("".join(series.to_list()).encode())
+        else:
+            digest.update(np.ascontiguousarray(series.to_physical().fill_null(0).to_numpy()).tobytes())
+
+    return digest.hexdigest()
+
+
+def hash_key(*parts: Any) -> str:
+    """Combines fingerprinted parts into a short cache key.
+
+    Args:
+        *parts (Any): The values identifying a result.
+
+    Returns:
+        str: A 16 character hex key.
+    """
+    digest = hashlib.sha256("|".join(fingerprint_value(part) for part in parts).encode())
+    return digest.hexdigest()[:16]
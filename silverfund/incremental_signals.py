@@ -0,0 +1,298 @@
+from datetime import date
+from pathlib import Path
+from typing import Protocol
+
+import numpy as np
+import polars as pl
+
+from silverfund.asset_index import AssetIndex
+from silverfund.enums import MomentumFlavor
+from silverfund.records import Signal
+from silverfund.signals import MomentumSpec
+
+
+class IncrementalSignal(Protocol):
+    """Protocol for signals that are updated one date at a time from persisted rolling state.
+
+    `update` is given the rows of a single date, in the same form the batch signal constructor
+    receives, and returns the signals of those rows.
+    """
+
+    last_date: date | None
+
+    def update(self, data: pl.DataFrame) -> Signal: ...
+
+
+class MomentumState:
+    """
+    The rolling state of a momentum variant (see `MomentumSpec` and `momentum_signals`).
+
+    Each barrid keeps a ring buffer of its last `window + skip` rows and running sums over the
+    `window` oldest of them, so adding a date only touches the rows of that date: one update is
+    O(N) for N assets, independent of the window length. Windows count the rows of each barrid,
+    so the signals equal those of `momentum_signals` over the full history up to rounding.
+
+    Attributes:
+        spec (MomentumSpec): The momentum variant.
+        signal_name (str): The name of the signal column.
+        last_date (date | None): The last date applied to the state.
+        _index (AssetIndex): The barrid of each state row.
+        _buffers (dict[str, np.ndarray]): An N x (window + skip) ring buffer per input channel, NaN where missing.
+        _sums (dict[str, np.ndarray]): The running sum of each channel over the window.
+        _counts (np.ndarray): The number of non-missing rows in each barrid's window.
+        _seen (np.ndarray): The number of rows seen for each barrid.
+    """
+
+    def __init__(
+        self,
+        spec: MomentumSpec,
+        signal_name: str | None = None,
+        return_col: str = "ret",
+        specific_return_col: str = "specific_return",
+        percent: bool = False,
+    ) -> None:
+        """
+        Initializes an empty MomentumState instance.
+
+        Args:
+            spec (MomentumSpec): The momentum variant.
+            signal_name (str, optional): The name of the signal column. Defaults to `spec.name`.
+            return_col (str, optional): The column of total returns. Defaults to "ret".
+            specific_return_col (str, optional): The column of specific returns. Defaults to "specific_return".
+            percent (bool, optional): Whether the returns are in percent space. Defaults to False.
+        """
+        self.spec = spec
+        self.signal_name = signal_name or spec.name
+        self.last_date = None
+        self._return_col = return_col
+        self._specific_return_col = specific_return_col
+        self._percent = percent
+
+        self._index = AssetIndex([])
+        self._buffers = {channel: np.empty((0, self._length)) for channel in self._channels}
+        self._sums = {channel: np.empty(0) for channel in self._channels}
+        self._counts = np.empty(0, dtype=np.int64)
+        self._seen = np.empty(0, dtype=np.int64)
+
+    @property
+    def _length(self) -> int:
+        return self.spec.window + self.spec.skip
+
+    @property
+    def _channels(self) -> list[str]:
+        match self.spec.flavor:
+            case MomentumFlavor.VANILLA:
+                return ["logret"]
+            case MomentumFlavor.IDIOSYNCRATIC:
+                return ["spec_logret"]
+            case MomentumFlavor.VOLATILITY_ADJUSTED:
+                return ["logret", "ret", "ret_squared"]
+            case MomentumFlavor.FROG_IN_THE_PAN:
+                return ["logret", "positive", "negative"]
+
+    @classmethod
+    def from_history(cls, data: pl.DataFrame, spec: MomentumSpec, **kwargs) -> "MomentumState":
+        """
+        Builds a state by applying the history in `data` one date at a time.
+
+        Args:
+            data (pl.DataFrame): Asset return data with at least `spec.lookback` rows per barrid.
+            spec (MomentumSpec): The momentum variant.
+            **kwargs: Passed to `MomentumState`.
+
+        Returns:
+            MomentumState: The state after the last date of `data`.
+        """
+        state = cls(spec, **kwargs)
+
+        for day in data.sort(["date", "barrid"]).partition_by("date", maintain_order=True):
+            state.update(day)
+
+        return state
+
+    def _inputs(self, data: pl.DataFrame) -> dict[str, np.ndarray]:
+        scale = 100 if self._percent else 1
+        ret = data[self._return_col].cast(pl.Float64).fill_null(np.nan).to_numpy() / scale
+
+        inputs = {"logret": _log_return(ret), "ret": ret, "ret_squared": ret**2}
+
+        if "spec_logret" in self._channels:
+            specific_ret = data[self._specific_return_col].cast(pl.Float64).fill_null(np.nan).to_numpy() / scale
+            inputs["spec_logret"] = _log_return(specific_ret)
+
+        with np.errstate(invalid="ignore"):
+            inputs["positive"] = np.where(np.isnan(ret), np.nan, ret > 0)
+            inputs["negative"] = np.where(np.isnan(ret), np.nan, ret < 0)
+
+        return {channel: inputs[channel] for channel in self._channels}
+
+    def _add_barrids(self, barrids: pl.Series) -> None:
+        new_barrids = barrids.filter(pl.Series(self._index.positions(barrids) < 0))
+
+        if len(new_barrids) == 0:
+            return
+
+        n = len(new_barrids)
+        self._index = AssetIndex(self._index.barrids + new_barrids.to_list())
+        self._buffers = {c: np.vstack([b, np.full((n, self._length), np.nan)]) for c, b in self._buffers.items()}
+        self._sums = {c: np.concatenate([s, np.zeros(n)]) for c, s in self._sums.items()}
+        self._counts = np.concatenate([self._counts, np.zeros(n, dtype=np.int64)])
+        self._seen = np.concatenate([self._seen, np.zeros(n, dtype=np.int64)])
+
+    def update(self, data: pl.DataFrame) -> Signal:
+        """
+        Applies one date of data to the state and computes that date's signals.
+
+        Args:
+            data (pl.DataFrame): The rows of a single date, with 'date', 'barrid', and return columns.
+                Rows should be filtered exactly as the batch signal's input would be.
+
+        Returns:
+            Signal: The signal of each row of `data`.
+
+        Raises:
+            ValueError: If `data` spans several dates or is not after the last applied date.
+        """
+        if data["date"].n_unique() != 1:
+            raise ValueError("MomentumState.update expects the rows of a single date")
+
+        date_ = data["date"][0]
+
+        if self.last_date is not None and date_ <= self.last_date:
+            raise ValueError(f"Date {date_} is not after the last applied date {self.last_date}")
+
+        # Positions
+        self._add_barrids(data["barrid"].cast(pl.String))
+        rows = self._index.positions(data["barrid"])
+
+        window, skip, length = self.spec.window, self.spec.skip, self._length
+        seen = self._seen[rows]
+        slot = seen % length
+
+        # Rows leaving the window (length rows back) and entering it (skip rows back, after the write)
+        leaving_valid = seen >= length
+        entering_slot = (seen - skip) % length
+        entering_valid = seen >= skip
+
+        for channel, values in self._inputs(data).items():
+            buffer, sums = self._buffers[channel], self._sums[channel]
+
+            leaving = np.where(leaving_valid, buffer[rows, slot], np.nan)
+            buffer[rows, slot] = values
+            entering = np.where(entering_valid, buffer[rows, entering_slot], np.nan)
+
+            sums[rows] += np.nan_to_num(entering) - np.nan_to_num(leaving)
+
+            # A row missing in the first channel makes the window incomplete, so one count serves all channels
+            if channel == self._channels[0]:
+                self._counts[rows] += (~np.isnan(entering)).astype(np.int64) - (~np.isnan(leaving))
+
+        self._seen[rows] = seen + 1
+        self.last_date = date_
+
+        # Signal
+        complete = (self._seen[rows] >= length) & (self._counts[rows] == window)
+        signal = self._signal(rows, complete)
+
+        return Signal(
+            pl.DataFrame({"date": data["date"], "barrid": data["barrid"], self.signal_name: signal}).with_columns(
+                pl.col(self.signal_name).fill_nan(None)
+            ),
+            self.signal_name,
+        )
+
+    def _signal(self, rows: np.ndarray, complete: np.ndarray) -> np.ndarray:
+        window = self.spec.window
+        sums = {channel: np.where(complete, s[rows], np.nan) for channel, s in self._sums.items()}
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            match self.spec.flavor:
+                case MomentumFlavor.VANILLA:
+                    return sums["logret"]
+
+                case MomentumFlavor.IDIOSYNCRATIC:
+                    return sums["spec_logret"]
+
+                case MomentumFlavor.VOLATILITY_ADJUSTED:
+                    variance = (sums["ret_squared"] - sums["ret"] ** 2 / window) / (window - 1)
+                    return np.where(variance > 0, sums["logret"] / np.sqrt(np.maximum(variance, 0)), np.nan)
+
+                case MomentumFlavor.FROG_IN_THE_PAN:
+                    momentum_ = sums["logret"]
+                    discreteness = np.sign(momentum_) * (sums["negative"] - sums["positive"]) / window
+                    return _zscore(momentum_) * _zscore(discreteness)
+
+    def save(self, path: str | Path) -> None:
+        """
+        Persists the state to an `.npz` file, written under a temporary name and renamed into place.
+
+        Args:
+            path (str | Path): The file to write.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".tmp.npz")
+
+        np.savez(
+            temp_path,
+            flavor=self.spec.flavor.value,
+            window=self.spec.window,
+            skip=self.spec.skip,
+            signal_name=self.signal_name,
+            return_col=self._return_col,
+            specific_return_col=self._specific_return_col,
+            percent=self._percent,
+            last_date="" if self.last_date is None else self.last_date.isoformat(),
+            barrids=np.array(self._index.barrids, dtype=str),
+            counts=self._counts,
+            seen=self._seen,
+            **{f"buffer_{c}": b for c, b in self._buffers.items()},
+            **{f"sum_{c}": s for c, s in self._sums.items()},
+        )
+        temp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "MomentumState":
+        """
+        Loads a state persisted with `save`.
+
+        Args:
+            path (str | Path): The file to read.
+
+        Returns:
+            MomentumState: The persisted state.
+        """
+        with np.load(path) as file:
+            spec = MomentumSpec(MomentumFlavor(str(file["flavor"])), int(file["window"]), int(file["skip"]))
+            state = cls(
+                spec,
+                signal_name=str(file["signal_name"]),
+                return_col=str(file["return_col"]),
+                specific_return_col=str(file["specific_return_col"]),
+                percent=bool(file["percent"]),
+            )
+
+            last_date = str(file["last_date"])
+            state.last_date = date.fromisoformat(last_date) if last_date else None
+            state._index = AssetIndex(file["barrids"].tolist())
+            state._counts = file["counts"]
+            state._seen = file["seen"]
+            state._buffers = {c: file[f"buffer_{c}"] for c in state._channels}
+            state._sums = {c: file[f"sum_{c}"] for c in state._channels}
+
+        return state
+
+
+def _log_return(ret: np.ndarray) -> np.ndarray:
+    # Returns of -100% or less have no log return and count as missing, as in `momentum_signals`
+    with np.errstate(invalid="ignore"):
+        return np.log1p(np.where(ret > -1, ret, np.nan))
+
+
+def _zscore(values: np.ndarray) -> np.ndarray:
+    # Undefined for fewer than two values or no dispersion (compared directly, as the mean of equal values can round)
+    if np.count_nonzero(~np.isnan(values)) < 2 or np.nanmax(values) == np.nanmin(values):
+        return np.full_like(values, np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (values - np.nanmean(values)) / np.nanstd(values, ddof=1)
@@ -36,6 +36,12 @@ class SlackLogConfig:
     def to_terminal_message(self) -> str:
         return f"The job `{self.job_name}`, initiated by <@{self.slack_member_id}>, has successfully completed.\n"
 
+    def to_failure_message(self, error: Exception) -> str:
+        return (
+            f"The job `{self.job_name}`, initiated by <@{self.slack_member_id}>, has failed.\n"
+            f"```{error}```"
+        )
+
 
 def send_message_to_slack(message: str) -> None:
     """
@@ -0,0 +1,357 @@
+from datetime import date
+
+import numpy as np
+import polars as pl
+from scipy.stats import rankdata
+
+import silverfund.data_access_layer as dal
+from silverfund.asset_index import AssetIndex
+from silverfund.enums import Interval
+from silverfund.records import Signal
+
+
+def prefix_sum(values: np.ndarray) -> np.ndarray:
+    """Computes the prefix sum of an array along the first axis.
+
+    Args:
+        values (np.ndarray): A T x N array without NaNs.
+
+    Returns:
+        np.ndarray: A (T + 1) x N array whose row t is the sum of rows 0 through t - 1, so row 0 is zero.
+    """
+    prefix = np.zeros((values.shape[0] + 1,) + values.shape[1:])
+    np.cumsum(values, axis=0, out=prefix[1:])
+    return prefix
+
+
+def lagged_window_sum(prefix: np.ndarray, window: int, skip: int = 0) -> np.ndarray:
+    """Computes trailing window sums that end `skip` rows back from a prefix sum.
+
+    Each window sum is the difference of two rows of the prefix sum, so the cost does not depend on
+    the window length and one prefix sum serves any number of windows and skips. Windows that start
+    before the first row are truncated, and windows that end before the first row are empty (zero).
+
+    Args:
+        prefix (np.ndarray): A (T + 1) x N prefix sum from `prefix_sum`.
+        window (int): The number of rows in each window.
+        skip (int, optional): The number of rows between the end of each window and its row. Defaults to 0.
+
+    Returns:
+        np.ndarray: A T x N array whose row t is the sum of rows t - skip - window + 1 through t - skip.
+    """
+    upper = np.clip(np.arange(1, prefix.shape[0]) - skip, 0, None)
+    lower = np.clip(upper - window, 0, None)
+
+    return prefix[upper] - prefix[lower]
+
+
+def window_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Computes trailing window sums along the first axis from a prefix sum.
+
+    Args:
+        values (np.ndarray): A T x N array without NaNs.
+        window (int): The number of rows in each window.
+
+    Returns:
+        np.ndarray: A T x N array whose row t is the sum of rows t - window + 1 through t.
+    """
+    return lagged_window_sum(prefix_sum(values), window)
+
+
+class ReturnsPanel:
+    """
+    A dense T x N panel of values indexed by date (rows) and barrid (columns).
+
+    Missing observations are NaN, and `mask` marks the observed cells. Non-finite values (such as the
+    log of a -100% return) are stored as NaN, so they count as missing. Rolling kernels work along
+    the time axis using prefix sums, so their cost does not depend on the window length, and
+    cross-sectional kernels work along the asset axis.
+
+    Windows and shifts are measured in panel dates. Dates on which an asset is missing count toward
+    its windows, unlike a row-based `.over("barrid")` window over a long frame.
+
+    Attributes:
+        values (np.ndarray): The T x N array of values.
+        dates (pl.Series): The date of each row, ascending.
+        index (AssetIndex): The barrid of each column.
+    """
+
+    def __init__(self, values: np.ndarray, dates: pl.Series, index: AssetIndex) -> None:
+        """
+        Initializes a ReturnsPanel instance.
+
+        Args:
+            values (np.ndarray): The T x N array of values, NaN where missing. Infinite values are treated as missing.
+            dates (pl.Series): The date of each row, ascending.
+            index (AssetIndex): The barrid of each column.
+
+        Raises:
+            ValueError: If the shape of the values does not match the indexes.
+        """
+        if values.shape != (len(dates), len(index)):
+            raise ValueError(f"Panel values have shape {values.shape}, expected: {(len(dates), len(index))}")
+
+        values = np.asarray(values, dtype=np.float64)
+
+        self.values = np.where(np.isfinite(values), values, np.nan)
+        self.dates = dates.alias("date")
+        self.index = index
+
+    @classmethod
+    def from_frame(cls, df: pl.DataFrame, column: str) -> "ReturnsPanel":
+        """
+        Builds a panel from a long DataFrame with 'date' and 'barrid' columns.
+
+        Args:
+            df (pl.DataFrame): The long data, with at most one row per date and barrid.
+            column (str): The column to place in the panel.
+
+        Returns:
+            ReturnsPanel: The panel, with dates and barrids in ascending order.
+        """
+        dates = df["date"].unique().sort()
+        index = AssetIndex(df["barrid"].cast(pl.String).unique().sort())
+
+        # Positions
+        rows = df["date"].replace_strict(dates, np.arange(len(dates)), return_dtype=pl.Int64).to_numpy()
+        cols = index.positions(df["barrid"])
+
+        # Scatter
+        values = np.full((len(dates), len(index)), np.nan)
+        values[rows, cols] = df[column].cast(pl.Float64).fill_null(np.nan).to_numpy()
+
+        return cls(values, dates, index)
+
+    @classmethod
+    def from_barra_returns(
+        cls, interval: Interval, start_date: date | None = None, end_date: date | None = None, column: str = "ret"
+    ) -> "ReturnsPanel":
+        """
+        Builds a panel from `dal.load_barra_returns`.
+
+        Args:
+            interval (Interval): The time interval of the returns.
+            start_date (date, optional): The start date of the data.
+            end_date (date, optional): The end date of the data.
+            column (str, optional): The column to place in the panel. Defaults to "ret".
+
+        Returns:
+            ReturnsPanel: The panel of Barra returns (in decimal space).
+        """
+        df = dal.load_barra_returns(interval=interval, start_date=start_date, end_date=end_date)
+        return cls.from_frame(df, column)
+
+    @classmethod
+    def from_assets(cls, start_date: date, end_date: date, column: str = "return", in_universe: bool = True) -> "ReturnsPanel":
+        """
+        Builds a panel from `data_access_layer_v2.assets.load`.
+
+        Args:
+            start_date (date): The start date of the data.
+            end_date (date): The end date of the data.
+            column (str, optional): The column to place in the panel. Defaults to "return".
+            in_universe (bool, optional): Whether to keep only in-universe assets. Defaults to True.
+
+        Returns:
+            ReturnsPanel: The panel of the column as stored (returns are in percent space).
+        """
+        # Imported here because the v2 tables resolve their paths at import time
+        import silverfund.data_access_layer_v2 as dal_v2
+
+        df = dal_v2.assets.load(start_date, end_date, in_universe, columns=["date", "barrid", column])
+        return cls.from_frame(df, column)
+
+    @property
+    def mask(self) -> np.ndarray:
+        """A T x N boolean array marking observed (non-NaN) cells."""
+        return ~np.isnan(self.values)
+
+    def with_values(self, values: np.ndarray) -> "ReturnsPanel":
+        """
+        Creates a panel with the same indexes and new values.
+
+        Args:
+            values (np.ndarray): The T x N array of values.
+
+        Returns:
+            ReturnsPanel: The new panel.
+        """
+        return ReturnsPanel(values, self.dates, self.index)
+
+    def _binary(self, other: "ReturnsPanel | float", op) -> "ReturnsPanel":
+        other_values = other.values if isinstance(other, ReturnsPanel) else other
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.with_values(op(self.values, other_values))
+
+    def __add__(self, other: "ReturnsPanel | float") -> "ReturnsPanel":
+        return self._binary(other, np.add)
+
+    def __sub__(self, other: "ReturnsPanel | float") -> "ReturnsPanel":
+        return self._binary(other, np.subtract)
+
+    def __mul__(self, other: "ReturnsPanel | float") -> "ReturnsPanel":
+        return self._binary(other, np.multiply)
+
+    def __truediv__(self, other: "ReturnsPanel | float") -> "ReturnsPanel":
+        return self._binary(other, np.divide)
+
+    def log1p(self) -> "ReturnsPanel":
+        """Returns the panel of log(1 + value), e.g. log returns from decimal returns. Values of -1 or less become missing."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.with_values(np.log1p(self.values))
+
+    def shift(self, periods: int = 1) -> "ReturnsPanel":
+        """
+        Shifts the panel forward in time, so row t holds the value of row t - periods.
+
+        Args:
+            periods (int, optional): The number of dates to shift by. Defaults to 1.
+
+        Returns:
+            ReturnsPanel: The shifted panel, NaN in the first `periods` rows.
+        """
+        values = np.full_like(self.values, np.nan)
+
+        if periods >= 0:
+            values[periods:] = self.values[: len(self.values) - periods]
+        else:
+            values[:periods] = self.values[-periods:]
+
+        return self.with_values(values)
+
+    def rolling_count(self, window: int) -> "ReturnsPanel":
+        """
+        Counts the observed values in each trailing window.
+
+        Args:
+            window (int): The number of dates in each window.
+
+        Returns:
+            ReturnsPanel: The number of observed values in each window.
+        """
+        return self.with_values(window_sum(self.mask.astype(np.float64), window))
+
+    def rolling_sum(self, window: int, min_periods: int | None = None) -> "ReturnsPanel":
+        """
+        Sums the observed values in each trailing window.
+
+        Args:
+            window (int): The number of dates in each window.
+            min_periods (int, optional): The observations required for a valid sum. Defaults to `window`.
+
+        Returns:
+            ReturnsPanel: The window sums, NaN where fewer than `min_periods` values were observed.
+        """
+        min_periods = window if min_periods is None else min_periods
+
+        mask = self.mask
+        counts = window_sum(mask.astype(np.float64), window)
+        sums = window_sum(np.where(mask, self.values, 0), window)
+
+        return self.with_values(np.where(counts >= min_periods, sums, np.nan))
+
+    def rolling_mean(self, window: int, min_periods: int | None = None) -> "ReturnsPanel":
+        """
+        Averages the observed values in each trailing window.
+
+        Args:
+            window (int): The number of dates in each window.
+            min_periods (int, optional): The observations required for a valid mean. Defaults to `window`.
+
+        Returns:
+            ReturnsPanel: The window means, NaN where fewer than `min_periods` values were observed.
+        """
+        return self.rolling_sum(window, min_periods) / self.rolling_count(window)
+
+    def rolling_std(self, window: int, min_periods: int | None = None, ddof: int = 1) -> "ReturnsPanel":
+        """
+        Computes the standard deviation of the observed values in each trailing window.
+
+        Args:
+            window (int): The number of dates in each window.
+            min_periods (int, optional): The observations required for a valid value. Defaults to `window`.
+            ddof (int, optional): The delta degrees of freedom. Defaults to 1.
+
+        Returns:
+            ReturnsPanel: The window standard deviations, NaN where fewer than `min_periods` values were observed.
+        """
+        min_periods = window if min_periods is None else min_periods
+
+        mask = self.mask
+        values = np.where(mask, self.values, 0)
+        counts = window_sum(mask.astype(np.float64), window)
+        sums = window_sum(values, window)
+        squares = window_sum(values**2, window)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variance = (squares - sums**2 / counts) / (counts - ddof)
+
+        valid = (counts >= min_periods) & (counts > ddof)
+
+        return self.with_values(np.where(valid, np.sqrt(np.maximum(variance, 0)), np.nan))
+
+    def zscore(self) -> "ReturnsPanel":
+        """
+        Standardizes each date's values across assets (sample standard deviation).
+
+        Returns:
+            ReturnsPanel: The cross-sectional z-scores.
+        """
+        mask = self.mask
+        values = np.where(mask, self.values, 0)
+        counts = mask.sum(axis=1, keepdims=True)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = values.sum(axis=1, keepdims=True) / counts
+            deviations = np.where(mask, values - mean, 0)
+            std = np.sqrt((deviations**2).sum(axis=1, keepdims=True) / (counts - 1))
+            scores = deviations / std
+
+        return self.with_values(np.where(mask & np.isfinite(scores), scores, np.nan))
+
+    def rank(self) -> "ReturnsPanel":
+        """
+        Ranks each date's values across assets, averaging ties.
+
+        Returns:
+            ReturnsPanel: The cross-sectional ranks, from 1 to the number of observed assets.
+        """
+        return self.with_values(rankdata(self.values, axis=1, nan_policy="omit"))
+
+    def to_frame(self, name: str, mask: np.ndarray | None = None) -> pl.DataFrame:
+        """
+        Converts the panel to a long DataFrame sorted by barrid and date.
+
+        Args:
+            name (str): The name of the value column.
+            mask (np.ndarray, optional): The cells to include. Defaults to the observed cells, so passing
+                the mask of the input panel keeps rows whose output is missing.
+
+        Returns:
+            pl.DataFrame: A DataFrame with 'date', 'barrid', and `name` columns.
+        """
+        mask = self.mask if mask is None else mask
+
+        # Barrid-major order matches the canonical record order
+        cols, rows = np.nonzero(mask.T)
+
+        return pl.DataFrame(
+            {
+                "date": self.dates.gather(rows),
+                "barrid": pl.Series(self.index.barrids).gather(cols),
+                name: self.values[rows, cols],
+            }
+        ).with_columns(pl.col(name).fill_nan(None))
+
+    def to_signal(self, name: str, mask: np.ndarray | None = None) -> Signal:
+        """
+        Converts the panel to a Signal record.
+
+        Args:
+            name (str): The name of the signal column.
+            mask (np.ndarray, optional): The cells to include. Defaults to the observed cells.
+
+        Returns:
+            Signal: The signal, with missing values as nulls.
+        """
+        return Signal(self.to_frame(name, mask), name)
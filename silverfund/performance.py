@@ -1,13 +1,18 @@
+from functools import cached_property
+from pathlib import Path
+
 import matplotlib.pyplot as plt
 import numpy as np
 import polars as pl
 import seaborn as sns
-import statsmodels.formula.api as smf
 from tabulate import tabulate
 
 import silverfund.data_access_layer as dal
 from silverfund.enums import Compounding, Interval, Turnover
+from silverfund.panels import lagged_window_sum, prefix_sum
+from silverfund.pnl import PnLEngine
 from silverfund.records import AssetReturns
+from silverfund.streaming import collect_streaming
 
 
 class Performance:
@@ -22,7 +27,7 @@ class Performance:
         interval (Interval): The frequency of data (e.g., daily, monthly).
         start_date (date): The start date of the performance evaluation period.
         end_date (date): The end date of the performance evaluation period.
-        asset_returns (AssetReturns): Asset returns data for the evaluation period.
+        asset_returns (AssetReturns | pl.LazyFrame | str | Path): Asset returns data for the evaluation period.
         annualize (bool): Whether to annualize the results (default is True).
 
     Methods:
@@ -36,22 +41,26 @@ class Performance:
     def __init__(
         self,
         interval: Interval,
-        asset_returns: AssetReturns,
+        asset_returns: AssetReturns | pl.LazyFrame | str | Path,
         annualize: bool = True,
+        chunk_size: int = 252,
     ) -> None:
         """
         Initializes the Performance object.
 
+        The asset returns are pivoted into dense date x asset arrays one chunk of periods at a time
+        (see `PnLEngine`) and reduced to per-date series. Only those series are kept, so a parquet
+        path or LazyFrame of a long daily backtest is never loaded into memory as a whole.
+
         Args:
             interval (Interval): The data frequency (e.g., daily, monthly).
-            start_date (date): The start date for the performance evaluation period.
-            end_date (date): The end date for the performance evaluation period.
-            asset_returns (AssetReturns): Asset returns data.
+            asset_returns (AssetReturns | pl.LazyFrame | str | Path): Asset returns data, or a LazyFrame or
+                parquet path of asset returns.
             annualize (bool, optional): Whether to annualize the performance metrics. Defaults to True.
+            chunk_size (int, optional): The number of periods pivoted into dense arrays at a time. Defaults to 252.
         """
-        self._start_date = asset_returns["date"].min()
-        self._end_date = asset_returns["date"].max()
         self._interval = interval
+        self._chunk_size = chunk_size
 
         # Set annualizing variables
         annual_scales = {Interval.DAILY: 252, Interval.MONTHLY: 12}
@@ -59,45 +68,113 @@ class Performance:
         self._annual_scale = annual_scales[interval]
         self._annualize = annualize
 
-        # Load benchmark
-        bmk = dal.load_benchmark(
-            interval=interval, start_date=self._start_date, end_date=self._end_date
-        )
+        # Build per-date series
+        self._portfolio_returns, self._weight_series, self._last_weights = self._build(asset_returns)
 
-        # Create total_weight, bmk_weight, and active_weight columns
-        self._asset_weights = (
-            asset_returns.join(bmk, on=["date", "barrid"], how="left", suffix="_bmk")
-            .with_columns((pl.col("weight") - pl.col("weight_bmk")).alias("weight_active"))
-            .select(
-                "date",
-                "barrid",
-                pl.col("weight").alias("total_weight"),
-                pl.col("weight_bmk").alias("bmk_weight"),
-                pl.col("weight_active").alias("active_weight"),
-                "fwd_ret",
-            )
-        )
+        self._start_date = self._portfolio_returns["date"].min()
+        self._end_date = self._portfolio_returns["date"].max()
+        self._periods = self._portfolio_returns["date"].unique().count()
 
-        # Create total_ret, bmk_ret, and active_ret columns.
-        self._asset_returns = self._asset_weights.with_columns(
-            (pl.col("total_weight") * pl.col("fwd_ret")).alias("total_ret"),
-            (pl.col("bmk_weight") * pl.col("fwd_ret")).alias("bmk_ret"),
-            (pl.col("active_weight") * pl.col("fwd_ret")).alias("active_ret"),
-        )
+    def _build(
+        self, asset_returns: AssetReturns | pl.LazyFrame | str | Path, prior_weights: pl.DataFrame | None = None
+    ) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+        """
+        Joins the benchmark onto asset returns and reduces them to per-date series with a `PnLEngine`.
+
+        The periods are pivoted into dense arrays `self._chunk_size` periods at a time, and the
+        last weights of each chunk seed the turnover of the next. The benchmark is loaded per chunk
+        as well, so only one chunk of the asset returns and benchmark weights is in memory at a time.
+
+        Args:
+            asset_returns (AssetReturns | pl.LazyFrame | str | Path): Asset returns data.
+            prior_weights (pl.DataFrame, optional): The 'date', 'barrid', and 'weight' of the period before
+                the first period of `asset_returns`, used for that period's turnover.
+
+        Returns:
+            tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]: The per-date portfolio returns, the per-date
+                leverage and turnover, and the weights of the last two periods (for `extend`).
+        """
+        if isinstance(asset_returns, (str, Path)):
+            asset_returns = pl.scan_parquet(asset_returns)
+
+        asset_returns = asset_returns.lazy().select("date", "barrid", "weight", "fwd_ret")
+
+        # Periods
+        dates = asset_returns.select(pl.col("date").unique()).collect()["date"].sort()
 
-        # Create portfolio returns dataframe
-        self._portfolio_returns = (
-            self._asset_returns.group_by("date")
-            .agg(
-                pl.col("total_ret").sum(),
-                pl.col("bmk_ret").sum(),
-                pl.col("active_ret").sum(),
+        # Reduce each chunk of periods, seeding turnover with the last weights of the one before
+        series = []
+        last_weights = (
+            prior_weights if prior_weights is not None else pl.DataFrame(schema={"date": pl.Date, "barrid": pl.String, "weight": pl.Float64})
+        )
+        for start in range(0, len(dates), self._chunk_size):
+            chunk_dates = dates.slice(start, self._chunk_size)
+            chunk = collect_streaming(asset_returns.filter(pl.col("date").is_between(chunk_dates.min(), chunk_dates.max())))
+
+            # Load and join the chunk's benchmark weights
+            bmk = dal.load_benchmark(
+                interval=self._interval,
+                start_date=chunk_dates.min(),
+                end_date=chunk_dates.max(),
             )
-            .sort("date")
+            chunk = chunk.join(bmk.select("date", "barrid", pl.col("weight").alias("bmk_weight")), on=["date", "barrid"], how="left")
+
+            # Weights of the period before the chunk
+            prior = last_weights.filter(pl.col("date") == last_weights["date"].max()) if last_weights.height > 0 else None
+
+            engine = PnLEngine.from_frame(chunk, None if prior is None else prior["barrid"])
+            series.append(engine.series(prior))
+            last_weights = pl.concat([last_weights, engine.last_weights(periods=2)])
+
+        series = pl.concat(series)
+
+        portfolio_returns = series.select("date", "total_ret", "bmk_ret", "active_ret")
+        weight_series = series.select("date", "leverage", "absolute_turnover", "relative_turnover")
+
+        # Keep the last two periods' weights so that `extend` can revise the last period
+        last_weights = last_weights.filter(pl.col("date").is_in(series["date"].tail(2).to_list()))
+
+        return portfolio_returns, weight_series, last_weights
+
+    def extend(self, asset_returns: AssetReturns) -> None:
+        """
+        Updates the performance inputs with new or revised periods.
+
+        Only the periods in `asset_returns` are rebuilt (including the benchmark load); any
+        existing periods on those dates are replaced, e.g. the last period of a backtest whose
+        forward returns were filled in by `Backtester.extend`. Turnover of the first new period is
+        measured against the stored weights of the period before it, which are kept for the last
+        two periods.
+
+        Args:
+            asset_returns (AssetReturns): Asset returns for the new and revised periods.
+        """
+        first_date = asset_returns["date"].min()
+
+        # Weights of the period before the update
+        prior_weights = self._last_weights.filter(pl.col("date") < first_date)
+        if prior_weights.height > 0:
+            prior_weights = prior_weights.filter(pl.col("date") == prior_weights["date"].max())
+
+        # Build series for the new periods
+        portfolio_returns, weight_series, last_weights = self._build(asset_returns, prior_weights if prior_weights.height > 0 else None)
+
+        # Replace overlapping periods and append
+        self._portfolio_returns = pl.concat([self._portfolio_returns.filter(pl.col("date") < first_date), portfolio_returns])
+        self._weight_series = pl.concat([self._weight_series.filter(pl.col("date") < first_date), weight_series])
+        self._last_weights = (
+            pl.concat([prior_weights, last_weights])
+            .unique(["date", "barrid"])
+            .filter(pl.col("date").is_in(self._portfolio_returns["date"].tail(2).to_list()))
         )
 
+        self._end_date = max(self._end_date, asset_returns["date"].max())
         self._periods = self._portfolio_returns["date"].unique().count()
 
+        # Drop memoized metrics
+        self.__dict__.pop("_moments", None)
+        self.__dict__.pop("_drawdown_series", None)
+
     def plot_returns(
         self,
         compounding: Compounding,
@@ -182,8 +259,34 @@ class Performance:
         else:
             plt.savefig(save_file_path)
 
+    @cached_property
+    def _moments(self) -> dict[str, dict[str, float]]:
+        """
+        Computes the mean, standard deviation, beta, and alpha of every return series in one pass.
+
+        Betas and alphas are the closed-form OLS slope and intercept of each series on the
+        benchmark return, cov(r, r_bmk) / var(r_bmk) and mean(r) - beta * mean(r_bmk). The result
+        is memoized, so the summary reads every moment from a single computation.
+
+        Returns:
+            dict[str, dict[str, float]]: The (unannualized) 'mean', 'std', 'beta', and 'alpha' of
+                each of 'total_ret', 'bmk_ret', and 'active_ret'.
+        """
+        cols = ["total_ret", "bmk_ret", "active_ret"]
+        returns = self._portfolio_returns.select(cols).to_numpy().astype(np.float64)
+
+        mean = returns.mean(axis=0)
+        deviations = returns - mean
+        std = np.sqrt((deviations**2).sum(axis=0) / (len(returns) - 1))
+
+        bmk_deviations = deviations[:, cols.index("bmk_ret")]
+        beta = deviations.T @ bmk_deviations / (bmk_deviations @ bmk_deviations)
+        alpha = mean - beta * mean[cols.index("bmk_ret")]
+
+        return {col: {"mean": mean[i], "std": std[i], "beta": beta[i], "alpha": alpha[i]} for i, col in enumerate(cols)}
+
     def _mean(self, col: str) -> float:
-        result = self._portfolio_returns[col].mean()
+        result = self._moments[col]["mean"]
 
         if self._annualize:
             result *= self._annual_scale
@@ -191,7 +294,7 @@ class Performance:
         return result
 
     def _std(self, col: str) -> float:
-        result = self._portfolio_returns[col].std()
+        result = self._moments[col]["std"]
 
         if self._annualize:
             result *= np.sqrt(self._annual_scale)
@@ -202,14 +305,10 @@ class Performance:
         return self._mean(col) / self._std(col)
 
     def _coef(self, col: str) -> float:
-        formula = f"{col} ~ bmk_ret"
-        result = smf.ols(formula, self._portfolio_returns).fit()
-        return result.params["bmk_ret"]
+        return self._moments[col]["beta"]
 
     def _intercept(self, col: str) -> float:
-        formula = f"{col} ~ bmk_ret"
-        result = smf.ols(formula, self._portfolio_returns).fit()
-        result = result.params["Intercept"]
+        result = self._moments[col]["alpha"]
 
         if self._annualize:
             result *= self._annual_scale
@@ -278,30 +377,11 @@ class Performance:
 
     @property
     def leverage(self) -> float:
-        return (
-            self._asset_weights.with_columns(
-                pl.col("total_weight").abs(),
-            )
-            .group_by("date")
-            .agg(
-                pl.col("total_weight").sum().alias("leverage"),
-            )["leverage"]
-            .mean()
-        )
+        return self._weight_series["leverage"].mean()
 
     @property
     def abs_two_sided_turnover(self) -> float:
-        turnover = (
-            self._asset_weights.with_columns(
-                pl.col("total_weight").shift(1).over("barrid").alias("total_weight_lag")
-            )
-            .with_columns(
-                (pl.col("total_weight") - pl.col("total_weight_lag")).abs().alias("turnover")
-            )
-            .group_by("date")
-            .agg(pl.col("turnover").sum())["turnover"]
-            .mean()
-        )
+        turnover = self._weight_series["absolute_turnover"].mean()
 
         if self._annualize:
             turnover *= self._annual_scale
@@ -310,38 +390,7 @@ class Performance:
 
     @property
     def rel_two_sided_turnover(self) -> float:
-        turnover = (
-            self._asset_weights.with_columns(
-                pl.col("total_weight").abs().alias("abs_total_weight"),
-                pl.col("total_weight").shift(1).over("barrid").alias("total_weight_lag"),
-            )
-            .with_columns(
-                (pl.col("total_weight") - pl.col("total_weight_lag"))
-                .abs()
-                .alias("absolute_turnover")
-            )
-            .group_by("date")
-            .agg(
-                pl.col("absolute_turnover").sum(),
-                pl.col("total_weight").sum().alias("leverage"),
-            )
-            .with_columns(
-                pl.col("absolute_turnover").truediv(pl.col("leverage")).alias("relative_turnover")
-            )["relative_turnover"]
-            .mean()
-        )
-
-        turnover = (
-            self._asset_weights.with_columns(
-                pl.col("total_weight").shift(1).over("barrid").alias("total_weight_lag")
-            )
-            .with_columns(
-                (pl.col("total_weight") - pl.col("total_weight_lag")).abs().alias("turnover")
-            )
-            .group_by("date")
-            .agg(pl.col("turnover").sum())["turnover"]
-            .mean()
-        )
+        turnover = self._weight_series["relative_turnover"].mean()
 
         if self._annualize:
             turnover *= self._annual_scale
@@ -360,6 +409,129 @@ class Performance:
 
         return period
 
+    def drawdowns(self) -> pl.DataFrame:
+        """
+        Computes the drawdown of the portfolio and of the active returns on each date.
+
+        Wealth is compounded with a cumulative product and its running peak with a cumulative
+        maximum, so the whole series is computed in one vectorized pass. The result is memoized
+        like the moments, so `max_drawdown` and `max_drawdown_duration` share one computation.
+
+        Returns:
+            pl.DataFrame: A DataFrame with 'date', 'total_drawdown', 'total_drawdown_duration',
+                'active_drawdown', and 'active_drawdown_duration' columns. Drawdowns are fractions of the
+                peak wealth (<= 0) and durations are the number of periods since that peak.
+        """
+        return self._drawdown_series
+
+    @cached_property
+    def _drawdown_series(self) -> pl.DataFrame:
+        df = self._portfolio_returns.select("date")
+
+        for col, name in [("total_ret", "total"), ("active_ret", "active")]:
+            drawdown, duration = _drawdowns(self._portfolio_returns[col].to_numpy())
+            df = df.with_columns(pl.Series(f"{name}_drawdown", drawdown), pl.Series(f"{name}_drawdown_duration", duration))
+
+        return df
+
+    @property
+    def max_drawdown(self) -> float:
+        return self.drawdowns()["total_drawdown"].min()
+
+    @property
+    def max_drawdown_duration(self) -> int:
+        return self.drawdowns()["total_drawdown_duration"].max()
+
+    def rolling(self, windows: list[int]) -> pl.DataFrame:
+        """
+        Computes rolling risk and return metrics over several trailing windows.
+
+        Every window reuses the prefix sums of the returns, their squares, and their products with
+        the benchmark return, so each metric is a difference of two prefix sums and the cost does
+        not depend on the window lengths. Rolling maximum drawdowns and their durations come from
+        a strided view of log wealth over each window.
+
+        Args:
+            windows (list[int]): The window lengths, in periods.
+
+        Returns:
+            pl.DataFrame: One row per date and window with 'date', 'window', 'portfolio_risk',
+                'portfolio_sharpe', 'active_risk', 'information_ratio', 'portfolio_beta', 'max_drawdown',
+                and 'max_drawdown_duration' columns, annualized like the summary metrics. Metrics are null
+                until a window is complete.
+        """
+        total = self._portfolio_returns["total_ret"].to_numpy()
+        bmk = self._portfolio_returns["bmk_ret"].to_numpy()
+        active = self._portfolio_returns["active_ret"].to_numpy()
+
+        mean_scale = self._annual_scale if self._annualize else 1
+        std_scale = np.sqrt(self._annual_scale) if self._annualize else 1
+
+        # Prefix sums shared by every window
+        prefix = prefix_sum(np.column_stack([total, total**2, active, active**2, bmk, bmk**2, total * bmk]))
+        log_wealth = np.concatenate([[0], np.cumsum(np.log1p(total))])
+
+        frames = []
+        for window in windows:
+            sums = lagged_window_sum(prefix, window)
+            max_drawdown, max_drawdown_duration = _rolling_drawdowns(log_wealth, window)
+            complete = np.arange(len(total)) >= window - 1
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                total_mean, active_mean, bmk_mean = sums[:, 0] / window, sums[:, 2] / window, sums[:, 4] / window
+                total_var = (sums[:, 1] - window * total_mean**2) / (window - 1)
+                active_var = (sums[:, 3] - window * active_mean**2) / (window - 1)
+                bmk_var = (sums[:, 5] - window * bmk_mean**2) / (window - 1)
+                cov = (sums[:, 6] - window * total_mean * bmk_mean) / (window - 1)
+
+                total_std = np.sqrt(np.maximum(total_var, 0))
+                active_std = np.sqrt(np.maximum(active_var, 0))
+
+                metrics = {
+                    "portfolio_risk": total_std * std_scale,
+                    "portfolio_sharpe": total_mean * mean_scale / (total_std * std_scale),
+                    "active_risk": active_std * std_scale,
+                    "information_ratio": active_mean * mean_scale / (active_std * std_scale),
+                    "portfolio_beta": cov / bmk_var,
+                    "max_drawdown": max_drawdown,
+                    "max_drawdown_duration": max_drawdown_duration,
+                }
+
+            frames.append(
+                self._portfolio_returns.select("date", pl.lit(window).alias("window")).with_columns(
+                    pl.Series(name, np.where(complete, values, np.nan)).fill_nan(None) for name, values in metrics.items()
+                )
+            )
+
+        return pl.concat(frames)
+
+    def plot_rolling(self, metric: str, windows: list[int], title: str, save_file_path: str | None = None) -> None:
+        """
+        Plots a rolling metric for several windows.
+
+        Args:
+            metric (str): A metric column of `rolling` (e.g. "portfolio_sharpe").
+            windows (list[int]): The window lengths, in periods.
+            title (str): The title of the plot.
+            save_file_path (str | None, optional): If provided, saves the plot to the given path.
+        """
+        df = self.rolling(windows)
+
+        # Plot
+        plt.figure(figsize=(10, 6))
+
+        sns.lineplot(df, x="date", y=metric, hue="window")
+
+        plt.title(title)
+        plt.xlabel(None)
+        plt.ylabel(metric.replace("_", " ").title())
+        plt.grid()
+
+        if save_file_path is None:
+            plt.show()
+        else:
+            plt.savefig(save_file_path)
+
     def summary(self, save_file_path: str | None = None) -> str | None:
         """
         Generates a summary of performance metrics as a table.
@@ -457,16 +629,7 @@ class Performance:
         return self.summary()
 
     def plot_leverage(self, title: str, save_file_path: str | None = None) -> None:
-        df = (
-            self._asset_weights.with_columns(
-                pl.col("total_weight").abs(),
-            )
-            .group_by("date")
-            .agg(
-                pl.col("total_weight").sum().alias("leverage"),
-            )
-            .sort("date")
-        )
+        df = self._weight_series
 
         # Plot
         plt.figure(figsize=(10, 6))
@@ -486,43 +649,7 @@ class Performance:
     def plot_two_sided_turnover(
         self, turnover: Turnover, title: str, save_file_path: str | None = None
     ) -> None:
-        if turnover == Turnover.ABSOLUTE:
-            df = (
-                self._asset_weights.with_columns(
-                    pl.col("total_weight").shift(1).over("barrid").alias("total_weight_lag")
-                )
-                .with_columns(
-                    (pl.col("total_weight") - pl.col("total_weight_lag"))
-                    .abs()
-                    .alias("absolute_turnover")
-                )
-                .group_by("date")
-                .agg(pl.col("absolute_turnover").sum())
-            )
-
-        if turnover == Turnover.RELATIVE:
-            df = (
-                self._asset_weights.with_columns(
-                    pl.col("total_weight").abs().alias("abs_total_weight"),
-                    pl.col("total_weight").shift(1).over("barrid").alias("total_weight_lag"),
-                )
-                .with_columns(
-                    (pl.col("total_weight") - pl.col("total_weight_lag"))
-                    .abs()
-                    .alias("absolute_turnover")
-                )
-                .group_by("date")
-                .agg(
-                    pl.col("absolute_turnover").sum(),
-                    pl.col("total_weight").sum().alias("leverage"),
-                )
-                .with_columns(
-                    pl.col("absolute_turnover")
-                    .truediv(pl.col("leverage"))
-                    .alias("relative_turnover")
-                )
-                .sort("date")
-            )
+        df = self._weight_series
 
         # Plot
         plt.figure(figsize=(10, 6))
@@ -538,3 +665,35 @@ class Performance:
             plt.show()
         else:
             plt.savefig(save_file_path)
+
+
+def _drawdowns(returns: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    wealth = np.cumprod(1 + returns)
+    peak = np.maximum.accumulate(np.maximum(wealth, 1))
+
+    # Index of the most recent peak (-1 for the starting wealth of 1)
+    periods = np.arange(len(returns))
+    peak_index = np.maximum.accumulate(np.where(wealth >= peak, periods, -1))
+
+    return wealth / peak - 1, periods - peak_index
+
+
+def _rolling_drawdowns(log_wealth: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Maximum drawdown and drawdown duration over each trailing window, from log wealth including a leading 0."""
+    max_drawdown = np.full(len(log_wealth) - 1, np.nan)
+    max_duration = np.full(len(log_wealth) - 1, np.nan)
+
+    if window >= len(log_wealth):
+        return max_drawdown, max_duration
+
+    # Each view holds the wealth before the window and after each of its periods
+    views = np.lib.stride_tricks.sliding_window_view(log_wealth, window + 1)
+    peaks = np.maximum.accumulate(views, axis=1)
+    max_drawdown[window - 1 :] = np.expm1((views - peaks).min(axis=1))
+
+    # Periods since the most recent peak within the window
+    periods = np.arange(window + 1)
+    peak_index = np.maximum.accumulate(np.where(views >= peaks, periods, 0), axis=1)
+    max_duration[window - 1 :] = (periods - peak_index).max(axis=1)
+
+    return max_drawdown, max_duration
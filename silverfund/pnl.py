@@ -0,0 +1,191 @@
+import numpy as np
+import polars as pl
+
+from silverfund.asset_index import AssetIndex
+
+
+class PnLEngine:
+    """
+    Dense T x N arrays of portfolio weights, benchmark weights, and forward returns.
+
+    The long backtest results are pivoted once, by position, into arrays aligned on the same
+    dates (rows) and barrids (columns). Portfolio, benchmark, and active returns, leverage, and
+    turnover are then row-wise NumPy reductions over those arrays.
+
+    Missing cells are NaN. A missing weight counts as zero for turnover, so an asset that leaves
+    the portfolio is turned over like one sold down to zero.
+
+    Attributes:
+        dates (pl.Series): The date of each row, ascending.
+        index (AssetIndex): The barrid of each column.
+        weights (np.ndarray): The T x N portfolio weights.
+        bmk_weights (np.ndarray): The T x N benchmark weights.
+        fwd_returns (np.ndarray): The T x N forward returns.
+    """
+
+    def __init__(
+        self,
+        dates: pl.Series,
+        index: AssetIndex,
+        weights: np.ndarray,
+        bmk_weights: np.ndarray,
+        fwd_returns: np.ndarray,
+    ) -> None:
+        """
+        Initializes a PnLEngine instance.
+
+        Args:
+            dates (pl.Series): The date of each row, ascending.
+            index (AssetIndex): The barrid of each column.
+            weights (np.ndarray): The T x N portfolio weights.
+            bmk_weights (np.ndarray): The T x N benchmark weights.
+            fwd_returns (np.ndarray): The T x N forward returns.
+
+        Raises:
+            ValueError: If an array's shape does not match the dates and the index.
+        """
+        shape = (len(dates), len(index))
+
+        for name, values in [("weights", weights), ("bmk_weights", bmk_weights), ("fwd_returns", fwd_returns)]:
+            if values.shape != shape:
+                raise ValueError(f"PnLEngine {name} have shape {values.shape}, expected: {shape}")
+
+        self.dates = dates.alias("date")
+        self.index = index
+        self.weights = weights
+        self.bmk_weights = bmk_weights
+        self.fwd_returns = fwd_returns
+
+    @classmethod
+    def from_frame(cls, df: pl.DataFrame, extra_barrids: pl.Series | None = None) -> "PnLEngine":
+        """
+        Pivots long backtest results into dense arrays.
+
+        Args:
+            df (pl.DataFrame): A DataFrame with 'date', 'barrid', 'weight', 'bmk_weight', and 'fwd_ret'
+                columns and at most one row per date and barrid.
+            extra_barrids (pl.Series, optional): Barrids to add to the index without data, e.g. those
+                of the prior weights passed to `series`, so that assets sold out of the portfolio
+                count towards the first date's turnover.
+
+        Returns:
+            PnLEngine: The engine, with dates and barrids in ascending order.
+        """
+        barrids = df["barrid"].cast(pl.String)
+        if extra_barrids is not None:
+            barrids = pl.concat([barrids, extra_barrids.cast(pl.String)])
+
+        dates = df["date"].unique().sort()
+        index = AssetIndex(barrids.unique().sort())
+
+        # Positions
+        rows = df["date"].replace_strict(dates, np.arange(len(dates)), return_dtype=pl.Int64).to_numpy()
+        cols = index.positions(df["barrid"])
+
+        # Scatter
+        def scatter(column: str) -> np.ndarray:
+            values = np.full((len(dates), len(index)), np.nan)
+            values[rows, cols] = df[column].cast(pl.Float64).fill_null(np.nan).to_numpy()
+            return values
+
+        return cls(dates, index, scatter("weight"), scatter("bmk_weight"), scatter("fwd_ret"))
+
+    @property
+    def portfolio_returns(self) -> np.ndarray:
+        """The return of the portfolio on each date."""
+        return np.nansum(self.weights * self.fwd_returns, axis=1)
+
+    @property
+    def benchmark_returns(self) -> np.ndarray:
+        """The return of the benchmark (over the portfolio's assets) on each date."""
+        return np.nansum(self.bmk_weights * self.fwd_returns, axis=1)
+
+    @property
+    def active_returns(self) -> np.ndarray:
+        """The return of the active weights on each date, over assets with a benchmark weight."""
+        return np.nansum((self.weights - self.bmk_weights) * self.fwd_returns, axis=1)
+
+    @property
+    def leverage(self) -> np.ndarray:
+        """The gross weight of the portfolio on each date."""
+        return np.nansum(np.abs(self.weights), axis=1)
+
+    def absolute_turnover(self, prior_weights: np.ndarray | None = None) -> np.ndarray:
+        """
+        Computes the two sided turnover of each date, the sum of absolute weight changes.
+
+        Args:
+            prior_weights (np.ndarray, optional): The weights of the period before the first date,
+                aligned with the index. Without them the first date's turnover is 0.
+
+        Returns:
+            np.ndarray: The absolute two sided turnover of each date.
+        """
+        weights = np.nan_to_num(self.weights)
+
+        if prior_weights is None:
+            previous = np.vstack([weights[:1], weights[:-1]])
+        else:
+            previous = np.vstack([np.nan_to_num(prior_weights)[None, :], weights[:-1]])
+
+        return np.abs(weights - previous).sum(axis=1)
+
+    def relative_turnover(self, prior_weights: np.ndarray | None = None) -> np.ndarray:
+        """
+        Computes the two sided turnover of each date relative to the portfolio's leverage.
+
+        Args:
+            prior_weights (np.ndarray, optional): The weights of the period before the first date.
+
+        Returns:
+            np.ndarray: The relative two sided turnover of each date.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.absolute_turnover(prior_weights) / self.leverage
+
+    def series(self, prior_weights: pl.DataFrame | None = None) -> pl.DataFrame:
+        """
+        Computes every per-date series.
+
+        Args:
+            prior_weights (pl.DataFrame, optional): The 'barrid' and 'weight' of the period before the first date.
+                Their barrids should be in the index (see `from_frame`), or they do not count towards turnover.
+
+        Returns:
+            pl.DataFrame: A DataFrame with 'date', 'total_ret', 'bmk_ret', 'active_ret', 'leverage',
+                'absolute_turnover', and 'relative_turnover' columns.
+        """
+        prior = None if prior_weights is None else self.index.gather_column(prior_weights, "weight")
+
+        return pl.DataFrame(
+            {
+                "date": self.dates,
+                "total_ret": self.portfolio_returns,
+                "bmk_ret": self.benchmark_returns,
+                "active_ret": self.active_returns,
+                "leverage": self.leverage,
+                "absolute_turnover": self.absolute_turnover(prior),
+                "relative_turnover": self.relative_turnover(prior),
+            }
+        )
+
+    def last_weights(self, periods: int = 1) -> pl.DataFrame:
+        """
+        Converts the weights of the last periods back to long form.
+
+        Args:
+            periods (int, optional): The number of trailing periods. Defaults to 1.
+
+        Returns:
+            pl.DataFrame: A DataFrame with 'date', 'barrid', and 'weight' columns for the held assets.
+        """
+        weights = self.weights[-periods:]
+        rows, cols = np.nonzero(~np.isnan(weights))
+
+        return pl.DataFrame(
+            {
+                "date": self.dates.tail(periods).gather(rows),
+                "barrid": pl.Series(self.index.barrids, dtype=pl.String).gather(cols),
+                "weight": weights[rows, cols],
+            }
+        )
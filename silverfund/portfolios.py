@@ -1,7 +1,8 @@
 import os
+import tempfile
 from datetime import date
 from functools import partial
-from typing import Protocol
+from typing import Callable, Protocol
 
 import polars as pl
 import ray
@@ -10,11 +11,13 @@ from tqdm import tqdm
 
 import silverfund.data_access_layer as dal
 from silverfund.alphas import Alpha
+from silverfund.asset_index import AssetIndex
 from silverfund.constraints import ConstraintConstructor
 from silverfund.covariance_matrix import covariance_matrix_constructor
 from silverfund.enums import Interval
 from silverfund.optimizers import quadratic_program
 from silverfund.records import Portfolio
+from silverfund.streaming import ParquetSink, stream_to_sink
 
 
 class PortfolioConstructor(Protocol):
@@ -29,6 +32,160 @@ class PortfolioConstructor(Protocol):
     ) -> Portfolio: ...
 
 
+class PanelPortfolioConstructor(Protocol):
+    """Protocol for functions that construct the portfolios of every period at once from an alpha panel.
+
+    Panel constructors are marked with `panel_constructor`. The backtester passes them the alphas of
+    the whole backtest (restricted to the universe) and skips per-period dispatch. Constraints are
+    not applied to panel constructors.
+    """
+
+    def __call__(self, alphas: Alpha) -> Portfolio: ...
+
+
+def panel_constructor(func: Callable[..., Portfolio]) -> Callable[..., Portfolio]:
+    """Marks a function as a `PanelPortfolioConstructor`.
+
+    Args:
+        func (Callable[..., Portfolio]): The panel portfolio constructor.
+
+    Returns:
+        Callable[..., Portfolio]: The same function, marked as a panel constructor.
+    """
+    func.is_panel_constructor = True
+    return func
+
+
+def is_panel_constructor(constructor: PortfolioConstructor | PanelPortfolioConstructor) -> bool:
+    """Checks whether a portfolio constructor (or a partial of one) is a panel constructor.
+
+    Args:
+        constructor (PortfolioConstructor | PanelPortfolioConstructor): The constructor to check.
+
+    Returns:
+        bool: True if the constructor builds all periods at once.
+    """
+    while isinstance(constructor, partial):
+        constructor = constructor.func
+
+    return getattr(constructor, "is_panel_constructor", False)
+
+
+@panel_constructor
+def quantile_buckets(alphas: Alpha, n_bins: int = 10) -> Portfolio:
+    """Constructs equal-weighted long-short spread portfolios from per-date alpha quantiles.
+
+    Assets with a signal are ranked by alpha within each date and split into `n_bins` equally
+    sized buckets. The top bucket is held long and the bottom bucket short, each equal-weighted to
+    a total weight of one; all other assets get zero weight. Tied alphas share an average rank, so
+    they fall in the same bucket.
+
+    Null and zero alphas (such as filled-in missing scores) are not ranked and get zero weight, and
+    so does every asset on a date whose ranked alphas are all equal.
+
+    Args:
+        alphas (Alpha): Expected returns for all assets and dates.
+        n_bins (int, optional): The number of quantile buckets (default is 10).
+
+    Returns:
+        Portfolio: A Polars DataFrame wrapped in the Portfolio class,
+                   containing 'date', 'barrid', and 'weight' columns.
+    """
+    ranked = _ranked_alpha()
+
+    bucket = ((ranked.rank("average") - 1) * n_bins / ranked.count()).floor().over("date").cast(pl.Int64).alias("bucket")
+
+    portfolios = (
+        alphas.with_columns(bucket)
+        .with_columns(
+            pl.when(pl.col("bucket") == n_bins - 1)
+            .then(1 / pl.len().over("date", "bucket"))
+            .when(pl.col("bucket") == 0)
+            .then(-1 / pl.len().over("date", "bucket"))
+            .otherwise(0.0)
+            .alias("weight")
+        )
+        .select(["date", "barrid", "weight"])
+    )
+
+    return Portfolio(portfolios)
+
+
+@panel_constructor
+def signal_weighted(alphas: Alpha) -> Portfolio:
+    """Constructs portfolios with weights proportional to alpha.
+
+    Weights are scaled within each date so that the gross exposure (sum of absolute weights) is one.
+    Assets with a null alpha get zero weight, as does every asset on a date whose alphas are all zero.
+
+    Args:
+        alphas (Alpha): Expected returns for all assets and dates.
+
+    Returns:
+        Portfolio: A Polars DataFrame wrapped in the Portfolio class,
+                   containing 'date', 'barrid', and 'weight' columns.
+    """
+    portfolios = alphas.select(
+        "date",
+        "barrid",
+        (pl.col("alpha") / pl.col("alpha").abs().sum().over("date")).fill_nan(0).fill_null(0).alias("weight"),
+    )
+
+    return Portfolio(portfolios)
+
+
+@panel_constructor
+def equal_weight(alphas: Alpha) -> Portfolio:
+    """Constructs equal-weighted portfolios of every asset in the universe on each date.
+
+    Args:
+        alphas (Alpha): Expected returns for all assets and dates. Only the assets are used.
+
+    Returns:
+        Portfolio: A Polars DataFrame wrapped in the Portfolio class,
+                   containing 'date', 'barrid', and 'weight' columns.
+    """
+    portfolios = alphas.select(
+        "date",
+        "barrid",
+        (1 / pl.len().over("date")).cast(pl.Float64).alias("weight"),
+    )
+
+    return Portfolio(portfolios)
+
+
+@panel_constructor
+def top_k(alphas: Alpha, k: int) -> Portfolio:
+    """Constructs equal-weighted long-only portfolios of the `k` highest alpha assets on each date.
+
+    Assets tied with the `k`-th highest alpha are all held. Null and zero alphas (such as filled-in
+    missing scores) are never held, and nothing is held on a date whose ranked alphas are all equal.
+
+    Args:
+        alphas (Alpha): Expected returns for all assets and dates.
+        k (int): The number of assets held on each date.
+
+    Returns:
+        Portfolio: A Polars DataFrame wrapped in the Portfolio class,
+                   containing 'date', 'barrid', and 'weight' columns.
+    """
+    held = (_ranked_alpha().rank("min", descending=True).over("date") <= k).fill_null(False)
+
+    portfolios = alphas.select(
+        "date",
+        "barrid",
+        pl.when(held).then(1 / held.sum().over("date")).otherwise(0.0).cast(pl.Float64).alias("weight"),
+    )
+
+    return Portfolio(portfolios)
+
+
+def _ranked_alpha() -> pl.Expr:
+    """The alphas that carry a signal, null on dates where they are all equal."""
+    signal = pl.when(pl.col("alpha").is_not_null() & (pl.col("alpha") != 0)).then(pl.col("alpha"))
+    return pl.when(signal.drop_nulls().n_unique().over("date") > 1).then(signal)
+
+
 def mean_variance_efficient(
     period: date,
     barrids: list[str],
@@ -55,11 +212,14 @@ def mean_variance_efficient(
                    containing 'date', 'barrid', and 'weight' columns.
     """
 
+    # Index assets by position
+    index = AssetIndex(barrids)
+
     # Get covariance matrix
-    cov_mat = covariance_matrix_constructor(period, barrids)
+    cov_mat = covariance_matrix_constructor(period, index.barrids)
 
-    # Cast to numpy arrays
-    alphas = alphas.to_vector()
+    # Cast to numpy arrays aligned with the index
+    alphas = index.gather_column(alphas, "alpha")
     cov_mat = cov_mat.to_matrix()
 
     # Construct constraints
@@ -69,7 +229,6 @@ def mean_variance_efficient(
     weights = quadratic_program(alphas, cov_mat, constraints, gamma)
 
     portfolio = pl.DataFrame({"date": period, "barrid": barrids, "weight": weights})
-    portfolio = portfolio.sort(["barrid", "date"])
 
     return Portfolio(portfolio)
 
@@ -109,7 +268,7 @@ def mve_sequential(
     for period in tqdm(periods, desc="Computing optimal portfolio weights"):
         # Get portfolio constructor parameters
         period_barrids = universe.filter(pl.col("date") == period)["barrid"].sort().to_list()
-        period_alphas = Alpha(alphas.filter(pl.col("date") == period).sort(["barrid"]))
+        period_alphas = Alpha(alphas.filter(pl.col("date") == period))
 
         # Construct period portfolio
         portfolio = mean_variance_efficient(
@@ -134,10 +293,15 @@ def mve_parallel(
     constraints: list[ConstraintConstructor],
     gamma: float = 2.0,
     n_cpus: int | None = None,
+    max_in_flight: int | None = None,
+    sink_path: str | None = None,
 ) -> pl.DataFrame:
     """
     Constructs mean-variance efficient (MVE) portfolios in parallel using multiple CPUs.
 
+    Portfolios are collected as they complete and appended to an on-disk parquet sink, with at
+    most `max_in_flight` tasks dispatched at a time. A failing period raises immediately.
+
     Args:
         start_date (date): The start date for portfolio construction.
         end_date (date): The end date for portfolio construction.
@@ -145,6 +309,8 @@ def mve_parallel(
         constraints (list[ConstraintConstructor]): A list of portfolio constraints.
         gamma (float, optional): The risk aversion parameter. Default is 2.0.
         n_cpus (int, optional): Number of CPU cores to use for parallel processing. Defaults to all available cores.
+        max_in_flight (int, optional): The maximum number of tasks in flight. Defaults to twice `n_cpus`.
+        sink_path (str, optional): The parquet file to stream portfolios into. Defaults to a temporary file.
 
     Returns:
         pl.DataFrame: A Polars DataFrame containing the constructed portfolio with columns:
@@ -171,28 +337,37 @@ def mve_parallel(
         total=len(periods), desc=f"Computing portfolios with {n_cpus} cpus"
     )
 
-    # Dispatch parallel tasks
-    portfolio_futures = [
-        construct_portfolio.remote(
-            period=period,
-            universe=universe,
-            alphas=alphas,
-            constraints=constraints,
-            gamma=gamma,
-            progress_bar=progress_bar,
-        )
-        for period in periods
-    ]
-
-    # Retrieve results
-    portfolios = ray.get(portfolio_futures)
-
-    # Shutdown ray and progress bar
-    progress_bar.close.remote()
-    ray.shutdown()
-
-    # Concatenate
-    portfolios: pl.DataFrame = pl.concat(portfolios).sort(["barrid", "weight"])
+    # Put shared inputs in the object store once
+    universe_ref = ray.put(universe)
+    alphas_ref = ray.put(alphas)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sink_path = sink_path or os.path.join(temp_dir, "portfolios.parquet")
+
+        try:
+            # Dispatch parallel tasks and write results as they complete
+            with ParquetSink(sink_path) as sink:
+                stream_to_sink(
+                    submit=lambda period: construct_portfolio.remote(
+                        period=period,
+                        universe=universe_ref,
+                        alphas=alphas_ref,
+                        constraints=constraints,
+                        gamma=gamma,
+                        progress_bar=progress_bar,
+                    ),
+                    items=periods,
+                    sink=sink,
+                    max_in_flight=max_in_flight or 2 * n_cpus,
+                )
+
+        finally:
+            # Shutdown ray and progress bar
+            progress_bar.close.remote()
+            ray.shutdown()
+
+        # Read back
+        portfolios = pl.read_parquet(sink_path).sort(["barrid", "weight"])
 
     return portfolios
 
@@ -223,7 +398,7 @@ def construct_portfolio(
     """
     # Get portfolio constructor parameters
     period_barrids = universe.filter(pl.col("date") == period)["barrid"].sort().to_list()
-    period_alphas = Alpha(alphas.filter(pl.col("date") == period).sort(["barrid"]))
+    period_alphas = Alpha(alphas.filter(pl.col("date") == period))
 
     # Construct period portfolio
     portfolio = mean_variance_efficient(
@@ -1,3 +1,4 @@
+import numpy as np
 import polars as pl
 
 
@@ -12,12 +13,101 @@ def check_columns(expected: list[str], actual: list[str]) -> None:
         raise ValueError(f"Extra columns found: {right_unique}")
 
 
-def check_schema(expected: dict[str, pl.DataType], actual: pl.Schema) -> None:
+# Signals, scores, and alphas may carry barrids as strings or as the integer-backed barrid Enum
+BARRID_TYPES = (pl.String, pl.Enum)
+
+
+def check_schema(expected: dict[str, pl.DataType | tuple[pl.DataType, ...]], actual: pl.Schema) -> None:
     for col, dtype in expected.items():
-        if actual[col] != dtype:
+        allowed = dtype if isinstance(dtype, tuple) else (dtype,)
+
+        if not any(actual[col] == allowed_dtype for allowed_dtype in allowed):
             raise ValueError(f"Column {col} has incorrect type: {actual[col]}, expected: {dtype}")
 
 
+def is_canonical(df: pl.DataFrame) -> bool:
+    """Checks whether a DataFrame is sorted by 'barrid' and then 'date'.
+
+    The 'barrid' check is O(1) when Polars has flagged the column as sorted (as it does after
+    `sort(["barrid", "date"])`). Dates within each barrid are then checked with one vectorized
+    pass, which is far cheaper than re-sorting.
+
+    Args:
+        df (pl.DataFrame): A DataFrame with 'barrid' and 'date' columns.
+
+    Returns:
+        bool: True if the DataFrame is already in canonical order.
+    """
+    if not df["barrid"].is_sorted():
+        return False
+
+    new_barrid = pl.col("barrid") != pl.col("barrid").shift(1)
+    later_date = pl.col("date") >= pl.col("date").shift(1)
+
+    return df.select((new_barrid | later_date).all()).item()
+
+
+def canonicalize(df: pl.DataFrame, expected_order: list[str], valid_schema: dict[str, pl.DataType | tuple[pl.DataType, ...]]) -> pl.DataFrame:
+    """Validates a record and puts it in canonical column and row order.
+
+    Columns are only reselected and rows only sorted when they are out of order, so a DataFrame
+    that is already canonical is returned without a copy.
+
+    Args:
+        df (pl.DataFrame): The record data.
+        expected_order (list[str]): The expected columns, in order.
+        valid_schema (dict[str, pl.DataType]): The expected type of each column.
+
+    Returns:
+        pl.DataFrame: The validated DataFrame in canonical order.
+
+    Raises:
+        ValueError: If the columns or schema do not match the expected structure.
+    """
+    # Check columns and reorder
+    if df.columns != expected_order:
+        check_columns(expected_order, df.columns)
+        df = df.select(expected_order)
+
+    # Check schema
+    check_schema(valid_schema, df.schema)
+
+    # Sort
+    if not is_canonical(df):
+        df = df.sort(["barrid", "date"])
+
+    return df
+
+
+def check_lazy(frame: pl.LazyFrame, expected_order: list[str], valid_schema: dict[str, pl.DataType | tuple[pl.DataType, ...]]) -> pl.LazyFrame:
+    """Validates a lazy record against its expected structure without executing the query.
+
+    Only the schema of the query plan is resolved, so the check is cheap and the plan can still
+    be extended by later stages before it is collected.
+
+    Args:
+        frame (pl.LazyFrame): The query plan producing the record.
+        expected_order (list[str]): The expected columns, in order.
+        valid_schema (dict[str, pl.DataType]): The expected type of each column.
+
+    Returns:
+        pl.LazyFrame: The query plan with its columns reordered.
+
+    Raises:
+        ValueError: If the columns or schema do not match the expected structure.
+    """
+    schema = frame.collect_schema()
+
+    # Check columns
+    check_columns(expected_order, schema.names())
+
+    # Check schema
+    check_schema(valid_schema, schema)
+
+    # Reorder columns
+    return frame.select(expected_order)
+
+
 class Signal(pl.DataFrame):
     """Represents a financial signal DataFrame with a specific structure.
 
@@ -25,37 +115,51 @@ class Signal(pl.DataFrame):
     and provides sorting and initialization for further use in financial analysis.
 
     Args:
-        signals (pl.DataFrame): DataFrame containing the signal data.
+        signals (pl.DataFrame | pl.LazyFrame): DataFrame containing the signal data. Lazy inputs are collected.
         signal_name (str): The name of the signal column.
 
     Raises:
         ValueError: If the columns or schema do not match the expected structure.
     """
 
-    def __init__(self, signals: pl.DataFrame, signal_name: str) -> None:
+    def __init__(self, signals: pl.DataFrame | pl.LazyFrame, signal_name: str) -> None:
         expected_order = ["date", "barrid", signal_name]
 
         valid_schema = {
             "date": pl.Date,
-            "barrid": pl.String,
+            "barrid": BARRID_TYPES,
             signal_name: pl.Float64,
         }
 
-        # Check columns
-        check_columns(expected_order, signals.columns)
-
-        # Check schema
-        check_schema(valid_schema, signals.schema)
+        # Collect lazy inputs
+        if isinstance(signals, pl.LazyFrame):
+            signals = signals.collect()
 
-        # Reorder columns
-        signals = signals.select(expected_order)
-
-        # Sort
-        signals = signals.sort(["barrid", "date"])
+        # Validate and sort
+        signals = canonicalize(signals, expected_order, valid_schema)
 
         # Initialize
         super().__init__(signals)
 
+    @staticmethod
+    def validate_lazy(signals: pl.LazyFrame, signal_name: str) -> pl.LazyFrame:
+        """Validates a lazy signal query plan without collecting it.
+
+        Args:
+            signals (pl.LazyFrame): Query plan producing the signal data.
+            signal_name (str): The name of the signal column.
+
+        Returns:
+            pl.LazyFrame: The query plan with the signal columns in order.
+        """
+        valid_schema = {
+            "date": pl.Date,
+            "barrid": BARRID_TYPES,
+            signal_name: pl.Float64,
+        }
+
+        return check_lazy(signals, ["date", "barrid", signal_name], valid_schema)
+
 
 class Score(pl.DataFrame):
     """Represents a financial score DataFrame with a specific structure.
@@ -64,36 +168,49 @@ class Score(pl.DataFrame):
     and provides sorting and initialization for further use in financial analysis.
 
     Args:
-        scores (pl.DataFrame): DataFrame containing the score data.
+        scores (pl.DataFrame | pl.LazyFrame): DataFrame containing the score data. Lazy inputs are collected.
 
     Raises:
         ValueError: If the columns or schema do not match the expected structure.
     """
 
-    def __init__(self, scores: pl.DataFrame) -> None:
+    def __init__(self, scores: pl.DataFrame | pl.LazyFrame) -> None:
         expected_order = ["date", "barrid", "score"]
 
         valid_schema = {
             "date": pl.Date,
-            "barrid": pl.String,
+            "barrid": BARRID_TYPES,
             "score": pl.Float64,
         }
 
-        # Check columns
-        check_columns(expected_order, scores.columns)
-
-        # Check schema
-        check_schema(valid_schema, scores.schema)
-
-        # Reorder columns
-        scores = scores.select(expected_order)
+        # Collect lazy inputs
+        if isinstance(scores, pl.LazyFrame):
+            scores = scores.collect()
 
-        # Sort
-        scores = scores.sort(["barrid", "date"])
+        # Validate and sort
+        scores = canonicalize(scores, expected_order, valid_schema)
 
         # Initialize
         super().__init__(scores)
 
+    @staticmethod
+    def validate_lazy(scores: pl.LazyFrame) -> pl.LazyFrame:
+        """Validates a lazy score query plan without collecting it.
+
+        Args:
+            scores (pl.LazyFrame): Query plan producing the score data.
+
+        Returns:
+            pl.LazyFrame: The query plan with the score columns in order.
+        """
+        valid_schema = {
+            "date": pl.Date,
+            "barrid": BARRID_TYPES,
+            "score": pl.Float64,
+        }
+
+        return check_lazy(scores, ["date", "barrid", "score"], valid_schema)
+
 
 class Alpha(pl.DataFrame):
     """Represents a financial alpha DataFrame with a specific structure.
@@ -102,36 +219,49 @@ class Alpha(pl.DataFrame):
     and provides sorting and initialization for further use in financial analysis.
 
     Args:
-        alphas (pl.DataFrame): DataFrame containing the alpha data.
+        alphas (pl.DataFrame | pl.LazyFrame): DataFrame containing the alpha data. Lazy inputs are collected.
 
     Raises:
         ValueError: If the columns or schema do not match the expected structure.
     """
 
-    def __init__(self, alphas: pl.DataFrame) -> None:
+    def __init__(self, alphas: pl.DataFrame | pl.LazyFrame) -> None:
         expected_order = ["date", "barrid", "alpha"]
 
         valid_schema = {
             "date": pl.Date,
-            "barrid": pl.String,
+            "barrid": BARRID_TYPES,
             "alpha": pl.Float64,
         }
 
-        # Check columns
-        check_columns(expected_order, alphas.columns)
-
-        # Check schema
-        check_schema(valid_schema, alphas.schema)
+        # Collect lazy inputs
+        if isinstance(alphas, pl.LazyFrame):
+            alphas = alphas.collect()
 
-        # Reorder columns
-        alphas = alphas.select(expected_order)
-
-        # Sort
-        alphas = alphas.sort(["barrid", "date"])
+        # Validate and sort
+        alphas = canonicalize(alphas, expected_order, valid_schema)
 
         # Initialize
         super().__init__(alphas)
 
+    @staticmethod
+    def validate_lazy(alphas: pl.LazyFrame) -> pl.LazyFrame:
+        """Validates a lazy alpha query plan without collecting it.
+
+        Args:
+            alphas (pl.LazyFrame): Query plan producing the alpha data.
+
+        Returns:
+            pl.LazyFrame: The query plan with the alpha columns in order.
+        """
+        valid_schema = {
+            "date": pl.Date,
+            "barrid": BARRID_TYPES,
+            "alpha": pl.Float64,
+        }
+
+        return check_lazy(alphas, ["date", "barrid", "alpha"], valid_schema)
+
     def to_vector(self):
         """Converts the 'alpha' column to a numpy vector.
 
@@ -141,47 +271,67 @@ class Alpha(pl.DataFrame):
         return self.select("alpha").to_numpy()
 
 
-class CovarianceMatrix(pl.DataFrame):
-    """Represents a covariance matrix DataFrame with a specific structure.
+class CovarianceMatrix:
+    """Represents an asset covariance matrix backed by a contiguous NumPy array.
 
-    Ensures that the DataFrame contains the expected columns, schema, and order,
-    and provides sorting and initialization for further use in financial analysis.
+    Row and column `i` of the matrix belong to `barrids[i]`. Validation only checks the shape
+    of the array, and the matrix is converted to a DataFrame only when `to_frame` is called.
 
     Args:
-        cov_mat (pl.DataFrame): DataFrame containing the covariance matrix data.
-        barrids (list[str]): List of 'barrid' values to be included in the covariance matrix.
+        cov_mat (np.ndarray | pl.DataFrame): The N x N covariance matrix, or a DataFrame with a
+            'barrid' column and one Float64 column per barrid.
+        barrids (list[str]): The 'barrid' of each row and column of the covariance matrix.
 
     Raises:
-        ValueError: If the columns or schema do not match the expected structure.
+        ValueError: If the matrix is not square with one row per barrid.
     """
 
-    def __init__(self, cov_mat: pl.DataFrame, barrids: list[str]) -> None:
-        expected_order = ["barrid"] + sorted(barrids)
+    def __init__(self, cov_mat: np.ndarray | pl.DataFrame, barrids: list[str]) -> None:
+        # Convert DataFrames in the wide layout
+        if isinstance(cov_mat, pl.DataFrame):
+            expected_order = ["barrid"] + list(barrids)
+            check_columns(expected_order, cov_mat.columns)
+            check_schema({barrid: pl.Float64 for barrid in barrids}, cov_mat.schema)
 
-        valid_schema = {barrid: pl.Float64 for barrid in barrids}
+            position = pl.DataFrame({"barrid": barrids}).with_row_index("position")
+            cov_mat = cov_mat.join(position, on="barrid", how="left").sort("position")
+            cov_mat = cov_mat.select(barrids).to_numpy()
 
-        # Check columns
-        check_columns(expected_order, cov_mat.columns)
+        # Check shape
+        if cov_mat.shape != (len(barrids), len(barrids)):
+            raise ValueError(f"Covariance matrix has shape {cov_mat.shape}, expected: {(len(barrids), len(barrids))}")
 
-        # Check schema
-        check_schema(valid_schema, cov_mat.schema)
+        # Initialize (no copy if already contiguous float64)
+        self._matrix = np.ascontiguousarray(cov_mat, dtype=np.float64)
+        self._barrids = list(barrids)
 
-        # Reorder columns
-        cov_mat = cov_mat.select(expected_order)
+    @property
+    def barrids(self) -> list[str]:
+        """The 'barrid' of each row and column of the covariance matrix."""
+        return self._barrids
 
-        # Sort
-        cov_mat = cov_mat.sort("barrid")
+    def to_matrix(self) -> np.ndarray:
+        """Returns the covariance matrix as a NumPy array.
 
-        # Initialize
-        super().__init__(cov_mat)
+        The underlying array is returned without a copy and should not be modified.
+
+        Returns:
+            np.ndarray: The N x N covariance matrix.
+        """
+        return self._matrix
 
-    def to_matrix(self):
-        """Converts the covariance matrix to a numpy matrix, excluding 'barrid'.
+    def to_frame(self) -> pl.DataFrame:
+        """Converts the covariance matrix to a DataFrame.
 
         Returns:
-            np.ndarray: The covariance matrix as a numpy array.
+            pl.DataFrame: A DataFrame with a 'barrid' column and one column per barrid.
         """
-        return self.drop("barrid").to_numpy()
+        return pl.DataFrame(
+            {
+                "barrid": self._barrids,
+                **{barrid: self._matrix[:, i] for i, barrid in enumerate(self._barrids)},
+            }
+        )
 
 
 class Portfolio(pl.DataFrame):
@@ -206,17 +356,8 @@ class Portfolio(pl.DataFrame):
             "weight": pl.Float64,
         }
 
-        # Check columns
-        check_columns(expected_order, portfolios.columns)
-
-        # Check schema
-        check_schema(valid_schema, portfolios.schema)
-
-        # Reorder columns
-        portfolios = portfolios.select(expected_order)
-
-        # Sort
-        portfolios = portfolios.sort(["barrid", "date"])
+        # Validate and sort
+        portfolios = canonicalize(portfolios, expected_order, valid_schema)
 
         # Initialize
         super().__init__(portfolios)
@@ -245,17 +386,8 @@ class AssetReturns(pl.DataFrame):
             "fwd_ret": pl.Float64,
         }
 
-        # Check columns
-        check_columns(expected_order, returns.columns)
-
-        # Check schema
-        check_schema(valid_schema, returns.schema)
-
-        # Reorder columns
-        returns = returns.select(expected_order)
-
-        # Sort
-        returns = returns.sort(["barrid", "date"])
+        # Validate and sort
+        returns = canonicalize(returns, expected_order, valid_schema)
 
         # Initialize
         super().__init__(returns)
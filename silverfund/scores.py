@@ -1,17 +1,19 @@
 from typing import Protocol
 
+import numpy as np
 import polars as pl
 
+from silverfund.enums import FactorGroup
 from silverfund.records import Score, Signal
 
 
 class ScoreConstructor(Protocol):
     """Protocol for functions that construct a Score from signals."""
 
-    def __call__(self, signals: Signal, col: str, over: str) -> Score: ...
+    def __call__(self, signals: Signal | pl.LazyFrame, col: str, over: str) -> Score | pl.LazyFrame: ...
 
 
-def z_score(signals: Signal, signal_col: str) -> Score:
+def z_score(signals: Signal | pl.LazyFrame, signal_col: str) -> Score | pl.LazyFrame:
     """Computes the z-score normalization of a given signal.
 
     The z-score is computed by subtracting the mean and dividing by the
@@ -19,24 +21,257 @@ def z_score(signals: Signal, signal_col: str) -> Score:
     allows signals to be compared across different time periods.
 
     Args:
-        signals (Signal): A dataset containing asset signals.
+        signals (Signal | pl.LazyFrame): A dataset containing asset signals.
         signal_col (str): The column in `signals` to normalize.
 
     Returns:
-        Score: A Polars DataFrame wrapped in the Score class,
-               containing 'date', 'barrid', and the standardized 'score' column.
+        Score | pl.LazyFrame: A Polars DataFrame wrapped in the Score class,
+               containing 'date', 'barrid', and the standardized 'score' column,
+               or an uncollected query plan if `signals` is lazy.
     """
-    return Score(
-        signals.with_columns(
-            (
-                (pl.col(signal_col) - pl.col(signal_col).mean().over("date"))
-                / pl.col(signal_col).std().over("date")
-            ).alias("score")
-        )
+    scores = (
+        signals.lazy()
+        .with_columns(((pl.col(signal_col) - pl.col(signal_col).mean().over("date")) / pl.col(signal_col).std().over("date")).alias("score"))
         .select(["date", "barrid", "score"])
-        .sort(["barrid", "date"])
     )
 
+    if isinstance(signals, pl.LazyFrame):
+        return Score.validate_lazy(scores)
 
-def no_score(signals: Signal) -> Score:
-    return Score(signals.rename({"signal": "score"}))
+    return Score(scores)
+
+
+def no_score(signals: Signal | pl.LazyFrame) -> Score | pl.LazyFrame:
+    scores = signals.lazy().rename({"signal": "score"})
+
+    if isinstance(signals, pl.LazyFrame):
+        return Score.validate_lazy(scores)
+
+    return Score(scores)
+
+
+def score_stats(
+    signals: pl.DataFrame | pl.LazyFrame, signal_cols: list[str], winsorize: float | None = None, rank: bool = False
+) -> pl.DataFrame | pl.LazyFrame:
+    """Computes the per-date statistics used to score many signals, in one aggregation.
+
+    All statistics of all signals come from a single `group_by("date")`, so scoring ten signals
+    costs one pass over the data instead of ten. The result is small (one row per date) and can be
+    kept, or stored with `StageCache`, and passed to `z_scores` by later stages.
+
+    Args:
+        signals (pl.DataFrame | pl.LazyFrame): A dataset with 'date', 'barrid', and the signal columns.
+        signal_cols (list[str]): The signal columns.
+        winsorize (float, optional): If given, each signal is clipped to its per-date `winsorize` and
+            `1 - winsorize` quantiles before the mean and standard deviation are computed.
+        rank (bool, optional): Whether to compute the statistics of the per-date ranks of the signals. Defaults to False.
+
+    Returns:
+        pl.DataFrame | pl.LazyFrame: One row per date with '<col>_mean' and '<col>_std' columns per
+            signal, and '<col>_lower' and '<col>_upper' clip bounds if `winsorize` is given, lazy if `signals` is lazy.
+    """
+    aggregations = []
+    for col in signal_cols:
+        value = pl.col(col)
+
+        if winsorize is not None:
+            lower = value.quantile(winsorize)
+            upper = value.quantile(1 - winsorize)
+            aggregations += [lower.alias(f"{col}_lower"), upper.alias(f"{col}_upper")]
+            value = value.clip(lower, upper)
+
+        aggregations += [value.mean().alias(f"{col}_mean"), value.std().alias(f"{col}_std")]
+
+    stats = _transform(signals.lazy(), signal_cols, rank).group_by("date").agg(aggregations).sort("date")
+
+    if isinstance(signals, pl.LazyFrame):
+        return stats
+
+    return stats.collect()
+
+
+def z_scores(
+    signals: pl.DataFrame | pl.LazyFrame,
+    signal_cols: list[str],
+    winsorize: float | None = None,
+    rank: bool = False,
+    stats: pl.DataFrame | pl.LazyFrame | None = None,
+) -> pl.DataFrame | pl.LazyFrame:
+    """Computes the z-scores of many signals at once.
+
+    The per-date statistics of every signal are computed in one aggregation (see `score_stats`)
+    and joined back once, instead of two `over("date")` windows per signal as in `z_score`.
+
+    Args:
+        signals (pl.DataFrame | pl.LazyFrame): A dataset with 'date', 'barrid', and the signal columns.
+        signal_cols (list[str]): The signal columns to score.
+        winsorize (float, optional): If given, each signal is clipped to its per-date `winsorize` and
+            `1 - winsorize` quantiles before it is standardized.
+        rank (bool, optional): Whether to standardize the per-date ranks of the signals instead of their values. Defaults to False.
+        stats (pl.DataFrame | pl.LazyFrame, optional): Precomputed statistics from `score_stats` with the same
+            `winsorize` and `rank` settings. Computed if not given.
+
+    Returns:
+        pl.DataFrame | pl.LazyFrame: The 'date' and 'barrid' columns and one score column per signal, named
+            after the signal, in the row order of `signals`, lazy if `signals` is lazy. Select a column as
+            'score' to build a `Score`.
+    """
+    transformed = _transform(signals.lazy(), signal_cols, rank)
+
+    if stats is None:
+        stats = score_stats(signals.lazy(), signal_cols, winsorize, rank)
+
+    score_exprs = []
+    for col in signal_cols:
+        value = pl.col(col)
+
+        if winsorize is not None:
+            value = value.clip(pl.col(f"{col}_lower"), pl.col(f"{col}_upper"))
+
+        score_exprs.append(((value - pl.col(f"{col}_mean")) / pl.col(f"{col}_std")).alias(col))
+
+    scores = transformed.join(stats.lazy(), on="date", how="left").select("date", "barrid", *score_exprs)
+
+    if isinstance(signals, pl.LazyFrame):
+        return scores
+
+    return scores.collect()
+
+
+def factor_neutral_scores(
+    signals: pl.DataFrame | pl.LazyFrame,
+    signal_cols: list[str],
+    exposures: pl.DataFrame | None = None,
+    factors: list[str] | None = None,
+) -> pl.DataFrame:
+    """Neutralizes many signals against factor exposures and standardizes the residuals.
+
+    Each date's signals are regressed on that date's exposure matrix and replaced by the z-score of
+    their residuals. The exposure matrix of a date is factorized once (an orthonormal basis of its
+    column space from a thin SVD, which tolerates empty or collinear industry columns) and every
+    signal observed on the same assets is projected with the same factorization as one matrix
+    product, so adding signals costs a matrix multiply rather than another regression.
+
+    The factorizations are not cached across calls: a basis depends on which assets a signal
+    observes on the date, not only on the date's exposures.
+
+    Args:
+        signals (pl.DataFrame | pl.LazyFrame): A dataset with 'date', 'barrid', and the signal columns.
+        signal_cols (list[str]): The signal columns to neutralize.
+        exposures (pl.DataFrame, optional): Wide exposures with 'date', 'barrid', and one column per factor,
+            as stored by `data_access_layer_v2.exposures`. Loaded for the dates of `signals` if not given.
+        factors (list[str], optional): The factors to neutralize against. Defaults to every factor column of
+            `exposures`, or to all Barra factors when the exposures are loaded.
+
+    Returns:
+        pl.DataFrame: The 'date' and 'barrid' columns and one score column per signal, named after the
+            signal and sorted by barrid and date. Scores are null where the signal or the asset's exposures are missing.
+    """
+    if isinstance(signals, pl.LazyFrame):
+        signals = signals.collect()
+
+    if exposures is None:
+        exposures, all_factors = _load_exposures(signals, FactorGroup.ALL)
+        factors = factors or all_factors
+
+    factors = factors or [col for col in exposures.columns if col not in ("date", "barrid")]
+
+    # Align exposures to the signals, grouped by date
+    exposures = exposures.select(
+        "date", pl.col("barrid").cast(signals.schema["barrid"], strict=False), *factors, pl.lit(True).alias("_exposed")
+    ).drop_nulls("barrid")
+
+    df = (
+        signals.select("date", "barrid", *signal_cols)
+        .join(exposures, on=["date", "barrid"], how="left")
+        .with_columns(pl.col(factors).fill_null(0), pl.col("_exposed").fill_null(False))
+        .sort(["date", "barrid"])
+    )
+
+    X = df.select(factors).to_numpy().astype(np.float64)
+    Y = df.select(pl.col(signal_cols).cast(pl.Float64).fill_null(np.nan)).to_numpy()
+    exposed = df["_exposed"].to_numpy()
+
+    # Date blocks
+    dates = df["date"].to_physical().to_numpy()
+    bounds = np.concatenate([[0], np.flatnonzero(dates[1:] != dates[:-1]) + 1, [len(dates)]])
+
+    residuals = np.full_like(Y, np.nan)
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        x, y = X[start:end], Y[start:end]
+        observed = ~np.isnan(y) & exposed[start:end, None]
+
+        # One factorization per distinct set of observed assets
+        masks, groups = np.unique(observed, axis=1, return_inverse=True)
+        groups = groups.ravel()
+
+        for group, mask in enumerate(masks.T):
+            rows = np.flatnonzero(mask)
+
+            if len(rows) == 0:
+                continue
+
+            cols = np.flatnonzero(groups == group)
+            basis = _orthonormal_basis(x[rows])
+            y_group = y[np.ix_(rows, cols)]
+            residuals[np.ix_(start + rows, cols)] = y_group - basis @ (basis.T @ y_group)
+
+    # Standardize
+    residuals_df = df.select("date", "barrid").with_columns(pl.Series(col, residuals[:, i]).fill_nan(None) for i, col in enumerate(signal_cols))
+
+    return z_scores(residuals_df, signal_cols).sort(["barrid", "date"])
+
+
+def factor_neutral_score(
+    signals: Signal | pl.LazyFrame,
+    signal_col: str,
+    factor_group: FactorGroup = FactorGroup.ALL,
+    exposures: pl.DataFrame | None = None,
+) -> Score:
+    """Computes the factor-neutral z-score of a signal (see `factor_neutral_scores`).
+
+    Args:
+        signals (Signal | pl.LazyFrame): A dataset containing asset signals.
+        signal_col (str): The column in `signals` to neutralize.
+        factor_group (FactorGroup, optional): The Barra factors to neutralize against when the exposures are
+            loaded. Defaults to FactorGroup.ALL.
+        exposures (pl.DataFrame, optional): Wide exposures with 'date', 'barrid', and factor columns, all of which
+            are neutralized against. Loaded if not given.
+
+    Returns:
+        Score: A Score object containing 'date', 'barrid', and the residual 'score' column.
+    """
+    signals = signals.collect() if isinstance(signals, pl.LazyFrame) else signals
+
+    if exposures is None:
+        exposures, factors = _load_exposures(signals, factor_group)
+    else:
+        factors = None
+
+    scores = factor_neutral_scores(signals, [signal_col], exposures, factors)
+
+    return Score(scores.rename({signal_col: "score"}))
+
+
+def _load_exposures(signals: pl.DataFrame, factor_group: FactorGroup) -> tuple[pl.DataFrame, list[str]]:
+    # Imported here because the v2 tables resolve their paths at import time
+    from silverfund.data_access_layer_v2 import exposures as exposures_v2
+    from silverfund.data_access_layer_v2.schema.factors import all_factors, industry_factors, risk_factors
+
+    factors = {FactorGroup.RISK: risk_factors, FactorGroup.INDUSTRY: industry_factors, FactorGroup.ALL: all_factors}[factor_group]
+    exposures = exposures_v2.load(signals["date"].min(), signals["date"].max()).select("date", "barrid", *factors)
+
+    return exposures, factors
+
+
+def _orthonormal_basis(x: np.ndarray) -> np.ndarray:
+    u, s, _ = np.linalg.svd(x, full_matrices=False)
+    tolerance = s.max(initial=0) * max(x.shape) * np.finfo(np.float64).eps
+    return u[:, s > tolerance]
+
+
+def _transform(signals: pl.LazyFrame, signal_cols: list[str], rank: bool) -> pl.LazyFrame:
+    if rank:
+        return signals.with_columns(pl.col(signal_cols).rank().over("date").cast(pl.Float64))
+
+    return signals
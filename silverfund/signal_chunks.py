@@ -0,0 +1,90 @@
+from datetime import date
+from pathlib import Path
+from typing import Callable
+
+import polars as pl
+
+from silverfund.records import Signal
+
+
+def compute_signals_by_year(
+    signal_constructor: Callable[[pl.DataFrame], Signal | pl.DataFrame | pl.LazyFrame],
+    start_date: date,
+    end_date: date,
+    lookback: int,
+    output_dir: str | Path,
+    columns: list[str] | None = None,
+    in_universe: bool = True,
+    load: Callable[[date, date], pl.DataFrame] | None = None,
+) -> pl.LazyFrame:
+    """
+    Computes signals one calendar year at a time, writing each year's output to disk.
+
+    Only one year of input data is held in memory at a time. Each year is prefixed with a halo of
+    the last `lookback` rows of every barrid seen so far, so window functions over the rows of a
+    barrid (such as `.rolling_sum(...).over("barrid")`) see the same history as they would over
+    the full panel, and the output matches the in-memory result up to the rounding of running
+    window sums.
+
+    Halo dates only hold the barrids carried over, so their cross-sections are incomplete.
+    Cross-sectional operations over 'date' (such as z-scores) match the in-memory result only
+    for the dates of the year itself; run them on the returned signals, after the halo is
+    trimmed, if they feed a later rolling window.
+
+    Each year is written to `<output_dir>/signals_<year>.parquet`, without the halo rows.
+
+    Args:
+        signal_constructor (Callable[[pl.DataFrame], Signal | pl.DataFrame | pl.LazyFrame]): Computes
+            the signals of a DataFrame sorted by 'barrid' and 'date' (e.g. `momentum_signals` bound
+            with `functools.partial`). The output must have 'date' and 'barrid' columns.
+        start_date (date): The first date of the signals.
+        end_date (date): The last date of the signals.
+        lookback (int): The number of prior rows per barrid the signals depend on (see `MomentumSpec.lookback`).
+        output_dir (str | Path): The directory the yearly outputs are written to. Created if missing.
+        columns (list[str], optional): The asset columns to load. Required unless `load` is given.
+        in_universe (bool, optional): Whether to load only in-universe assets. Defaults to True.
+        load (Callable[[date, date], pl.DataFrame], optional): Loads the input data between two dates.
+            Defaults to `data_access_layer_v2.assets.load` with `in_universe` and `columns`.
+
+    Returns:
+        pl.LazyFrame: A scan of the yearly outputs written by this call.
+    """
+    if load is None:
+        # Imported here because the v2 tables resolve their paths at import time
+        import silverfund.data_access_layer_v2 as dal_v2
+
+        def load(chunk_start: date, chunk_end: date) -> pl.DataFrame:
+            return dal_v2.assets.load(chunk_start, chunk_end, in_universe, columns)
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    halo = None
+    paths = []
+    for year in range(start_date.year, end_date.year + 1):
+        chunk_start = max(start_date, date(year, 1, 1))
+        chunk_end = min(end_date, date(year, 12, 31))
+
+        # Load
+        chunk = load(chunk_start, chunk_end)
+
+        if halo is not None:
+            chunk = pl.concat([halo, chunk]).sort(["barrid", "date"])
+
+        # Compute
+        signals = signal_constructor(chunk)
+
+        if isinstance(signals, pl.LazyFrame):
+            signals = signals.collect()
+
+        # Drop the halo and write
+        signals = pl.DataFrame(signals).filter(pl.col("date").is_between(chunk_start, chunk_end))
+        path = output_dir / f"signals_{year}.parquet"
+        signals.write_parquet(path)
+        paths.append(path)
+
+        # Carry the last rows of each barrid into the next year
+        if lookback > 0:
+            halo = chunk.filter(pl.int_range(pl.len(), 0, -1).over("barrid") <= lookback)
+
+    return pl.scan_parquet(paths)
@@ -1,17 +1,56 @@
-from typing import Protocol
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Protocol
 
+import numpy as np
 import polars as pl
 
+from silverfund.enums import MomentumFlavor
+from silverfund.panels import ReturnsPanel, lagged_window_sum, prefix_sum
 from silverfund.records import Signal
 
 
 class SignalConstructor(Protocol):
-    """Protocol for functions that construct a Signal from a Polars DataFrame."""
+    """Protocol for functions that construct a Signal from a Polars DataFrame.
+
+    Constructors marked with `lazy_constructor` are given a LazyFrame by the backtester and may return a
+    validated LazyFrame (see `Signal.validate_lazy`) so that the signal, score, and alpha stages are fused
+    into one query plan. All other constructors are given a DataFrame.
+    """
+
+    def __call__(self, data: pl.DataFrame | pl.LazyFrame) -> Signal | pl.LazyFrame: ...
 
-    def __call__(self, data: pl.DataFrame) -> Signal: ...
 
+def lazy_constructor(func: Callable[..., Signal | pl.LazyFrame]) -> Callable[..., Signal | pl.LazyFrame]:
+    """Marks a signal constructor as accepting a LazyFrame.
 
-def momentum(data: pl.DataFrame) -> Signal:
+    Args:
+        func (Callable[..., Signal | pl.LazyFrame]): The signal constructor.
+
+    Returns:
+        Callable[..., Signal | pl.LazyFrame]: The same function, marked as accepting lazy data.
+    """
+    func.is_lazy_constructor = True
+    return func
+
+
+def is_lazy_constructor(constructor: SignalConstructor) -> bool:
+    """Checks whether a signal constructor (or a partial of one) accepts a LazyFrame.
+
+    Args:
+        constructor (SignalConstructor): The constructor to check.
+
+    Returns:
+        bool: True if the constructor can be given lazy data.
+    """
+    while isinstance(constructor, partial):
+        constructor = constructor.func
+
+    return getattr(constructor, "is_lazy_constructor", False)
+
+
+@lazy_constructor
+def momentum(data: pl.DataFrame | pl.LazyFrame) -> Signal | pl.LazyFrame:
     """Computes the momentum signal based on log returns.
 
     The momentum signal is calculated by first computing the log returns (`logret`)
@@ -20,24 +59,245 @@ def momentum(data: pl.DataFrame) -> Signal:
     it represents the previous period's momentum for each asset.
 
     Args:
-        data (pl.DataFrame): A Polars DataFrame containing asset return data,
+        data (pl.DataFrame | pl.LazyFrame): A Polars DataFrame containing asset return data,
                               where 'ret' represents the returns of assets.
 
     Returns:
-        Signal: A Signal object containing the 'date', 'barrid', and computed 'mom' (momentum) columns.
+        Signal | pl.LazyFrame: A Signal object containing the 'date', 'barrid', and computed 'mom' (momentum) columns,
+            or an uncollected query plan if `data` is lazy.
     """
     signals = (
-        data.with_columns(pl.col("ret").log1p().alias("logret"))
+        data.lazy()
+        .with_columns(pl.col("ret").log1p().alias("logret"))
         .with_columns(pl.col("logret").rolling_sum(11, min_periods=11).over("barrid").alias("mom"))
         .with_columns(pl.col("mom").shift(1).over("barrid"))
         .select(["date", "barrid", "mom"])
-        .sort(["barrid", "date"])
     )
+
+    if isinstance(data, pl.LazyFrame):
+        return Signal.validate_lazy(signals, "mom")
+
     return Signal(signals, "mom")
 
 
-def no_signal(data: pl.DataFrame) -> Signal:
-    return Signal(
-        data.select("date", "barrid", pl.lit(None).cast(pl.Float64).alias("signal")),
-        signal_name="signal",
+@lazy_constructor
+def no_signal(data: pl.DataFrame | pl.LazyFrame) -> Signal | pl.LazyFrame:
+    signals = data.lazy().select("date", "barrid", pl.lit(None).cast(pl.Float64).alias("signal"))
+
+    if isinstance(data, pl.LazyFrame):
+        return Signal.validate_lazy(signals, "signal")
+
+    return Signal(signals, signal_name="signal")
+
+
+@dataclass(frozen=True)
+class MomentumSpec:
+    """A momentum variant computed by `momentum_signals`.
+
+    The formation period of a variant is the `window` periods ending `skip` periods before the
+    signal date, so `MomentumSpec(MomentumFlavor.VANILLA, 11, 1)` is the `momentum` signal and
+    `MomentumSpec(MomentumFlavor.VANILLA, 230, 22)` is the daily 12-1 month momentum.
+
+    Attributes:
+        flavor (MomentumFlavor): The momentum variant.
+        window (int): The number of periods in the formation period.
+        skip (int): The number of most recent periods left out of the formation period.
+    """
+
+    flavor: MomentumFlavor
+    window: int
+    skip: int = 1
+
+    @property
+    def name(self) -> str:
+        """The name of the signal column, e.g. 'vanilla_momentum_230_22'."""
+        return f"{self.flavor.value}_momentum_{self.window}_{self.skip}"
+
+    @property
+    def lookback(self) -> int:
+        """The number of periods of history needed before the first signal (see `Strategy.lookback`)."""
+        return self.window + self.skip - 1
+
+
+def momentum_signals(
+    data: pl.DataFrame | pl.LazyFrame,
+    specs: list[MomentumSpec],
+    return_col: str = "ret",
+    specific_return_col: str = "specific_return",
+    percent: bool = False,
+) -> pl.DataFrame | pl.LazyFrame:
+    """Computes several momentum variants in one pass over the data.
+
+    The variants share their intermediates: log returns are computed once, each rolling window
+    sum or standard deviation is computed once per window no matter how many variants and skips
+    use it, and each lag is computed once per skip. Every intermediate of a stage is evaluated in
+    a single `with_columns`, so the data is grouped by barrid once per stage rather than once per
+    variant, and it is never re-sorted.
+
+    The variants, over the formation period of each spec, are:
+
+    - vanilla: the sum of log returns.
+    - idiosyncratic: the sum of log specific returns.
+    - volatility_adjusted: the vanilla momentum divided by the standard deviation of returns.
+    - frog_in_the_pan: the product of the cross-sectional z-scores of the vanilla momentum and of the
+      information discreteness, sign(momentum) * (% negative periods - % positive periods).
+
+    A return of -100% or less has no log return, so it counts as missing, like a null return.
+
+    Args:
+        data (pl.DataFrame | pl.LazyFrame): Asset return data sorted by 'barrid' and 'date'.
+        specs (list[MomentumSpec]): The variants to compute.
+        return_col (str, optional): The column of total returns. Defaults to "ret".
+        specific_return_col (str, optional): The column of specific returns, only needed for the
+            idiosyncratic variant. Defaults to "specific_return".
+        percent (bool, optional): Whether the returns are in percent space (as in `data_access_layer_v2`). Defaults to False.
+
+    Returns:
+        pl.DataFrame | pl.LazyFrame: The 'date' and 'barrid' columns and one column per spec named
+            `spec.name`, lazy if `data` is lazy.
+    """
+    scale = 100 if percent else 1
+
+    # Row-wise intermediates
+    row_exprs = {"_logret": _log_return(pl.col(return_col).truediv(scale))}
+
+    rolling_needs: dict[str, tuple[str, str, int]] = {}
+
+    def rolling(op: str, column: str, window: int) -> str:
+        name = f"{column}_{op}_{window}"
+        rolling_needs[name] = (op, column, window)
+        return name
+
+    lag_needs: dict[str, tuple[str, int]] = {}
+
+    def lag(column: str, skip: int) -> pl.Expr:
+        name = f"{column}_lag_{skip}"
+        lag_needs[name] = (column, skip)
+        return pl.col(name)
+
+    # Outputs, registering the intermediates each one needs
+    outputs = []
+    for spec in specs:
+        match spec.flavor:
+            case MomentumFlavor.VANILLA:
+                output = lag(rolling("sum", "_logret", spec.window), spec.skip)
+
+            case MomentumFlavor.IDIOSYNCRATIC:
+                row_exprs["_spec_logret"] = _log_return(pl.col(specific_return_col).truediv(scale))
+                output = lag(rolling("sum", "_spec_logret", spec.window), spec.skip)
+
+            case MomentumFlavor.VOLATILITY_ADJUSTED:
+                row_exprs["_ret"] = pl.col(return_col).truediv(scale)
+                momentum_ = lag(rolling("sum", "_logret", spec.window), spec.skip)
+                volatility = lag(rolling("std", "_ret", spec.window), spec.skip)
+                output = pl.when(volatility > 0).then(momentum_ / volatility)
+
+            case MomentumFlavor.FROG_IN_THE_PAN:
+                row_exprs["_positive"] = pl.col(return_col).gt(0).cast(pl.Int32)
+                row_exprs["_negative"] = pl.col(return_col).lt(0).cast(pl.Int32)
+                momentum_ = lag(rolling("sum", "_logret", spec.window), spec.skip)
+                positive = lag(rolling("sum", "_positive", spec.window), spec.skip)
+                negative = lag(rolling("sum", "_negative", spec.window), spec.skip)
+                discreteness = momentum_.sign() * (negative - positive) / spec.window
+                output = _cross_sectional_z(momentum_) * _cross_sectional_z(discreteness)
+
+        outputs.append(output.fill_nan(None).alias(spec.name))
+
+    # Rolling intermediates
+    rolling_exprs = [
+        (pl.col(column).rolling_sum(window) if op == "sum" else pl.col(column).rolling_std(window)).over("barrid").alias(name)
+        for name, (op, column, window) in rolling_needs.items()
+    ]
+
+    # Lagged intermediates
+    lag_exprs = [pl.col(column).shift(skip).over("barrid").alias(name) for name, (column, skip) in lag_needs.items()]
+
+    signals = data.lazy().with_columns(**row_exprs).with_columns(rolling_exprs).with_columns(lag_exprs).select("date", "barrid", *outputs)
+
+    if isinstance(data, pl.LazyFrame):
+        return signals
+
+    return signals.collect()
+
+
+@lazy_constructor
+def momentum_variant(
+    data: pl.DataFrame | pl.LazyFrame,
+    spec: MomentumSpec,
+    return_col: str = "ret",
+    specific_return_col: str = "specific_return",
+    percent: bool = False,
+) -> Signal | pl.LazyFrame:
+    """Computes one momentum variant as a signal (see `momentum_signals`).
+
+    Bind the spec with `functools.partial` to use a variant as a strategy's signal constructor.
+
+    Args:
+        data (pl.DataFrame | pl.LazyFrame): Asset return data sorted by 'barrid' and 'date'.
+        spec (MomentumSpec): The variant to compute.
+        return_col (str, optional): The column of total returns. Defaults to "ret".
+        specific_return_col (str, optional): The column of specific returns. Defaults to "specific_return".
+        percent (bool, optional): Whether the returns are in percent space. Defaults to False.
+
+    Returns:
+        Signal | pl.LazyFrame: A Signal object with the `spec.name` signal column, or an uncollected query plan if `data` is lazy.
+    """
+    signals = momentum_signals(data.lazy(), [spec], return_col, specific_return_col, percent)
+
+    if isinstance(data, pl.LazyFrame):
+        return Signal.validate_lazy(signals, spec.name)
+
+    return Signal(signals, spec.name)
+
+
+def momentum_sweep(returns: ReturnsPanel, windows: list[tuple[int, int]], percent: bool = False) -> pl.DataFrame:
+    """Computes vanilla momentum for many (window, skip) pairs from one cumulative log-return panel.
+
+    The prefix sums of the log returns (and of the observation counts) are built once; each
+    momentum is then the difference of two lagged rows of the prefix sums. Every pair costs one
+    O(T x N) subtraction no matter how long its window is, so a sweep over candidate windows
+    costs about as much as reading the output.
+
+    Windows are measured in panel dates, and a momentum is only defined where every date of its
+    formation period was observed. A return of -100% or less has no log return, so it counts as
+    missing. For data without gaps this matches `momentum_signals`.
+
+    Args:
+        returns (ReturnsPanel): The returns panel (see `ReturnsPanel.from_frame`).
+        windows (list[tuple[int, int]]): The (window, skip) pairs to compute.
+        percent (bool, optional): Whether the returns are in percent space. Defaults to False.
+
+    Returns:
+        pl.DataFrame: The 'date' and 'barrid' of each observed return and one column per pair,
+            named like `MomentumSpec.name` (e.g. 'vanilla_momentum_230_22'), sorted by barrid and date.
+    """
+    mask = returns.mask
+    logret = (returns / 100 if percent else returns).log1p()
+
+    # Cumulative panels (of the finite log returns only)
+    sums = prefix_sum(np.where(logret.mask, logret.values, 0))
+    counts = prefix_sum(logret.mask.astype(np.float64))
+
+    # Barrid-major order matches the canonical record order
+    cols, rows = np.nonzero(mask.T)
+
+    signals = {}
+    for window, skip in windows:
+        complete = lagged_window_sum(counts, window, skip) == window
+        momentum_ = np.where(complete, lagged_window_sum(sums, window, skip), np.nan)
+        signals[MomentumSpec(MomentumFlavor.VANILLA, window, skip).name] = momentum_[rows, cols]
+
+    return pl.DataFrame({"date": returns.dates.gather(rows), "barrid": pl.Series(returns.index.barrids).gather(cols), **signals}).with_columns(
+        pl.col(list(signals)).fill_nan(None)
     )
+
+
+def _log_return(ret: pl.Expr) -> pl.Expr:
+    """The log return, null for returns of -100% or less, which have none."""
+    return pl.when(ret > -1).then(ret.log1p())
+
+
+def _cross_sectional_z(expr: pl.Expr) -> pl.Expr:
+    """The z-score of `expr` across assets on each date, null where its standard deviation is zero or undefined."""
+    std = expr.std()
+    return pl.when(std > 0).then(expr.sub(expr.mean()).truediv(std)).over("date")
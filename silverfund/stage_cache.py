@@ -0,0 +1,104 @@
+from pathlib import Path
+from typing import Callable
+
+import polars as pl
+
+from silverfund.fingerprints import fingerprint_frame, hash_key
+from silverfund.strategies import Strategy
+from silverfund.streaming import collect_streaming
+
+
+class StageCache:
+    """
+    Persists signal, score, and alpha outputs on disk, addressed by the hash of their inputs.
+
+    Each output is stored as `<stage>_<key>.arrow` in Arrow IPC format, so a cached stage is
+    loaded by memory mapping the file rather than recomputing it. Outputs are never overwritten:
+    a changed input produces a new key and therefore a new file.
+
+    Attributes:
+        _cache_dir (Path): The directory holding the cached outputs.
+    """
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        """
+        Initializes a StageCache instance.
+
+        Args:
+            cache_dir (str | Path): The directory holding the cached outputs. Created if missing.
+        """
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, stage: str, key: str) -> Path:
+        return self._cache_dir / f"{stage}_{key}.arrow"
+
+    def contains(self, stage: str, key: str) -> bool:
+        """
+        Checks whether a stage output has been cached under the given key.
+
+        Args:
+            stage (str): The stage name (e.g. "signal").
+            key (str): The stage key from `stage_keys`.
+
+        Returns:
+            bool: True if the output can be loaded from disk.
+        """
+        return self._path(stage, key).exists()
+
+    def get_or_compute(self, stage: str, key: str, compute: Callable[[], pl.DataFrame | pl.LazyFrame]) -> pl.LazyFrame:
+        """
+        Loads a stage output from the cache, computing and caching it first if it is missing.
+
+        The file is written under a temporary name and renamed, so an interrupted run never leaves
+        a partial output behind.
+
+        Args:
+            stage (str): The stage name (e.g. "signal").
+            key (str): The stage key from `stage_keys`.
+            compute (Callable[[], pl.DataFrame | pl.LazyFrame]): Computes the stage output. Only called on a miss.
+
+        Returns:
+            pl.LazyFrame: A scan of the cached output.
+        """
+        path = self._path(stage, key)
+
+        if not path.exists():
+            output = compute()
+
+            if isinstance(output, pl.LazyFrame):
+                output = collect_streaming(output)
+
+            temp_path = path.with_suffix(".tmp")
+            output.write_ipc(temp_path)
+            temp_path.replace(path)
+
+        return pl.scan_ipc(path)
+
+
+def stage_keys(strategy: Strategy, data: pl.DataFrame, data_version: str | None = None) -> dict[str, str]:
+    """
+    Computes the cache key of the signal, score, and alpha stages of a strategy.
+
+    Each key chains the key of the stage before it with the stage's constructor (including
+    bound `functools.partial` arguments such as `signal_col` or `ic`), so editing a stage only
+    invalidates that stage and the ones after it.
+
+    The input data is identified by its date range and `data_version`. Without a data version the
+    content of the data is hashed instead.
+
+    Args:
+        strategy (Strategy): The strategy whose stages are cached.
+        data (pl.DataFrame): The data the signals are computed from.
+        data_version (str | None, optional): An identifier of the input data (e.g. the Barra delivery date).
+
+    Returns:
+        dict[str, str]: The cache key of the "signal", "score", and "alpha" stages.
+    """
+    data_key = data_version if data_version is not None else fingerprint_frame(data)
+
+    signal_key = hash_key(strategy.signal_constructor, data["date"].min(), data["date"].max(), data_key)
+    score_key = hash_key(signal_key, strategy.score_constructor)
+    alpha_key = hash_key(score_key, strategy.alpha_constructor)
+
+    return {"signal": signal_key, "score": score_key, "alpha": alpha_key}
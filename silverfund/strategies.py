@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from silverfund.alphas import AlphaConstructor
 from silverfund.constraints import ConstraintConstructor
-from silverfund.portfolios import PortfolioConstructor
+from silverfund.portfolios import PanelPortfolioConstructor, PortfolioConstructor
 from silverfund.scores import ScoreConstructor
 from silverfund.signals import SignalConstructor
 
@@ -18,12 +18,17 @@ class Strategy:
         signal_constructor (SignalConstructor): A callable that constructs signals for assets.
         score_constructor (ScoreConstructor): A callable that calculates scores based on signals.
         alpha_constructor (AlphaConstructor): A callable that constructs alpha values from scores.
-        portfolio_constructor (PortfolioConstructor): A callable that constructs portfolios using alphas.
+        portfolio_constructor (PortfolioConstructor | PanelPortfolioConstructor): A callable that constructs
+            portfolios using alphas, either one period at a time or for all periods at once.
         constraints (list[ConstraintConstructor]): A list of constraint constructors for portfolio optimization.
+        lookback (int | None): The number of prior rows per barrid the signal constructor needs before the
+            first period it produces a signal for (e.g. 11 for `momentum`, whose 11 row sum is lagged by one row).
+            Required to extend a backtest, which loads only that history. None if unknown.
     """
 
     signal_constructor: SignalConstructor
     score_constructor: ScoreConstructor
     alpha_constructor: AlphaConstructor
-    portfolio_constructor: PortfolioConstructor
+    portfolio_constructor: PortfolioConstructor | PanelPortfolioConstructor
     constraints: list[ConstraintConstructor]
+    lookback: int | None = None
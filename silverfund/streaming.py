@@ -0,0 +1,133 @@
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import polars as pl
+import pyarrow.parquet as pq
+import ray
+
+_POLARS_VERSION = tuple(int(part) for part in pl.__version__.split(".")[:2])
+
+
+class ParquetSink:
+    """
+    Appends Polars DataFrames to a single parquet file as they arrive.
+
+    Each written DataFrame becomes one row group, so the driver only ever holds the frame
+    currently being written.
+
+    Attributes:
+        _path (Path): The parquet file being written.
+        _writer (pq.ParquetWriter | None): The open writer, created on the first write.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Initializes a ParquetSink instance.
+
+        Args:
+            path (str | Path): The parquet file to write.
+        """
+        self._path = Path(path)
+        self._writer = None
+
+    def __enter__(self) -> "ParquetSink":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def write(self, df: pl.DataFrame) -> None:
+        """
+        Appends a DataFrame to the parquet file.
+
+        Args:
+            df (pl.DataFrame): The DataFrame to append. Must match the schema of the first write.
+        """
+        table = df.to_arrow()
+
+        if self._writer is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(self._path, table.schema)
+
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        """Closes the parquet file."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def collect_streaming(frame: pl.LazyFrame) -> pl.DataFrame:
+    """
+    Collects a query plan with the streaming engine.
+
+    Polars 1.23 replaced `collect(streaming=True)` with `collect(engine="streaming")`, so the
+    option is chosen from the installed version.
+
+    Args:
+        frame (pl.LazyFrame): The query plan to execute.
+
+    Returns:
+        pl.DataFrame: The collected result.
+    """
+    if _POLARS_VERSION >= (1, 23):
+        return frame.collect(engine="streaming")
+
+    return frame.collect(streaming=True)
+
+
+def stream_to_sink(
+    submit: Callable[[Any], ray.ObjectRef],
+    items: Iterable[Any],
+    sink: ParquetSink,
+    max_in_flight: int,
+    on_result: Callable[[Any, pl.DataFrame], None] | None = None,
+) -> None:
+    """
+    Dispatches Ray tasks and writes their results to a sink as they complete.
+
+    At most `max_in_flight` tasks are submitted at a time; a new task is only submitted once a
+    running one has finished and its result has been written. The first failing task raises
+    immediately and the tasks still in flight are cancelled.
+
+    Args:
+        submit (Callable[[Any], ray.ObjectRef]): Submits the task for one item and returns its future.
+        items (Iterable[Any]): The items to dispatch, in submission order.
+        sink (ParquetSink): The sink that receives each task's DataFrame result.
+        max_in_flight (int): The maximum number of tasks submitted but not yet collected.
+        on_result (Callable[[Any, pl.DataFrame], None], optional): Called with each item and its result after
+            the result is written.
+    """
+    remaining = iter(items)
+    in_flight = []
+    in_flight_items = {}
+
+    try:
+        while True:
+            # Top up tasks in flight
+            for item in remaining:
+                future = submit(item)
+                in_flight.append(future)
+                in_flight_items[future] = item
+
+                if len(in_flight) >= max_in_flight:
+                    break
+
+            if len(in_flight) == 0:
+                break
+
+            # Collect the next finished task
+            done, in_flight = ray.wait(in_flight, num_returns=1)
+            result = ray.get(done[0])
+            sink.write(result)
+
+            item = in_flight_items.pop(done[0])
+
+            if on_result is not None:
+                on_result(item, result)
+
+    except Exception:
+        for future in in_flight:
+            ray.cancel(future)
+        raise
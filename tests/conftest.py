@@ -0,0 +1,127 @@
+import shutil
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import polars as pl
+import pytest
+
+
+@pytest.fixture
+def returns() -> pl.DataFrame:
+    """A synthetic panel of daily returns for 12 barrids over 80 dates, sorted by barrid and date.
+
+    Every barrid has a row on every date, and about 5% of the returns are null.
+    """
+    rng = np.random.default_rng(0)
+    n_dates, n_assets = 80, 12
+
+    dates = [date(2020, 1, 1) + timedelta(days=i) for i in range(n_dates)]
+    barrids = [f"USA{i:04d}" for i in range(n_assets)]
+
+    ret = rng.normal(0.0005, 0.02, (n_assets, n_dates))
+    specific_return = ret - rng.normal(0.0003, 0.01, n_dates)
+    missing = rng.random((n_assets, n_dates)) < 0.05
+
+    return pl.DataFrame(
+        {
+            "date": dates * n_assets,
+            "barrid": np.repeat(barrids, n_dates),
+            "ret": np.where(missing, np.nan, ret).ravel(),
+            "specific_return": np.where(missing, np.nan, specific_return).ravel(),
+        }
+    ).with_columns(pl.col("ret", "specific_return").fill_nan(None))
+
+
+@pytest.fixture(scope="session")
+def barra_data() -> Iterator[Path]:
+    """A synthetic copy of the shared data directory, pointed to by the ROOT environment variable.
+
+    The loaders build the data directory from the first two components of ROOT, so the data is
+    written to a fresh directory directly under /tmp. It holds 30 barrids with 5 factors on the
+    weekdays from 2023-10-02 to 2024-02-29, and a Russell history whose constituents change on
+    2023-12-01 (five barrids leave and five join).
+    """
+    rng = np.random.default_rng(0)
+    root = Path(tempfile.mkdtemp(prefix="silverfund-", dir="/tmp"))
+    data_dir = root / "groups" / "grp_quant" / "data"
+
+    days = pl.date_range(date(2023, 10, 2), date(2024, 2, 29), "1d", eager=True)
+    days = days.filter(days.dt.weekday() <= 5)
+    barrids = [f"USA{i:04d}" for i in range(30)]
+    factors = [f"F{k}" for k in range(5)]
+
+    for folder in ["dsf", "barra_usslow", "barra_usslow_ret", "barra_usslow_asset"]:
+        (data_dir / folder).mkdir(parents=True)
+
+    # Trading days (every year up to today is read)
+    for year in range(1995, date.today().year + 1):
+        pl.DataFrame({"date": days.filter(days.dt.year() == year).cast(pl.Datetime)}).write_parquet(data_dir / "dsf" / f"dsf_{year}.parquet")
+
+    month_ends = days.to_frame("date").group_by(pl.col("date").dt.truncate("1mo")).agg(pl.col("date").max().alias("month_end"))["month_end"].sort()
+    pl.DataFrame({"date": month_ends.cast(pl.Datetime)}).write_parquet(data_dir / "msf.parquet")
+
+    # Russell history
+    rebalances = [(date(2023, 10, 2), barrids[:25]), (date(2023, 12, 1), barrids[5:])]
+    russell = pl.DataFrame(
+        {
+            "date": [day for day, members in rebalances for _ in members],
+            "barrid": [barrid for _, members in rebalances for barrid in members],
+        }
+    ).with_columns(pl.col("date").alias("obsdate"), pl.col("date").alias("enddate"))
+    russell.with_columns(pl.col("date", "obsdate", "enddate").cast(pl.Datetime)).write_parquet(data_dir / "russell_history.parquet")
+
+    for year in [2023, 2024]:
+        year_days = days.filter(days.dt.year() == year)
+        n = len(year_days) * len(barrids)
+        long = {
+            "__index_level_0__": np.arange(n),
+            "DataDate": np.repeat(year_days.to_numpy(), len(barrids)).astype("datetime64[us]"),
+            "Barrid": barrids * len(year_days),
+        }
+
+        # Returns and asset risk
+        pl.DataFrame(
+            {
+                **long,
+                "Currency": ["USD"] * n,
+                "MktCap": rng.uniform(1e8, 1e10, n),
+                "Price": rng.uniform(3, 100, n),
+                "Ret": rng.normal(0.0005, 0.02, n),
+            }
+        ).write_parquet(data_dir / "barra_usslow_ret" / f"ret_{year}.parquet")
+        pl.DataFrame(
+            {
+                **long,
+                "Div_Yield": rng.uniform(0, 3, n),
+                "Total_Risk": rng.uniform(20, 50, n),
+                "Spec_Risk": rng.uniform(10, 40, n),
+                "HistBeta": rng.uniform(0.5, 1.5, n),
+                "PredBeta": rng.uniform(0.5, 1.5, n),
+            }
+        ).write_parquet(data_dir / "barra_usslow_asset" / f"asset_{year}.parquet")
+
+        # Risk model (one column per date)
+        columns = [day.strftime("%Y-%m-%d 00:00:00") for day in year_days]
+        combined = [f"{barrid}/{factor}" for barrid in barrids for factor in factors]
+        pl.DataFrame({"Combined": combined, **{column: rng.normal(0, 1, len(combined)) for column in columns}}).write_parquet(
+            data_dir / "barra_usslow" / f"exposures_{year}.parquet"
+        )
+
+        a = rng.normal(0, 1, (len(factors), len(factors)))
+        covariance = a @ a.T + 5 * np.eye(len(factors))
+        pairs = [(i, j) for i in range(len(factors)) for j in range(i, len(factors))]
+        pl.DataFrame(
+            {"Combined": [f"{factors[i]}/{factors[j]}" for i, j in pairs], **{column: [covariance[i, j] for i, j in pairs] for column in columns}}
+        ).write_parquet(data_dir / "barra_usslow" / f"factor_covariance_{year}.parquet")
+        pl.DataFrame({"Barrid": barrids, **{column: rng.uniform(10, 40, len(barrids)) for column in columns}}).write_parquet(
+            data_dir / "barra_usslow" / f"spec_risk_{year}.parquet"
+        )
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("ROOT", str(root / "user"))
+        yield data_dir
+
+    shutil.rmtree(root)
@@ -0,0 +1,89 @@
+from datetime import date
+
+import polars as pl
+import pytest
+
+import silverfund.data_access_layer as dal
+import silverfund.data_access_layer.asset_ids as asset_ids
+from silverfund.enums import Interval
+
+BARRIDS = [f"USA{i:04d}" for i in range(30)]
+START, END = date(2023, 11, 27), date(2024, 1, 5)
+
+
+@pytest.fixture
+def dictionary(barra_data, tmp_path, monkeypatch):
+    """A fresh, unbuilt dictionary for the duration of a test."""
+    monkeypatch.setattr(asset_ids, "_dictionary_path", lambda: tmp_path / "asset_ids" / "barrid_ids.parquet")
+    monkeypatch.setattr(asset_ids, "_asset_ids", None)
+
+    return tmp_path / "asset_ids" / "barrid_ids.parquet"
+
+
+def test_load_before_build_raises(dictionary):
+    with pytest.raises(FileNotFoundError, match="has not been built"):
+        dal.load_asset_ids()
+
+
+def test_build_and_register_assign_dense_stable_ids(dictionary):
+    built = dal.build_asset_ids()
+
+    assert built["barrid"].to_list() == BARRIDS
+    assert built["id"].to_list() == list(range(30))
+    assert built.schema == pl.Schema({"barrid": pl.String, "id": pl.Int32})
+
+    # Known barrids keep their ids, new ones are appended
+    registered = dal.register_barrids(["USA9999", "USA0003", None, "USA9998"])
+    assert registered.head(30).equals(built)
+    assert registered.tail(2).rows() == [("USA9998", 30), ("USA9999", 31)]
+
+    # Persisted, and rebuilding changes nothing
+    assert pl.read_parquet(dictionary).equals(registered)
+    assert dal.build_asset_ids().equals(registered)
+    assert dal.load_asset_ids(reload=True).equals(registered)
+
+
+def test_encode_decode_round_trip(dictionary):
+    dal.build_asset_ids()
+    df = pl.DataFrame({"barrid": ["USA0007", "USA0002", None, "USA0007"], "value": [1, 2, 3, 4]})
+
+    encoded = dal.encode_barrids(df)
+    assert encoded.schema["barrid"] == dal.barrid_enum()
+    assert encoded["barrid"].to_physical().to_list() == [7, 2, None, 7]
+    assert dal.decode_barrids(encoded).equals(df)
+    assert dal.decode_barrids(df) is df
+
+    # Lazy frames too
+    assert dal.decode_barrids(dal.encode_barrids(df.lazy())).collect().equals(df)
+
+
+def test_encode_unknown_barrid_raises(dictionary):
+    dal.build_asset_ids()
+
+    with pytest.raises(ValueError, match="not in the barrid id dictionary"):
+        dal.encode_barrids(pl.DataFrame({"barrid": ["USA0001", "USA9999"]}))
+
+    # Registered by another process since the dictionary was loaded
+    dal.load_asset_ids()
+    asset_ids._asset_ids = asset_ids._asset_ids.head(29)
+    assert dal.encode_barrids(pl.DataFrame({"barrid": ["USA0029"]}))["barrid"].to_physical().to_list() == [29]
+
+
+@pytest.mark.parametrize(
+    "load",
+    [
+        lambda **kwargs: dal.load_universe(Interval.DAILY, START, END, **kwargs),
+        lambda **kwargs: dal.load_barra_returns(Interval.DAILY, START, END, **kwargs),
+        lambda **kwargs: dal.load_total_risk(Interval.DAILY, START, END, **kwargs),
+        lambda **kwargs: dal.load_benchmark(Interval.DAILY, START, END, **kwargs),
+    ],
+    ids=["universe", "barra_returns", "total_risk", "benchmark"],
+)
+def test_loaders_encode_barrids(dictionary, load):
+    dal.build_asset_ids()
+    strings = load()
+    encoded = load(asset_ids=True)
+
+    assert encoded.schema["barrid"] == dal.barrid_enum()
+    assert dal.decode_barrids(encoded).equals(strings)
+    assert encoded.equals(dal.encode_barrids(strings))
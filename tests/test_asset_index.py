@@ -0,0 +1,77 @@
+from datetime import date
+from functools import partial
+
+import numpy as np
+import polars as pl
+import pytest
+
+import silverfund.data_access_layer as dal
+from silverfund.asset_index import AssetIndex
+from silverfund.constraints import full_investment, long_only
+from silverfund.covariance_matrix import covariance_matrix_constructor, factor_covariance_matrix_constructor, factor_exposure_matrix_constructor
+from silverfund.optimizers import quadratic_program
+from silverfund.portfolios import mean_variance_efficient
+from silverfund.records import Alpha
+
+DATE = date(2024, 1, 3)
+BARRIDS = [f"USA{i:04d}" for i in range(5, 30)]
+
+
+def frame_covariance(date_: date, barrids: list[str]) -> np.ndarray:
+    """The covariance matrix built the frame-based way, from the barrid-sorted exposure pivot and a joined specific risk."""
+    exposures = factor_exposure_matrix_constructor(date_, barrids).drop("barrid").to_numpy()
+    factor_covariance = factor_covariance_matrix_constructor(date_).drop("factor_1").to_numpy()
+    specific_risk = pl.DataFrame({"barrid": barrids}).join(dal.load_specific_risk(date_), on="barrid", how="left")["specific_risk"].to_numpy()
+
+    return (exposures @ factor_covariance @ exposures.T + np.diag(specific_risk**2)) / 100**2
+
+
+def test_positions_and_gather():
+    index = AssetIndex(["USA0003", "USA0001", "USA0002"])
+
+    assert len(index) == 3
+    assert index.barrids == ["USA0003", "USA0001", "USA0002"]
+    assert index.positions(["USA0002", "USA0009", "USA0003"]).tolist() == [2, -1, 0]
+
+    # Extra barrids are dropped and missing positions are filled
+    gathered = index.gather(["USA0002", "USA0009", "USA0003"], np.array([2.0, 9.0, 3.0]), fill_value=np.nan)
+    assert gathered.tolist()[::2] == [3.0, 2.0]
+    assert np.isnan(gathered[1])
+
+    # Rows of a matrix are placed by position
+    df = pl.DataFrame({"barrid": ["USA0001", "USA0003"], "value": [1.0, 3.0]})
+    assert index.gather_column(df, "value").tolist() == [3.0, 1.0, 0.0]
+    assert index.gather(df["barrid"], np.array([[1.0, 10.0], [3.0, 30.0]])).tolist() == [[3.0, 30.0], [1.0, 10.0], [0.0, 0.0]]
+
+
+def test_duplicate_barrids_raise():
+    with pytest.raises(ValueError, match="unique"):
+        AssetIndex(["USA0001", "USA0002", "USA0001"])
+
+
+def test_covariance_matrix_matches_frame_construction(barra_data):
+    expected = frame_covariance(DATE, BARRIDS)
+
+    assert np.allclose(covariance_matrix_constructor(DATE, BARRIDS).to_matrix(), expected, rtol=0, atol=1e-12)
+
+    # Reversed barrids give the same matrix with rows and columns reversed
+    reversed_matrix = covariance_matrix_constructor(DATE, BARRIDS[::-1]).to_matrix()
+    assert np.allclose(reversed_matrix, expected[::-1, ::-1], rtol=0, atol=1e-12)
+
+
+def test_mean_variance_efficient_matches_frame_solve(barra_data):
+    rng = np.random.default_rng(7)
+    alphas = Alpha(pl.DataFrame({"date": DATE, "barrid": BARRIDS, "alpha": rng.normal(0, 0.01, len(BARRIDS))}))
+    constraints = [full_investment, long_only]
+
+    # Frame-based solve with barrid-sorted inputs
+    frame_constraints = [partial(constraint, date_=DATE, barrids=BARRIDS) for constraint in constraints]
+    expected_weights = quadratic_program(alphas["alpha"].to_numpy(), frame_covariance(DATE, BARRIDS), frame_constraints, 2.0)
+    expected = dict(zip(BARRIDS, expected_weights))
+
+    for barrids in [BARRIDS, BARRIDS[::-1]]:
+        portfolio = mean_variance_efficient(DATE, barrids, alphas, constraints)
+        weights = dict(portfolio.select("barrid", "weight").iter_rows())
+
+        assert weights.keys() == expected.keys()
+        assert all(weights[barrid] == pytest.approx(expected[barrid], abs=1e-6) for barrid in BARRIDS)
@@ -0,0 +1,158 @@
+import dataclasses
+from datetime import date
+from functools import partial
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+import silverfund.covariance_matrix as covariance_matrix
+import silverfund.data_access_layer as dal
+from silverfund.alphas import grindold_kahn
+from silverfund.backtester import Backtester
+from silverfund.constraints import full_investment, long_only
+from silverfund.enums import Interval
+from silverfund.portfolios import mean_variance_efficient, quantile_buckets
+from silverfund.scores import z_score
+from silverfund.signals import momentum
+from silverfund.strategies import Strategy
+
+# The backtest spans the universe change on 2023-12-01 and a year boundary
+START, END = date(2023, 11, 27), date(2024, 1, 5)
+
+
+def load_data(start_date: date, end_date: date) -> pl.DataFrame:
+    universe = dal.load_universe(Interval.DAILY, start_date, end_date)
+    returns = dal.load_barra_returns(Interval.DAILY, start_date, end_date)
+    return universe.join(returns, on=["date", "barrid"], how="left").sort(["barrid", "date"])
+
+
+@pytest.fixture(scope="module")
+def strategy() -> Strategy:
+    return Strategy(
+        signal_constructor=momentum,
+        score_constructor=partial(z_score, signal_col="mom"),
+        alpha_constructor=partial(grindold_kahn, interval=Interval.DAILY),
+        portfolio_constructor=mean_variance_efficient,
+        constraints=[full_investment, long_only],
+        lookback=11,
+    )
+
+
+@pytest.fixture(scope="module")
+def backtester(barra_data) -> Backtester:
+    # Momentum needs 12 rows of history before the first period
+    return Backtester(Interval.DAILY, START, END, load_data(date(2023, 10, 2), END))
+
+
+@pytest.fixture(scope="module")
+def sequential(backtester, strategy) -> pl.DataFrame:
+    return backtester.run_sequential(strategy)
+
+
+def test_actor_pool_matches_sequential(backtester, strategy, sequential):
+    actor_pool = backtester.run_actor_pool(strategy, n_actors=2)
+
+    assert_frame_equal(actor_pool, sequential, abs_tol=1e-8)
+
+
+def test_resumed_run_skips_checkpointed_periods(backtester, strategy, sequential, tmp_path, monkeypatch):
+    checkpoint_dir = tmp_path / "run"
+    backtester.run_sequential(strategy, checkpoint_dir=str(checkpoint_dir))
+
+    # Lose the checkpoints of two periods
+    checkpoints = sorted(checkpoint_dir.glob("*.parquet"))
+    for path in checkpoints[3:5]:
+        path.unlink()
+
+    constructed = []
+    construct_portfolio = Backtester._construct_portfolio
+
+    def counting_construct_portfolio(period, *args, **kwargs):
+        constructed.append(period)
+        return construct_portfolio(period, *args, **kwargs)
+
+    monkeypatch.setattr(Backtester, "_construct_portfolio", staticmethod(counting_construct_portfolio))
+    resumed = backtester.run_sequential(strategy, checkpoint_dir=str(checkpoint_dir))
+
+    assert [period.isoformat() for period in constructed] == [path.name[:10] for path in checkpoints[3:5]]
+    assert_frame_equal(resumed, sequential, abs_tol=1e-8)
+
+
+def test_extend_matches_a_full_rerun(barra_data, strategy, sequential, monkeypatch):
+    last_date = date(2023, 12, 20)
+    run = Backtester(Interval.DAILY, START, last_date, load_data(date(2023, 10, 2), last_date)).run_sequential(strategy)
+
+    # Record the history window of the returns load
+    starts = []
+    load_barra_returns = dal.load_barra_returns
+
+    def recording_load_barra_returns(interval, start_date=None, end_date=None, **kwargs):
+        starts.append(start_date)
+        return load_barra_returns(interval, start_date, end_date, **kwargs)
+
+    monkeypatch.setattr(dal, "load_barra_returns", recording_load_barra_returns)
+    extended = Backtester(Interval.DAILY, START, last_date, pl.DataFrame()).extend(run, strategy, END)
+
+    assert_frame_equal(extended, sequential, abs_tol=1e-8)
+
+    # Only the lookback rows before the last date are read, not those of barrids that left the universe
+    trading_days = dal.load_trading_days(Interval.DAILY, START, last_date)["date"]
+    assert starts == [trading_days[-strategy.lookback]]
+
+
+def test_batch_matches_separate_runs(backtester, strategy, sequential):
+    strategies = {
+        "mve": strategy,
+        "mve_gamma": dataclasses.replace(strategy, portfolio_constructor=partial(mean_variance_efficient, gamma=10.0)),
+        "deciles": dataclasses.replace(strategy, portfolio_constructor=quantile_buckets),
+    }
+
+    batch = backtester.run_batch(strategies, n_cpus=2)
+
+    assert batch["strategy"].unique().sort().to_list() == sorted(strategies)
+    for name, strategy_ in strategies.items():
+        expected = sequential if name == "mve" else backtester.run_sequential(strategy_)
+        assert_frame_equal(batch.filter(pl.col("strategy") == name).drop("strategy"), expected, abs_tol=1e-8)
+
+
+def test_batch_period_builds_one_covariance_matrix(backtester, strategy, monkeypatch):
+    builds = []
+    factor_covariance_matrix_constructor = covariance_matrix.factor_covariance_matrix_constructor
+
+    def counting_constructor(date_):
+        builds.append(date_)
+        return factor_covariance_matrix_constructor(date_)
+
+    monkeypatch.setattr(covariance_matrix, "factor_covariance_matrix_constructor", counting_constructor)
+    covariance_matrix._covariance_matrix.cache_clear()
+
+    universe = dal.load_universe(Interval.DAILY, START, END)
+    strategies = {"mve": strategy, "mve_gamma": dataclasses.replace(strategy, portfolio_constructor=partial(mean_variance_efficient, gamma=10.0))}
+    alphas = {name: backtester._compute_alphas(strategy_) for name, strategy_ in strategies.items()}
+
+    portfolios = Backtester._construct_portfolios(START, universe, alphas, strategies)
+
+    assert builds == [START]
+    assert portfolios["strategy"].unique().sort().to_list() == sorted(strategies)
+
+
+def test_cached_stages_match_computed_stages(backtester, strategy, tmp_path):
+    inputs = []
+
+    def recording_z_score(signals):
+        inputs.append(type(signals))
+        return z_score(signals, signal_col="mom")
+
+    strategy_ = dataclasses.replace(strategy, score_constructor=recording_z_score)
+    cached = Backtester(Interval.DAILY, START, END, backtester._data, stage_cache_dir=str(tmp_path))
+
+    # Miss on every stage, then hit on the signal stage only
+    miss = cached._compute_alphas(strategy_)
+    for path in [*tmp_path.glob("score_*.arrow"), *tmp_path.glob("alpha_*.arrow")]:
+        path.unlink()
+    hit = cached._compute_alphas(strategy_)
+
+    assert inputs == [pl.DataFrame, pl.DataFrame]
+    assert_frame_equal(miss, hit)
+    assert_frame_equal(hit, backtester._compute_alphas(strategy_))
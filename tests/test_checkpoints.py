@@ -0,0 +1,91 @@
+import dataclasses
+from datetime import date, timedelta
+from functools import partial
+
+import polars as pl
+import pytest
+
+from silverfund.checkpoints import CheckpointStore, period_keys
+from silverfund.constraints import full_investment, long_only
+from silverfund.fingerprints import fingerprint_frame
+from silverfund.portfolios import mean_variance_efficient
+from silverfund.records import Alpha, Portfolio
+from silverfund.signals import no_signal
+from silverfund.strategies import Strategy
+
+PERIODS = [date(2024, 1, 2) + timedelta(days=i) for i in range(3)]
+BARRIDS = ["USA0001", "USA0002", "USA0003"]
+
+
+@pytest.fixture
+def strategy() -> Strategy:
+    return Strategy(
+        signal_constructor=no_signal,
+        score_constructor=lambda signals: signals,
+        alpha_constructor=lambda scores: scores,
+        portfolio_constructor=partial(mean_variance_efficient, gamma=2.0),
+        constraints=[full_investment, long_only],
+    )
+
+
+@pytest.fixture
+def universe() -> pl.DataFrame:
+    return pl.DataFrame({"date": [period for period in PERIODS for _ in BARRIDS], "barrid": BARRIDS * len(PERIODS)})
+
+
+@pytest.fixture
+def alphas(universe) -> Alpha:
+    return Alpha(universe.with_columns(pl.int_range(pl.len()).cast(pl.Float64).truediv(10).alias("alpha")))
+
+
+def changed_periods(before: dict[date, str], after: dict[date, str]) -> list[date]:
+    return [period for period in PERIODS if before[period] != after[period]]
+
+
+def test_keys_are_stable(strategy, universe, alphas):
+    assert period_keys(strategy, universe, alphas, PERIODS) == period_keys(strategy, universe.clone(), Alpha(alphas.clone()), PERIODS)
+    assert len(set(period_keys(strategy, universe, alphas, PERIODS).values())) == len(PERIODS)
+
+
+def test_constructor_and_constraints_change_every_key(strategy, universe, alphas):
+    keys = period_keys(strategy, universe, alphas, PERIODS)
+
+    gamma = dataclasses.replace(strategy, portfolio_constructor=partial(mean_variance_efficient, gamma=5.0))
+    constraints = dataclasses.replace(strategy, constraints=[full_investment])
+
+    assert changed_periods(keys, period_keys(gamma, universe, alphas, PERIODS)) == PERIODS
+    assert changed_periods(keys, period_keys(constraints, universe, alphas, PERIODS)) == PERIODS
+    assert changed_periods(keys, period_keys(strategy, universe, alphas, PERIODS, data_version="2024-02-01")) == PERIODS
+
+
+def test_universe_and_alphas_change_only_their_period(strategy, universe, alphas):
+    keys = period_keys(strategy, universe, alphas, PERIODS)
+
+    smaller_universe = universe.filter((pl.col("date") != PERIODS[1]) | (pl.col("barrid") != BARRIDS[0]))
+    new_alphas = Alpha(alphas.with_columns(pl.when(pl.col("date") == PERIODS[2]).then(pl.col("alpha") + 1).otherwise(pl.col("alpha"))))
+
+    assert changed_periods(keys, period_keys(strategy, smaller_universe, alphas, PERIODS)) == [PERIODS[1]]
+    assert changed_periods(keys, period_keys(strategy, universe, new_alphas, PERIODS)) == [PERIODS[2]]
+
+
+def test_fingerprint_distinguishes_nulls_and_values():
+    df = pl.DataFrame({"barrid": ["USA0001", "USA0002"], "alpha": [0.0, 1.0]})
+
+    assert fingerprint_frame(df) == fingerprint_frame(df.clone())
+    assert fingerprint_frame(df) != fingerprint_frame(df.with_columns(pl.col("alpha").replace(0.0, None)))
+    assert fingerprint_frame(df) != fingerprint_frame(df.with_columns(pl.col("alpha") + 1e-12))
+    assert fingerprint_frame(df) != fingerprint_frame(df.with_columns(pl.Series("barrid", ["USA000", "1USA0002"])))
+
+
+def test_checkpoint_round_trip(tmp_path):
+    store = CheckpointStore(tmp_path / "run")
+    portfolio = Portfolio(pl.DataFrame({"date": PERIODS[0], "barrid": BARRIDS, "weight": [0.2, 0.3, 0.5]}))
+
+    assert not store.contains(PERIODS[0], "key")
+
+    store.save(PERIODS[0], "key", portfolio)
+
+    assert store.contains(PERIODS[0], "key")
+    assert not store.contains(PERIODS[0], "other")
+    assert store.load(PERIODS[0], "key").equals(portfolio)
+    assert list((tmp_path / "run").glob("*.tmp")) == []
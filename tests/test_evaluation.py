@@ -0,0 +1,52 @@
+from datetime import date, timedelta
+
+import numpy as np
+import polars as pl
+
+from silverfund.evaluation import evaluate_signals, forward_returns
+
+
+def create_portfolios(signals: pl.DataFrame, signal: str) -> pl.DataFrame:
+    # The decile spread of research/momentum_flavors/*_research.py
+    labels = [str(i) for i in range(10)]
+    return (
+        signals.with_columns(pl.col(signal).qcut(10, labels=labels).over("date").alias("bin"))
+        .group_by(["date", "bin"])
+        .agg(pl.col("return").mean())
+        .pivot(index="date", on="bin", values="return")
+        .with_columns(pl.col("9").sub(pl.col("0")).alias("spread"))
+    )
+
+
+def test_forward_returns_start_on_the_signal_row(returns):
+    data = forward_returns(returns, [1, 3])
+
+    for barrid in data.partition_by("barrid"):
+        ret = barrid["ret"].to_numpy()
+        expected = [np.prod(1 + ret[t : t + 3]) - 1 if t + 3 <= len(ret) else np.nan for t in range(len(ret))]
+
+        np.testing.assert_allclose(barrid["fwd_ret_1"].to_numpy(), ret, atol=1e-15)
+        np.testing.assert_allclose(barrid["fwd_ret_3"].to_numpy(), expected, atol=1e-15)
+
+
+def test_one_period_spread_matches_create_portfolios():
+    rng = np.random.default_rng(3)
+    n_dates, n_assets = 30, 50
+
+    dates = [date(2020, 1, 1) + timedelta(days=i) for i in range(n_dates)]
+    ret = rng.normal(0, 2, n_assets * n_dates)
+    data = pl.DataFrame(
+        {
+            "date": dates * n_assets,
+            "barrid": np.repeat([f"USA{i:04d}" for i in range(n_assets)], n_dates),
+            "return": np.where(rng.random(ret.size) < 0.05, np.nan, ret),
+            "momentum": rng.normal(size=ret.size),
+        }
+    ).with_columns(pl.col("return").fill_nan(None))
+
+    spreads = evaluate_signals(data, ["momentum"], [1], return_col="return", percent=True).spreads
+    expected = create_portfolios(data, "momentum").select("date", "spread")
+
+    joined = expected.join(spreads, on="date", suffix="_actual")
+    assert joined.height == n_dates
+    np.testing.assert_allclose(joined["spread_actual"], joined["spread"], atol=1e-12)
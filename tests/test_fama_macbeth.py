@@ -0,0 +1,67 @@
+import numpy as np
+import polars as pl
+import ray
+
+from silverfund.fama_macbeth import cross_sectional_regressions, fama_macbeth
+
+
+def test_regressions_match_lstsq_with_null_industries(returns):
+    rng = np.random.default_rng(2)
+    data = returns.rename({"ret": "y", "specific_return": "signal"})
+
+    industry = rng.integers(0, 2, data.height)
+    exposures = data.select(
+        "date",
+        "barrid",
+        pl.Series("tech", np.where(industry == 0, 1.0, np.nan)).fill_nan(None),
+        pl.Series("energy", np.where(industry == 1, 1.0, np.nan)).fill_nan(None),
+    )
+
+    regressions = cross_sectional_regressions(data, "y", ["signal"], exposures, intercept=False)
+
+    # Reference: one least squares regression per date on the complete rows
+    complete = data.join(exposures, on=["date", "barrid"]).with_columns(pl.col("tech", "energy").fill_null(0)).drop_nulls(["y", "signal"])
+    for day in complete.partition_by("date"):
+        x = day.select("signal", "tech", "energy").to_numpy()
+        slopes = np.linalg.lstsq(x, day["y"].to_numpy(), rcond=None)[0]
+        actual = regressions.filter(pl.col("date") == day["date"][0])
+
+        assert actual["n_obs"].to_list() == [day.height] * 3
+        np.testing.assert_allclose(actual["slope"].to_numpy(), slopes, atol=1e-12)
+
+    summary = fama_macbeth(regressions)
+    assert summary["n_periods"].to_list() == [data["date"].n_unique()] * 3
+
+
+def test_missing_exposure_rows_are_zero(returns):
+    data = returns.rename({"ret": "y", "specific_return": "signal"})
+    exposures = data.select("date", "barrid", pl.Series("tech", np.arange(data.height) % 2, dtype=pl.Float64))
+
+    # Assets without an exposures row keep their rows, with zero exposures
+    missing = pl.col("barrid").is_in(["USA0001", "USA0002"])
+    expected = cross_sectional_regressions(data, "y", ["signal"], exposures.with_columns(pl.when(~missing).then(pl.col("tech")).otherwise(0.0)))
+    actual = cross_sectional_regressions(data, "y", ["signal"], exposures.filter(~missing))
+
+    assert actual.equals(expected)
+
+
+def test_empty_data_gives_empty_regressions(returns):
+    data = returns.rename({"ret": "y", "specific_return": "signal"}).with_columns(pl.lit(None, dtype=pl.Float64).alias("signal"))
+
+    regressions = cross_sectional_regressions(data, "y", ["signal"])
+
+    assert regressions.is_empty()
+    assert regressions.columns == ["date", "variable", "slope", "std_error", "n_obs", "r_squared", "t_stat"]
+    assert regressions.schema["date"] == pl.Date
+
+
+def test_parallel_chunks_match_serial(returns):
+    # Two calendar years, so two chunks
+    data = pl.concat([returns, returns.with_columns(pl.col("date").dt.offset_by("1y"))]).rename({"ret": "y", "specific_return": "signal"})
+
+    serial = cross_sectional_regressions(data, "y", ["signal"])
+    parallel = cross_sectional_regressions(data, "y", ["signal"], n_cpus=2)
+
+    assert parallel.equals(serial)
+    assert serial["date"].dt.year().unique().to_list() == [2020, 2021]
+    assert not ray.is_initialized()
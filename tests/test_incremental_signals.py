@@ -0,0 +1,37 @@
+import numpy as np
+import polars as pl
+import pytest
+
+from silverfund.enums import MomentumFlavor
+from silverfund.incremental_signals import MomentumState
+from silverfund.signals import MomentumSpec, momentum_signals
+
+
+@pytest.mark.parametrize("flavor", list(MomentumFlavor))
+def test_momentum_state_matches_momentum_signals(returns, flavor):
+    # A -100% return counts as missing in both engines
+    returns = returns.with_columns(pl.when(pl.int_range(pl.len()) == 30).then(-1.0).otherwise(pl.col("ret")).alias("ret"))
+    spec = MomentumSpec(flavor, 10, 2)
+
+    expected = momentum_signals(returns, [spec])
+
+    state = MomentumState(spec)
+    actual = pl.concat([pl.DataFrame(state.update(day)) for day in returns.sort(["date", "barrid"]).partition_by("date", maintain_order=True)])
+
+    joined = expected.join(actual, on=["date", "barrid"], suffix="_incremental")
+
+    assert joined.height == returns.height
+    assert joined[spec.name].drop_nulls().len() > 0
+    np.testing.assert_allclose(joined[f"{spec.name}_incremental"].to_numpy(), joined[spec.name].to_numpy(), rtol=1e-9, atol=1e-12, equal_nan=True)
+
+
+def test_momentum_state_round_trips(returns, tmp_path):
+    spec = MomentumSpec(MomentumFlavor.VOLATILITY_ADJUSTED, 10, 2)
+    days = returns.sort(["date", "barrid"]).partition_by("date", maintain_order=True)
+
+    state = MomentumState.from_history(pl.concat(days[:-1]), spec)
+    state.save(tmp_path / "state.npz")
+    loaded = MomentumState.load(tmp_path / "state.npz")
+
+    assert loaded.last_date == state.last_date
+    assert pl.DataFrame(loaded.update(days[-1])).equals(pl.DataFrame(state.update(days[-1])))
@@ -0,0 +1,60 @@
+import numpy as np
+import polars as pl
+import pytest
+
+from silverfund.panels import ReturnsPanel
+
+
+def _compare(panel: ReturnsPanel, name: str, expected: pl.DataFrame) -> None:
+    actual = panel.to_frame(name, mask=np.ones_like(panel.mask))
+    joined = expected.join(actual, on=["date", "barrid"], how="left", suffix="_panel")
+
+    assert joined[name].is_null().to_list() == joined[f"{name}_panel"].is_null().to_list()
+    np.testing.assert_allclose(joined[f"{name}_panel"].drop_nulls().to_numpy(), joined[name].drop_nulls().to_numpy(), atol=1e-12)
+
+
+@pytest.mark.parametrize("window", [1, 5, 20])
+def test_rolling_kernels_match_polars(returns, window):
+    panel = ReturnsPanel.from_frame(returns, "ret")
+
+    expected = returns.select(
+        "date",
+        "barrid",
+        pl.col("ret").rolling_sum(window).over("barrid").alias("sum"),
+        pl.col("ret").rolling_mean(window).over("barrid").alias("mean"),
+        pl.col("ret").rolling_std(window).over("barrid").alias("std"),
+    ).with_columns(pl.col("sum", "mean", "std").fill_nan(None))
+
+    _compare(panel.rolling_sum(window), "sum", expected)
+    _compare(panel.rolling_mean(window), "mean", expected)
+    _compare(panel.rolling_std(window), "std", expected)
+
+
+def test_cross_sectional_kernels_match_polars(returns):
+    panel = ReturnsPanel.from_frame(returns, "ret")
+
+    expected = returns.select(
+        "date",
+        "barrid",
+        ((pl.col("ret") - pl.col("ret").mean()) / pl.col("ret").std()).over("date").alias("zscore"),
+        pl.col("ret").rank("average").over("date").cast(pl.Float64).alias("rank"),
+    )
+
+    _compare(panel.zscore(), "zscore", expected)
+    _compare(panel.rank(), "rank", expected)
+
+
+def test_shift_matches_polars(returns):
+    panel = ReturnsPanel.from_frame(returns, "ret")
+    expected = returns.select("date", "barrid", pl.col("ret").shift(2).over("barrid").alias("lag"))
+
+    _compare(panel.shift(2), "lag", expected)
+
+
+def test_non_finite_values_are_missing(returns):
+    # A -100% return has no log return; it must not leak into later windows
+    returns = returns.with_columns(pl.when(pl.int_range(pl.len()) == 3).then(-1.0).otherwise(pl.col("ret")).alias("ret"))
+    logret = ReturnsPanel.from_frame(returns, "ret").log1p()
+
+    assert np.isnan(logret.values[3, 0])
+    assert np.isfinite(logret.rolling_sum(5, min_periods=1).values[4:, 0]).all()
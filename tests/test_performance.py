@@ -0,0 +1,154 @@
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+import silverfund.data_access_layer as dal
+from silverfund.enums import Interval
+from silverfund.performance import Performance
+from silverfund.records import AssetReturns
+
+
+@pytest.fixture
+def asset_returns(returns) -> AssetReturns:
+    """Weights on a rotating subset of the barrids, so assets leave and re-enter the portfolio."""
+    rng = np.random.default_rng(4)
+    held = rng.random(returns.height) < 0.6
+
+    return AssetReturns(
+        returns.filter(pl.Series(held)).select(
+            "date",
+            "barrid",
+            pl.Series("weight", rng.normal(0, 0.1, held.sum())),
+            pl.col("ret").fill_null(0).alias("fwd_ret"),
+        )
+    )
+
+
+@pytest.fixture(autouse=True)
+def benchmark(returns, monkeypatch) -> None:
+    weights = returns.select("date", "barrid", pl.lit(1 / returns["barrid"].n_unique()).alias("weight"))
+
+    def load_benchmark(interval, start_date=None, end_date=None, asset_ids=False):
+        return weights.filter(pl.col("date").is_between(start_date, end_date))
+
+    monkeypatch.setattr(dal, "load_benchmark", load_benchmark)
+
+
+def assert_same_series(actual: Performance, expected: Performance) -> None:
+    for name in ["_portfolio_returns", "_weight_series"]:
+        actual_series, expected_series = getattr(actual, name), getattr(expected, name)
+        assert actual_series["date"].equals(expected_series["date"])
+        np.testing.assert_allclose(actual_series.drop("date").to_numpy(), expected_series.drop("date").to_numpy(), atol=1e-12)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7])
+def test_series_do_not_depend_on_chunk_size(asset_returns, chunk_size):
+    expected = Performance(Interval.DAILY, asset_returns, chunk_size=100)
+    actual = Performance(Interval.DAILY, asset_returns, chunk_size=chunk_size)
+
+    assert_same_series(actual, expected)
+
+
+@pytest.mark.parametrize("chunk_size", [3, 100])
+def test_extend_matches_a_full_rebuild(asset_returns, chunk_size):
+    dates = asset_returns["date"].unique().sort()
+    cut = dates[40]
+
+    # The last period's forward returns are not known yet
+    first = asset_returns.filter(pl.col("date") <= cut).with_columns(
+        pl.when(pl.col("date") == cut).then(None).otherwise(pl.col("fwd_ret")).alias("fwd_ret")
+    )
+
+    actual = Performance(Interval.DAILY, AssetReturns(first), chunk_size=chunk_size)
+    actual.extend(AssetReturns(asset_returns.filter(pl.col("date") >= cut)))
+
+    assert_same_series(actual, Performance(Interval.DAILY, asset_returns, chunk_size=chunk_size))
+
+
+def test_rolling_drawdowns_match_each_window(asset_returns):
+    performance = Performance(Interval.DAILY, asset_returns)
+    total = performance._portfolio_returns["total_ret"].to_numpy()
+    window = 10
+
+    rolling = performance.rolling([window, len(total)])
+
+    # Reference: drawdowns of each window computed on its own
+    actual = rolling.filter(pl.col("window") == window)
+    for end in range(window - 1, len(total)):
+        wealth = np.concatenate([[1], np.cumprod(1 + total[end - window + 1 : end + 1])])
+        peak = np.maximum.accumulate(wealth)
+        peak_index = np.maximum.accumulate(np.where(wealth >= peak, np.arange(window + 1), 0))
+
+        assert actual["max_drawdown"][end] == pytest.approx((wealth / peak - 1).min(), abs=1e-12)
+        assert actual["max_drawdown_duration"][end] == (np.arange(window + 1) - peak_index).max()
+
+    # The full sample window matches the summary metrics
+    full = rolling.filter(pl.col("window") == len(total))
+    assert full["max_drawdown"][-1] == pytest.approx(performance.max_drawdown, abs=1e-12)
+    assert full["max_drawdown_duration"][-1] == performance.max_drawdown_duration
+
+
+def test_extend_drops_memoized_drawdowns(asset_returns):
+    cut = asset_returns["date"].unique().sort()[40]
+
+    performance = Performance(Interval.DAILY, AssetReturns(asset_returns.filter(pl.col("date") <= cut)))
+    assert performance.drawdowns() is performance.drawdowns()
+
+    performance.extend(AssetReturns(asset_returns.filter(pl.col("date") > cut)))
+    assert performance.drawdowns().equals(Performance(Interval.DAILY, asset_returns).drawdowns())
+
+
+def test_moments_match_ols(asset_returns):
+    performance = Performance(Interval.DAILY, asset_returns)
+    returns = performance._portfolio_returns
+    bmk = returns["bmk_ret"].to_numpy()
+    x = np.column_stack([np.ones(len(bmk)), bmk])
+
+    # Reference: least squares regression of each series on the benchmark
+    for col in ["total_ret", "bmk_ret", "active_ret"]:
+        y = returns[col].to_numpy()
+        alpha, beta = np.linalg.lstsq(x, y, rcond=None)[0]
+        moments = performance._moments[col]
+
+        assert moments["mean"] == pytest.approx(y.mean(), abs=1e-12)
+        assert moments["std"] == pytest.approx(y.std(ddof=1), abs=1e-12)
+        assert moments["beta"] == pytest.approx(beta, abs=1e-10)
+        assert moments["alpha"] == pytest.approx(alpha, abs=1e-12)
+
+    # Annualized like the summary
+    y = returns["total_ret"].to_numpy()
+    alpha, beta = np.linalg.lstsq(x, y, rcond=None)[0]
+    scale = performance._annual_scale
+
+    assert performance.portfolio_beta == pytest.approx(beta, abs=1e-10)
+    assert performance.portfolio_alpha == pytest.approx(alpha * scale, abs=1e-10)
+    assert performance.portfolio_sharpe == pytest.approx(y.mean() * scale / (y.std(ddof=1) * np.sqrt(scale)), abs=1e-10)
+    assert performance.benchmark_beta == pytest.approx(1, abs=1e-12)
+
+
+@pytest.mark.parametrize("annualize", [True, False])
+def test_rolling_metrics_match_polars_rolling(asset_returns, annualize):
+    performance = Performance(Interval.DAILY, asset_returns, annualize=annualize)
+    windows = [5, 20]
+    mean_scale = performance._annual_scale if annualize else 1
+    std_scale = np.sqrt(mean_scale)
+
+    # Reference: polars rolling windows over each series
+    expected = pl.concat(
+        performance._portfolio_returns.select(
+            "date",
+            pl.lit(window).alias("window"),
+            (pl.col("total_ret").rolling_std(window) * std_scale).alias("portfolio_risk"),
+            (pl.col("total_ret").rolling_mean(window) * mean_scale / (pl.col("total_ret").rolling_std(window) * std_scale)).alias("portfolio_sharpe"),
+            (pl.col("active_ret").rolling_std(window) * std_scale).alias("active_risk"),
+            (pl.col("active_ret").rolling_mean(window) * mean_scale / (pl.col("active_ret").rolling_std(window) * std_scale)).alias(
+                "information_ratio"
+            ),
+            (pl.rolling_cov("total_ret", "bmk_ret", window_size=window) / pl.col("bmk_ret").rolling_var(window)).alias("portfolio_beta"),
+        )
+        for window in windows
+    )
+
+    actual = performance.rolling(windows).select(expected.columns)
+    assert_frame_equal(actual, expected, check_dtypes=False, abs_tol=1e-9)
@@ -0,0 +1,88 @@
+from datetime import date
+
+import numpy as np
+import polars as pl
+import pytest
+
+from silverfund.portfolios import equal_weight, quantile_buckets, signal_weighted, top_k
+from silverfund.records import Alpha
+
+DATES = [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4)]
+
+
+@pytest.fixture
+def alphas() -> Alpha:
+    """Alphas for 23 barrids: distinct with nulls, zeros, and a tie on the first date, random on the second, all equal on the third."""
+    rng = np.random.default_rng(5)
+    first = [*np.linspace(-1, 1, 20), None, 0.0, 1.0]
+    second = list(rng.normal(size=23))
+    third = [0.5] * 23
+
+    return Alpha(
+        pl.DataFrame(
+            {
+                "date": [day for day in DATES for _ in range(23)],
+                "barrid": [f"USA{i:04d}" for i in range(23)] * len(DATES),
+                "alpha": [*first, *second, *third],
+            }
+        )
+    )
+
+
+def weights(portfolio: pl.DataFrame, day: date) -> dict[str, float]:
+    return dict(portfolio.filter(pl.col("date") == day).select("barrid", "weight").iter_rows())
+
+
+def test_quantile_buckets_hold_the_extreme_buckets(alphas):
+    portfolio = quantile_buckets(alphas, n_bins=4)
+
+    # First date: 21 ranked alphas (the tied top two share a bucket)
+    first = weights(portfolio, DATES[0])
+    ranked = alphas.filter(pl.col("date") == DATES[0]).drop_nulls("alpha").filter(pl.col("alpha") != 0)
+    rank = ranked["alpha"].rank("average").to_numpy()
+    bucket = np.floor((rank - 1) * 4 / len(rank))
+    long, short = ranked["barrid"].filter(bucket == 3).to_list(), ranked["barrid"].filter(bucket == 0).to_list()
+
+    assert {barrid for barrid, weight in first.items() if weight > 0} == set(long)
+    assert {barrid for barrid, weight in first.items() if weight < 0} == set(short)
+    assert first["USA0020"] == first["USA0021"] == 0
+    assert sum(weight for weight in first.values() if weight > 0) == pytest.approx(1)
+    assert sum(weight for weight in first.values() if weight < 0) == pytest.approx(-1)
+
+    # All equal alphas carry no signal
+    assert set(weights(portfolio, DATES[2]).values()) == {0}
+
+
+def test_top_k_holds_ties_and_skips_missing(alphas):
+    portfolio = top_k(alphas, k=3)
+
+    first = weights(portfolio, DATES[0])
+    assert {barrid for barrid, weight in first.items() if weight > 0} == {"USA0019", "USA0022", "USA0018"}
+    assert sum(first.values()) == pytest.approx(1)
+
+    # The two alphas of 1.0 tie for first, so k=1 holds both
+    assert {barrid for barrid, weight in weights(top_k(alphas, k=1), DATES[0]).items() if weight > 0} == {"USA0019", "USA0022"}
+
+    second = alphas.filter(pl.col("date") == DATES[1]).sort("alpha", descending=True)
+    assert {barrid for barrid, weight in weights(portfolio, DATES[1]).items() if weight > 0} == set(second["barrid"].head(3))
+    assert set(weights(portfolio, DATES[2]).values()) == {0}
+
+
+def test_equal_weight(alphas):
+    portfolio = equal_weight(alphas)
+
+    for day in DATES:
+        assert list(weights(portfolio, day).values()) == pytest.approx([1 / 23] * 23)
+
+
+def test_signal_weighted(alphas):
+    portfolio = signal_weighted(alphas)
+
+    for day in DATES:
+        alpha = alphas.filter(pl.col("date") == day).sort("barrid")["alpha"].fill_null(0).to_numpy()
+        actual = portfolio.filter(pl.col("date") == day).sort("barrid")["weight"]
+
+        assert actual.null_count() == 0
+        np.testing.assert_allclose(actual.to_numpy(), alpha / np.abs(alpha).sum())
+
+    assert weights(portfolio, DATES[0])["USA0020"] == 0
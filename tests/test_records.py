@@ -0,0 +1,103 @@
+from datetime import date
+
+import numpy as np
+import polars as pl
+import pytest
+
+from silverfund.records import CovarianceMatrix, Portfolio, canonicalize, is_canonical
+
+SCHEMA = {"date": pl.Date, "barrid": pl.String, "weight": pl.Float64}
+ORDER = ["date", "barrid", "weight"]
+
+
+@pytest.fixture
+def portfolio() -> pl.DataFrame:
+    """A portfolio in canonical order, sorted by barrid and then date."""
+    return pl.DataFrame(
+        {
+            "date": [date(2024, 1, 2), date(2024, 1, 3)] * 2,
+            "barrid": ["USA0001", "USA0001", "USA0002", "USA0002"],
+            "weight": [0.1, 0.2, 0.3, 0.4],
+        }
+    )
+
+
+def test_is_canonical(portfolio):
+    assert is_canonical(portfolio)
+    assert is_canonical(portfolio.sort(["barrid", "date"]))
+
+    # Dates out of order within a barrid, and barrids out of order
+    assert not is_canonical(portfolio.sort(["barrid", "date"], descending=[False, True]))
+    assert not is_canonical(portfolio.sort("date"))
+
+
+def test_canonical_records_are_not_copied(portfolio):
+    assert canonicalize(portfolio, ORDER, SCHEMA) is portfolio
+
+
+def test_canonicalize_reorders_columns_and_rows(portfolio):
+    shuffled = portfolio.sort("date", "weight", descending=True).select("weight", "barrid", "date")
+
+    assert canonicalize(shuffled, ORDER, SCHEMA).equals(portfolio)
+    assert Portfolio(shuffled).equals(portfolio)
+
+
+def test_canonicalize_validates(portfolio):
+    with pytest.raises(ValueError, match="Columns missing"):
+        canonicalize(portfolio.drop("weight"), ORDER, SCHEMA)
+
+    with pytest.raises(ValueError, match="Extra columns"):
+        canonicalize(portfolio.with_columns(pl.lit(1).alias("extra")), ORDER, SCHEMA)
+
+    with pytest.raises(ValueError, match="incorrect type"):
+        canonicalize(portfolio.with_columns(pl.col("weight").cast(pl.Float32)), ORDER, SCHEMA)
+
+    # Any of several allowed types
+    encoded = portfolio.with_columns(pl.col("barrid").cast(pl.Enum(["USA0001", "USA0002"])))
+    assert canonicalize(encoded, ORDER, {**SCHEMA, "barrid": (pl.String, pl.Enum)}) is encoded
+
+
+@pytest.fixture
+def covariance() -> tuple[np.ndarray, list[str]]:
+    """A random positive definite covariance matrix for barrids given out of sorted order."""
+    rng = np.random.default_rng(3)
+    a = rng.normal(size=(4, 4))
+
+    return a @ a.T + np.eye(4), ["USA0003", "USA0001", "USA0004", "USA0002"]
+
+
+def test_covariance_matrix_round_trip(covariance):
+    matrix, barrids = covariance
+    cov_mat = CovarianceMatrix(matrix, barrids)
+
+    # Array is kept as given
+    assert cov_mat.barrids == barrids
+    assert np.array_equal(cov_mat.to_matrix(), matrix)
+
+    # Wide frame keeps the barrid order, and converts back to the same matrix
+    frame = cov_mat.to_frame()
+    assert frame.columns == ["barrid", *barrids]
+    assert frame["barrid"].to_list() == barrids
+    assert np.array_equal(frame.drop("barrid").to_numpy(), matrix)
+    assert np.array_equal(CovarianceMatrix(frame, barrids).to_matrix(), matrix)
+
+
+def test_covariance_matrix_from_shuffled_frame(covariance):
+    matrix, barrids = covariance
+    frame = CovarianceMatrix(matrix, barrids).to_frame()
+
+    # Rows are put back in barrid order
+    assert np.array_equal(CovarianceMatrix(frame.reverse(), barrids).to_matrix(), matrix)
+
+
+def test_covariance_matrix_validates(covariance):
+    matrix, barrids = covariance
+
+    with pytest.raises(ValueError, match="shape"):
+        CovarianceMatrix(matrix[:3], barrids)
+
+    with pytest.raises(ValueError, match="shape"):
+        CovarianceMatrix(matrix, barrids[:3])
+
+    with pytest.raises(ValueError, match="Columns missing"):
+        CovarianceMatrix(CovarianceMatrix(matrix, barrids).to_frame().drop(barrids[0]), barrids)
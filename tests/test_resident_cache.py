@@ -0,0 +1,56 @@
+from datetime import date
+
+import polars as pl
+import pytest
+
+import silverfund.data_access_layer as dal
+from silverfund.enums import Interval
+
+LOADERS = [dal.load_factor_exposures, dal.load_factor_covariances, dal.load_specific_risk]
+
+
+@pytest.fixture
+def resident(barra_data):
+    """Two dates on either side of a year boundary, made resident for the duration of a test."""
+    dates = [date(2023, 12, 29), date(2024, 1, 2)]
+    dal.make_risk_model_resident(dates)
+    yield dates
+    dal.clear_resident_data()
+
+
+@pytest.fixture
+def no_disk_reads(monkeypatch):
+    def read_parquet(*args, **kwargs):
+        raise AssertionError("read from disk")
+
+    monkeypatch.setattr(pl, "read_parquet", read_parquet)
+
+
+def test_resident_reads_match_disk(resident):
+    resident_frames = [load(day) for load in LOADERS for day in resident]
+    resident_total_risk = dal.load_total_risk(Interval.DAILY, resident[0], resident[-1])
+
+    dal.clear_resident_data()
+    disk_frames = [load(day) for load in LOADERS for day in resident]
+
+    for resident_frame, disk_frame in zip(resident_frames, disk_frames):
+        assert resident_frame.equals(disk_frame)
+
+    assert resident_total_risk.equals(dal.load_total_risk(Interval.DAILY, resident[0], resident[-1]))
+
+
+def test_resident_dates_are_served_from_memory(resident, no_disk_reads):
+    for load in LOADERS:
+        for day in resident:
+            assert load(day).height > 0
+
+    # Other dates of the same year are not resident
+    with pytest.raises(AssertionError, match="read from disk"):
+        dal.load_factor_exposures(date(2024, 1, 3))
+
+
+def test_clear_resident_data(resident, no_disk_reads):
+    dal.clear_resident_data()
+
+    with pytest.raises(AssertionError, match="read from disk"):
+        dal.load_factor_exposures(resident[0])
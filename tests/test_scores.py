@@ -0,0 +1,73 @@
+import numpy as np
+import polars as pl
+
+from silverfund.records import Signal
+from silverfund.scores import factor_neutral_scores, score_stats, z_score, z_scores
+
+
+def test_z_scores_match_z_score(returns):
+    signals = returns.rename({"ret": "a", "specific_return": "b"})
+
+    scores = z_scores(signals, ["a", "b"])
+
+    for col in ["a", "b"]:
+        expected = pl.DataFrame(z_score(Signal(signals.select("date", "barrid", col), col), col))
+        joined = expected.join(scores, on=["date", "barrid"])
+
+        assert joined.height == signals.height
+        np.testing.assert_allclose(joined[col].to_numpy(), joined["score"].to_numpy(), rtol=1e-12, equal_nan=True)
+
+
+def test_z_scores_reuse_stats(returns):
+    signals = returns.rename({"ret": "a", "specific_return": "b"})
+    stats = score_stats(signals, ["a", "b"], winsorize=0.1, rank=True)
+
+    assert z_scores(signals, ["a", "b"], winsorize=0.1, rank=True, stats=stats).equals(z_scores(signals, ["a", "b"], winsorize=0.1, rank=True))
+
+
+def test_z_scores_lazy_matches_eager(returns):
+    signals = returns.rename({"ret": "a", "specific_return": "b"})
+
+    assert z_scores(signals.lazy(), ["a", "b"]).collect().equals(z_scores(signals, ["a", "b"]))
+
+
+def test_factor_neutral_scores_match_lstsq(returns):
+    rng = np.random.default_rng(1)
+    signals = returns.rename({"ret": "a", "specific_return": "b"})
+
+    # Two style factors and two industries that together span a constant; industry nulls mean "not in"
+    industry = rng.integers(0, 2, signals.height)
+    exposures = signals.select(
+        "date",
+        "barrid",
+        pl.Series("size", rng.normal(size=signals.height)),
+        pl.Series("value", rng.normal(size=signals.height)),
+        pl.Series("tech", np.where(industry == 0, 1.0, np.nan)).fill_nan(None),
+        pl.Series("energy", np.where(industry == 1, 1.0, np.nan)).fill_nan(None),
+        pl.Series("market", np.ones(signals.height)),
+    )
+    factors = ["size", "value", "tech", "energy", "market"]
+
+    scores = factor_neutral_scores(signals, ["a", "b"], exposures, factors)
+
+    # Reference: one least squares regression per date and signal
+    joined = signals.join(exposures, on=["date", "barrid"]).with_columns(pl.col(factors).fill_null(0))
+    expected = []
+    for day in joined.partition_by("date"):
+        residuals = {}
+        for col in ["a", "b"]:
+            observed = day[col].is_not_null().to_numpy()
+            x = day.select(factors).to_numpy()[observed]
+            y = day[col].to_numpy()[observed]
+            residual = np.full(day.height, np.nan)
+            residual[observed] = y - x @ np.linalg.lstsq(x, y, rcond=None)[0]
+            residuals[col] = residual
+        expected.append(day.select("date", "barrid").with_columns(pl.Series(col, r).fill_nan(None) for col, r in residuals.items()))
+
+    expected = z_scores(pl.concat(expected), ["a", "b"])
+    compared = expected.join(scores, on=["date", "barrid"], suffix="_neutral")
+
+    assert compared.height == signals.height
+    for col in ["a", "b"]:
+        assert compared[f"{col}_neutral"].drop_nulls().len() > 0
+        np.testing.assert_allclose(compared[f"{col}_neutral"].to_numpy(), compared[col].to_numpy(), atol=1e-10, equal_nan=True)
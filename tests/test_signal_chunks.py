@@ -0,0 +1,56 @@
+from datetime import date
+from functools import partial
+
+import numpy as np
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from silverfund.enums import MomentumFlavor
+from silverfund.signal_chunks import compute_signals_by_year
+from silverfund.signals import MomentumSpec, momentum_signals
+
+START, END = date(2019, 10, 1), date(2021, 3, 31)
+
+
+def make_panel() -> pl.DataFrame:
+    """Weekday returns for 8 barrids over two year boundaries, sorted by barrid and date.
+
+    USA0006 leaves in mid 2020 and USA0007 joins two weeks before the end of 2020, so its
+    first signals in 2021 depend on rows from the year before.
+    """
+    rng = np.random.default_rng(11)
+    days = pl.date_range(START, END, "1d", eager=True)
+    days = days.filter(days.dt.weekday() <= 5)
+
+    panel = pl.DataFrame(
+        {
+            "date": days.to_list() * 8,
+            "barrid": np.repeat([f"USA{i:04d}" for i in range(8)], len(days)),
+            "ret": rng.normal(0.0005, 0.02, 8 * len(days)),
+            "specific_return": rng.normal(0, 0.01, 8 * len(days)),
+        }
+    )
+
+    return panel.filter(
+        (pl.col("barrid") != "USA0006") | (pl.col("date") <= date(2020, 6, 30)),
+        (pl.col("barrid") != "USA0007") | (pl.col("date") >= date(2020, 12, 17)),
+    ).sort(["barrid", "date"])
+
+
+def test_yearly_chunks_match_full_panel(tmp_path):
+    panel = make_panel()
+    specs = [MomentumSpec(flavor, 20, 2) for flavor in MomentumFlavor] + [MomentumSpec(MomentumFlavor.VANILLA, 5)]
+    lookback = max(spec.lookback for spec in specs)
+
+    def load(chunk_start: date, chunk_end: date) -> pl.DataFrame:
+        return panel.filter(pl.col("date").is_between(chunk_start, chunk_end))
+
+    chunked = compute_signals_by_year(partial(momentum_signals, specs=specs), START, END, lookback, tmp_path, load=load)
+    expected = momentum_signals(panel, specs)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["signals_2019.parquet", "signals_2020.parquet", "signals_2021.parquet"]
+    assert_frame_equal(chunked.collect().sort(["barrid", "date"]), expected, abs_tol=1e-10)
+
+    # The warm-up of USA0007 spans the year boundary
+    first_signal = expected.filter(pl.col("barrid") == "USA0007").drop_nulls("vanilla_momentum_20_2")["date"].min()
+    assert first_signal.year == 2021
@@ -0,0 +1,43 @@
+from datetime import date, timedelta
+
+import numpy as np
+import polars as pl
+
+from silverfund.enums import MomentumFlavor
+from silverfund.panels import ReturnsPanel
+from silverfund.signals import MomentumSpec, momentum, momentum_signals, momentum_sweep
+
+
+def test_momentum_signals_are_null_without_dispersion():
+    # Two barrids with constant returns: every volatility and cross-sectional dispersion is zero
+    dates = [date(2020, 1, 1) + timedelta(days=i) for i in range(10)]
+    data = pl.DataFrame({"date": dates * 2, "barrid": np.repeat(["A", "B"], 10), "ret": [0.01] * 20})
+
+    specs = [MomentumSpec(MomentumFlavor.FROG_IN_THE_PAN, 3), MomentumSpec(MomentumFlavor.VOLATILITY_ADJUSTED, 3)]
+    signals = momentum_signals(data, specs)
+
+    for spec in specs:
+        assert signals[spec.name].null_count() == signals.height
+
+
+def test_momentum_signals_match_momentum(returns):
+    expected = momentum(returns)
+    actual = momentum_signals(returns, [MomentumSpec(MomentumFlavor.VANILLA, 11)])
+
+    np.testing.assert_allclose(actual["vanilla_momentum_11_1"].to_numpy(), pl.DataFrame(expected)["mom"].to_numpy(), rtol=1e-12, equal_nan=True)
+
+
+def test_momentum_sweep_matches_momentum_signals(returns):
+    # The sweep counts windows in panel dates, which equal rows here because every barrid has every date
+    returns = returns.with_columns(pl.when(pl.int_range(pl.len()) == 30).then(-1.0).otherwise(pl.col("ret")).alias("ret"))
+
+    windows = [(5, 1), (11, 1), (20, 5)]
+    sweep = momentum_sweep(ReturnsPanel.from_frame(returns.drop_nulls("ret"), "ret"), windows)
+    specs = [MomentumSpec(MomentumFlavor.VANILLA, window, skip) for window, skip in windows]
+    expected = momentum_signals(returns, specs)
+
+    joined = sweep.join(expected, on=["date", "barrid"], suffix="_expected")
+
+    for spec in specs:
+        np.testing.assert_allclose(joined[spec.name].to_numpy(), joined[f"{spec.name}_expected"].to_numpy(), rtol=1e-10, atol=1e-12, equal_nan=True)
+        assert joined[spec.name].is_finite().fill_null(True).all()
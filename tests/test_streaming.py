@@ -0,0 +1,78 @@
+import time
+
+import polars as pl
+import pyarrow.parquet as pq
+import pytest
+import ray
+
+from silverfund.streaming import ParquetSink, stream_to_sink
+
+
+@pytest.fixture(scope="module", autouse=True)
+def ray_context():
+    ray.init(num_cpus=2, include_dashboard=False)
+    yield
+    ray.shutdown()
+
+
+@ray.remote
+def make_frame(item: int) -> pl.DataFrame:
+    # Later items finish first, so results arrive out of submission order
+    time.sleep(0.05 * (item % 3))
+
+    if item < 0:
+        raise ValueError(f"item {item} failed")
+
+    return pl.DataFrame({"item": [item, item], "value": [0.5 * item, 1.5 * item]})
+
+
+class RecordingSink(ParquetSink):
+    """A sink that counts its writes."""
+
+    def __init__(self, path) -> None:
+        super().__init__(path)
+        self.writes = 0
+
+    def write(self, df: pl.DataFrame) -> None:
+        super().write(df)
+        self.writes += 1
+
+
+def test_results_are_written_incrementally_with_bounded_tasks(tmp_path):
+    path = tmp_path / "results.parquet"
+    items = list(range(12))
+    max_in_flight = 3
+    submitted, results = [], {}
+
+    with RecordingSink(path) as sink:
+
+        def submit(item: int) -> ray.ObjectRef:
+            # Tasks submitted but not yet written
+            assert len(submitted) - sink.writes < max_in_flight
+            submitted.append(item)
+            return make_frame.remote(item)
+
+        stream_to_sink(submit, items, sink, max_in_flight, on_result=lambda item, result: results.setdefault(item, result))
+
+    assert submitted == items
+    assert sorted(results) == items
+    assert pq.ParquetFile(path).num_row_groups == len(items)
+
+    written = pl.read_parquet(path).sort("item", "value")
+    assert written.equals(pl.concat(results.values()).sort("item", "value"))
+
+
+def test_first_error_propagates(tmp_path):
+    items = [0, -1, *range(1, 20)]
+    submitted = []
+
+    def submit(item: int) -> ray.ObjectRef:
+        submitted.append(item)
+        return make_frame.remote(item)
+
+    with ParquetSink(tmp_path / "results.parquet") as sink:
+        with pytest.raises(ValueError, match="item -1 failed"):
+            stream_to_sink(submit, items, sink, max_in_flight=2)
+
+    # Dispatching stops at the failure
+    assert len(submitted) < len(items)